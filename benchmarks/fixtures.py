@@ -0,0 +1,311 @@
+"""Synthetic LinkedIn-like HTML used by the offline benchmarks.
+
+The markup mirrors the classes and attributes the scraper and
+experience extractor look for; everything else on a real page is
+approximated with filler chrome so full-page sizes are realistic.
+"""
+
+import json
+import random
+from typing import Dict, List, Optional, Tuple
+
+# Entry counts for the small / medium / large experience pages
+EXPERIENCE_SIZES = {"small": 2, "medium": 8, "large": 25}
+
+SEARCH_LIST_CLASS = "eXOGCNtWZCUfVkYFgXYYeCjJSoAhEDHk"
+SEARCH_ITEM_CLASS = "nrxCTNBwEvLjnjUMRDlltdOsOQfMBkCNfDFxZfpE"
+
+ENTRY_CLASS = (
+    "pvs-list__paged-list-item artdeco-list__item "
+    "pvs-list__item--line-separated pvs-list__item--one-column"
+)
+
+TITLES = [
+    "Senior Security Engineer",
+    "Cyber Security Analyst",
+    "Software Engineer",
+    "Cloud Security Architect",
+    "Penetration Tester",
+    "DevOps Engineer",
+    "Data Scientist",
+    "Network Engineer",
+]
+COMPANIES = [
+    "Acme Technologies",
+    "Globex Solutions",
+    "Initech Systems",
+    "Umbrella Software Ltd",
+    "Hooli Inc",
+    "Stark Industries",
+]
+LOCATIONS = ["Dublin, Ireland", "London, UK", "Remote", "Berlin, Germany"]
+SENTENCES = [
+    "Led threat modelling and secure design reviews for customer-facing payment services.",
+    "Built detection pipelines on AWS GuardDuty, CloudTrail and Splunk for a global SOC.",
+    "Automated vulnerability scanning in CI/CD with Trivy, Semgrep and custom Python tooling.",
+    "Mentored a team of five engineers and ran the internal secure coding programme.",
+    "Responded to incidents end to end, from triage and forensics to post-mortem reports.",
+    "Hardened Kubernetes clusters with OPA policies, network policies and workload identity.",
+]
+
+
+def experience_entry_data(index: int, rng: random.Random, bullets: int = 3) -> Dict:
+    """The facts behind one experience entry, shared by the HTML and JSON fixtures"""
+    return {
+        "title": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "start_year": 2024 - index * 2 - rng.randint(0, 1),
+        "description": " ".join(rng.choice(SENTENCES) for _ in range(2)),
+        "bullets": [rng.choice(SENTENCES) for _ in range(bullets)],
+    }
+
+
+def experience_entry_html(index: int, rng: random.Random, bullets: int = 3) -> str:
+    """One experience list item in LinkedIn's details-page markup"""
+    data = experience_entry_data(index, rng, bullets)
+    title = data["title"]
+    company = data["company"]
+    location = data["location"]
+    start_year = data["start_year"]
+    description = data["description"]
+    bullet_items = "".join(f"<li>{bullet}</li>" for bullet in data["bullets"])
+    return (
+        f'<li class="{ENTRY_CLASS}" '
+        f'id="profilePagedListComponent-ACoAA-EXPERIENCE-VIEW-DETAILS-profile-{index}">'
+        '<div class="display-flex flex-column full-width">'
+        '<div class="display-flex align-items-center mr1 hoverable-link-text t-bold">'
+        f'<span aria-hidden="true">{title}</span>'
+        "</div>"
+        f'<span class="t-14 t-normal"><span aria-hidden="true">{company} · Full-time</span></span>'
+        '<span class="t-14 t-normal t-black--light">'
+        f'<span aria-hidden="true">Jan {start_year} - Dec {start_year + 2} · 2 yrs</span>'
+        "</span>"
+        '<span class="t-14 t-normal t-black--light">'
+        f'<span aria-hidden="true">{location} · Hybrid</span>'
+        "</span>"
+        "</div>"
+        '<div class="pvs-list__outer-container">'
+        f'<div class="display-flex"><span aria-hidden="true">{description}</span></div>'
+        f"<ul>{bullet_items}</ul>"
+        "</div>"
+        "</li>"
+    )
+
+
+def page_chrome_html(rng: random.Random, blocks: int) -> str:
+    """Filler resembling the navigation, scripts and side panels of a real page"""
+    parts = []
+    for i in range(blocks):
+        parts.append(
+            f'<script type="application/json" id="data-{i}">'
+            + '{"k": "' + "x" * rng.randint(2000, 6000) + '"}'
+            + "</script>"
+        )
+        parts.append(
+            f'<aside class="scaffold-layout__aside"><div class="artdeco-card">'
+            + "".join(
+                f'<a class="app-aware-link" href="/feed/{i}/{j}"><span>Suggested {j}</span></a>'
+                for j in range(20)
+            )
+            + "</div></aside>"
+        )
+    return "".join(parts)
+
+
+def experience_page(
+    name: str,
+    entries: int,
+    chrome_blocks: int = 40,
+    seed: int = 0,
+    payload_urls: Optional[List[str]] = None,
+) -> Dict[str, str]:
+    """Full and scoped versions of a synthetic experience details page.
+
+    The scoped version matches what capture_experience_html serializes:
+    the name heading followed by the experience list items. With
+    payload_urls, the full page also fetches those URLs one after another
+    as it loads, the way LinkedIn's pages fetch their profile JSON.
+    """
+    rng = random.Random(seed)
+    name_html = f'<h1 class="text-heading-xlarge">{name}</h1>'
+    entries_html = "".join(experience_entry_html(i, rng) for i in range(entries))
+    fetch_script = (
+        "<script>(async () => { for (const url of "
+        + json.dumps(payload_urls)
+        + ') { await fetch(url, {headers: {"Accept": "application/json"}}); } })();'
+        + "</script>"
+        if payload_urls
+        else ""
+    )
+
+    full = (
+        "<!DOCTYPE html><html><head><title>Experience | LinkedIn</title>"
+        + fetch_script
+        + "<style>" + "body{margin:0}" * 500 + "</style></head><body>"
+        + page_chrome_html(rng, chrome_blocks // 2)
+        + f'<main class="scaffold-layout__main">{name_html}'
+        + f'<section class="artdeco-card"><div class="pvs-list__container"><ul>{entries_html}</ul></div></section>'
+        + "</main>"
+        + page_chrome_html(rng, chrome_blocks - chrome_blocks // 2)
+        + "</body></html>"
+    )
+    scoped = f"<html><body>{name_html}<ul>{entries_html}</ul></body></html>"
+    return {"full": full, "scoped": scoped}
+
+
+PROFILE_TYPE = "com.linkedin.voyager.dash.identity.profile.Profile"
+POSITION_TYPE = "com.linkedin.voyager.dash.identity.profile.Position"
+
+
+def profile_entity(name: str, seed: int, public_identifier: str = "") -> Dict:
+    first_name, _, last_name = name.partition(" ")
+    return {
+        "$type": PROFILE_TYPE,
+        "entityUrn": f"urn:li:fsd_profile:ACoAA{seed}",
+        "publicIdentifier": public_identifier,
+        "firstName": first_name,
+        "lastName": last_name,
+    }
+
+
+def position_entities(entries: int, seed: int) -> List[Dict]:
+    """Position entities with the same facts as experience_page's entries"""
+    rng = random.Random(seed)
+    positions = []
+    for i in range(entries):
+        data = experience_entry_data(i, rng)
+        positions.append(
+            {
+                "$type": POSITION_TYPE,
+                "entityUrn": f"urn:li:fsd_profilePosition:(ACoAA{seed},{i})",
+                "title": data["title"],
+                "companyName": data["company"],
+                "employmentType": {"name": "Full-time"},
+                "locationName": data["location"],
+                "dateRange": {
+                    "start": {"month": 1, "year": data["start_year"]},
+                    "end": {"month": 12, "year": data["start_year"] + 2},
+                },
+                "description": "\n".join(
+                    [data["description"]] + [f"• {b}" for b in data["bullets"]]
+                ),
+            }
+        )
+    return positions
+
+
+def experience_payload(
+    name: str, entries: int, seed: int = 0, public_identifier: str = ""
+) -> Dict:
+    """The profile API payload behind experience_page(name, entries, seed=seed).
+
+    Shaped like LinkedIn's normalized JSON: a Profile entity and one
+    Position entity per entry under "included".
+    """
+    profile = profile_entity(name, seed, public_identifier)
+    return {
+        "data": {
+            "*elements": [profile["entityUrn"]],
+            "paging": {"start": 0, "count": entries, "total": entries},
+        },
+        "included": [profile] + position_entities(entries, seed),
+    }
+
+
+def experience_payload_sequence(
+    name: str, entries: int, seed: int, public_identifier: str, page_size: int = 3
+) -> List[Tuple[str, Dict]]:
+    """(API path, payload) pairs the way a real experience page receives them.
+
+    An unrelated payload comes first, the positions arrive in pages of
+    page_size with a "people also viewed" payload about someone else in
+    between, and the profile itself comes last.
+    """
+    positions = position_entities(entries, seed)
+    other_seed = seed + 1_000_003
+    sequence = [("voyagerFeedBadges", {"data": {"unreadCount": 3}, "included": []})]
+    for start in range(0, max(entries, 1), page_size):
+        page = positions[start : start + page_size]
+        sequence.append(
+            (
+                "identity/dash/profilePositions",
+                {
+                    "data": {
+                        "*elements": [position["entityUrn"] for position in page],
+                        "paging": {"start": start, "count": page_size, "total": entries},
+                    },
+                    "included": page,
+                },
+            )
+        )
+        if start == 0:
+            sequence.append(
+                (
+                    "identity/dash/browsemap",
+                    {
+                        "data": {"paging": {"start": 0, "count": 2, "total": 2}},
+                        "included": [
+                            profile_entity("Someone Else", other_seed, "someone-else")
+                        ]
+                        + position_entities(2, other_seed),
+                    },
+                )
+            )
+    sequence.append(
+        (
+            "identity/dash/profiles",
+            {"data": {}, "included": [profile_entity(name, seed, public_identifier)]},
+        )
+    )
+    return sequence
+
+
+def experience_corpus(sizes: List[int], seed: int = 0) -> List[Dict[str, str]]:
+    """Experience pages with the given entry counts"""
+    return [
+        experience_page(f"Candidate {i}", entries, seed=seed + i)
+        for i, entries in enumerate(sizes)
+    ]
+
+
+def profile_slug(index: int) -> str:
+    return f"candidate-{index:05d}"
+
+
+def search_results_page(
+    base_url: str,
+    page_num: int,
+    per_page: int,
+    total_profiles: int,
+    chrome_blocks: int = 10,
+    seed: int = 0,
+) -> str:
+    """A people-search results page linking to profiles on base_url.
+
+    Profiles are numbered globally, so page N lists profiles
+    (N - 1) * per_page onwards; the Next button is disabled on the last page.
+    """
+    rng = random.Random(seed + page_num)
+    first = (page_num - 1) * per_page
+    indices = range(first, min(first + per_page, total_profiles))
+    items = "".join(
+        f'<li class="{SEARCH_ITEM_CLASS}"><div class="entity-result">'
+        f'<a class="app-aware-link" data-test-app-aware-link href="{base_url}/in/{profile_slug(i)}?miniProfileUrn=urn%3A{i}">'
+        f'<span aria-hidden="true">Candidate {i}</span></a>'
+        f"<div>{rng.choice(TITLES)} · {rng.choice(LOCATIONS)}</div>"
+        "</div></li>"
+        for i in indices
+    )
+    has_next = first + per_page < total_profiles
+    next_button = (
+        '<button aria-label="Next">Next</button>'
+        if has_next
+        else '<button aria-label="Next" disabled>Next</button>'
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Search | LinkedIn</title></head><body>"
+        + page_chrome_html(rng, chrome_blocks)
+        + f'<main><ul class="{SEARCH_LIST_CLASS}">{items}</ul>{next_button}</main>'
+        + "</body></html>"
+    )
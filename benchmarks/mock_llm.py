@@ -0,0 +1,121 @@
+"""Mock litellm provider that answers recruiter prompts after a configurable delay.
+
+Register it with register_mock_llm() and set
+LLM_MODEL_NAME=mock-recruiter/default. Latency comes from the latency_ms
+argument or MOCK_LLM_LATENCY_MS. Streamed replies spread that latency
+evenly over their words, like a model generating tokens.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from typing import Optional
+
+import litellm
+from litellm import CustomLLM
+from litellm.types.utils import GenericStreamingChunk
+
+MOCK_PROVIDER = "mock-recruiter"
+MOCK_MODEL = f"{MOCK_PROVIDER}/default"
+
+CANDIDATE_RE = re.compile(r"=== CANDIDATE (\d+) ===")
+EXPERIENCE_RE = re.compile(r'"""\n(.*?)\n"""', re.DOTALL)
+SHORTLIST_HINT = re.compile(r"security|cyber|penetration", re.IGNORECASE)
+
+
+def _mock_answer(prompt: str) -> str:
+    """Deterministic verdicts: candidates mentioning security work are shortlisted"""
+    candidate_ids = CANDIDATE_RE.findall(prompt)
+    if candidate_ids:
+        blocks = CANDIDATE_RE.split(prompt)[1:]
+        texts = dict(zip(blocks[0::2], blocks[1::2]))
+        return json.dumps(
+            [
+                {
+                    "candidate_id": int(candidate_id),
+                    "recommendation": "SHORTLIST"
+                    if SHORTLIST_HINT.search(texts[candidate_id])
+                    else "REJECT",
+                    "reason": "Mock batch verdict.",
+                }
+                for candidate_id in candidate_ids
+            ]
+        )
+
+    # Only look at the candidate's experience, not the search query
+    experience = EXPERIENCE_RE.search(prompt)
+    text = experience.group(1) if experience else prompt
+    recommendation = "SHORTLIST" if SHORTLIST_HINT.search(text) else "REJECT"
+    return (
+        f"RECOMMENDATION: {recommendation}\n"
+        "REASON: Mock verdict based on keyword match.\n"
+        "NOTES: The candidate's experience was compared against the role's core "
+        "skills, seniority and tenure; see the reason above for the deciding factor."
+    )
+
+
+class MockRecruiterLLM(CustomLLM):
+    def __init__(self, latency_ms: Optional[float] = None):
+        super().__init__()
+        self.latency_ms = (
+            latency_ms
+            if latency_ms is not None
+            else float(os.getenv("MOCK_LLM_LATENCY_MS", "500"))
+        )
+        self.calls = 0
+
+    def _respond(self, messages):
+        self.calls += 1
+        return litellm.completion(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            mock_response=_mock_answer(messages[-1]["content"]),
+        )
+
+    def completion(self, *args, **kwargs):
+        time.sleep(self.latency_ms / 1000)
+        return self._respond(kwargs["messages"])
+
+    async def acompletion(self, *args, **kwargs):
+        await asyncio.sleep(self.latency_ms / 1000)
+        return self._respond(kwargs["messages"])
+
+    def streaming(self, *args, **kwargs):
+        self.calls += 1
+        chunks = list(_stream_chunks(_mock_answer(kwargs["messages"][-1]["content"])))
+        for chunk in chunks:
+            time.sleep(self.latency_ms / 1000 / len(chunks))
+            yield chunk
+
+    async def astreaming(self, *args, **kwargs):
+        self.calls += 1
+        chunks = list(_stream_chunks(_mock_answer(kwargs["messages"][-1]["content"])))
+        for chunk in chunks:
+            await asyncio.sleep(self.latency_ms / 1000 / len(chunks))
+            yield chunk
+
+
+def _stream_chunks(answer: str):
+    words = re.findall(r"\S+\s*", answer)
+    for index, word in enumerate(words):
+        yield GenericStreamingChunk(
+            text=word,
+            tool_use=None,
+            is_finished=index == len(words) - 1,
+            finish_reason="stop" if index == len(words) - 1 else "",
+            usage=None,
+            index=0,
+        )
+
+
+def register_mock_llm(latency_ms: Optional[float] = None) -> MockRecruiterLLM:
+    """Install the mock provider in litellm and return it"""
+    handler = MockRecruiterLLM(latency_ms)
+    litellm.custom_provider_map = [
+        provider
+        for provider in litellm.custom_provider_map
+        if provider.get("provider") != MOCK_PROVIDER
+    ] + [{"provider": MOCK_PROVIDER, "custom_handler": handler}]
+    return handler
@@ -0,0 +1,74 @@
+"""Compare full-page vs scoped capture and parser backends for extraction.
+
+Usage: python benchmarks/parse_benchmark.py [--entries 8] [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fixtures import experience_page  # noqa: E402
+from linkedin_finder.scrapers.experience_extractor import (  # noqa: E402
+    extract_experience_data,
+    parse_html,
+)
+from linkedin_finder.scrapers.linkedin_scraper import extract_name  # noqa: E402
+
+
+def _extract(html: str, backend: str):
+    with contextlib.redirect_stdout(io.StringIO()):
+        soup = parse_html(html, backend)
+        return extract_name(soup), extract_experience_data(soup)
+
+
+def measure(html: str, backend: str, repeat: int):
+    """Mean parse+extract seconds and peak traced memory for one variant"""
+    result = _extract(html, backend)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _extract(html, backend)
+    seconds = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    _extract(html, backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = experience_page("Jane Doe", args.entries)
+    variants = [("full", "html.parser"), ("scoped", "html.parser")]
+    try:
+        parse_html("<p></p>", "lxml")
+        variants += [("full", "lxml"), ("scoped", "lxml")]
+    except ValueError:
+        print("lxml not installed, skipping lxml variants")
+
+    baseline = None
+    print(f"{'variant':<22}{'bytes':>10}{'ms/profile':>12}{'peak KiB':>11}  identical")
+    for capture, backend in variants:
+        html = page[capture]
+        result, seconds, peak = measure(html, backend, args.repeat)
+        if baseline is None:
+            baseline = result
+        print(
+            f"{capture + '/' + backend:<22}{len(html):>10}{seconds * 1000:>12.2f}"
+            f"{peak / 1024:>11.0f}  {result == baseline}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,584 @@
+"""Offline benchmark harness for the scraper, extractor and analyzer.
+
+Runs entirely against local fixtures: synthetic HTML, a stand-in LinkedIn
+server and a mock LLM provider. Reports profiles/sec, latency percentiles
+and peak Python memory per stage, optionally as JSON for regression
+tracking.
+
+The llm-concurrency stage sweeps the number of in-flight LLM requests
+(--concurrency) against the mock provider and reports the speedup over
+one request at a time.
+
+The scrape-workers stage sweeps the scraper's browser worker count
+(--worker-sweep) against the stand-in site, with --page-latency-ms added to
+every response, and reports the speedup over the first count.
+
+The distributed stage runs a coordinator and --workers worker processes
+against the stand-in site through the SQLite work queue, and checks that
+every profile ends up with a verdict.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--stages extract,format,pipeline]
+        [--profiles 20] [--llm-latency-ms 300] [--concurrency 1,4,16]
+        [--worker-sweep 1,2,4] [--page-latency-ms 200] [--json results.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fixtures import EXPERIENCE_SIZES, experience_page, experience_payload  # noqa: E402
+
+STAGES = (
+    "extract",
+    "format",
+    "llm-stream",
+    "llm-concurrency",
+    "scrape-workers",
+    "pipeline",
+    "distributed",
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def throughput(items: int, elapsed: float, peak_bytes: int = 0) -> Dict:
+    """Row for a whole run, which has no per-item latencies to rank"""
+    return {
+        "items": items,
+        "profiles_per_sec": items / elapsed if elapsed else 0.0,
+        "mean_ms": None,
+        "p50_ms": None,
+        "p95_ms": None,
+        "p99_ms": None,
+        "peak_kib": peak_bytes / 1024,
+        "wall_seconds": elapsed,
+    }
+
+
+def summarize(latencies: List[float], peak_bytes: int, items: int) -> Dict:
+    total = sum(latencies)
+    return {
+        "items": items,
+        "profiles_per_sec": items / total if total else 0.0,
+        "mean_ms": statistics.mean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_kib": peak_bytes / 1024,
+    }
+
+
+def time_each(fn: Callable, inputs: List, repeat: int) -> Dict:
+    """Latency of fn over every input, plus peak traced memory of one pass"""
+    latencies = []
+    for _ in range(repeat):
+        for item in inputs:
+            start = time.perf_counter()
+            fn(item)
+            latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    for item in inputs:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return summarize(latencies, peak, len(latencies))
+
+
+def bench_extract(repeat: int) -> Dict[str, Dict]:
+    from linkedin_finder.scrapers.experience_extractor import (
+        extract_experience_data,
+        parse_html,
+    )
+    from linkedin_finder.scrapers.profile_payloads import parse_profile_payloads
+
+    results = {}
+    for size, entries in EXPERIENCE_SIZES.items():
+        for capture in ("full", "scoped"):
+            pages = [
+                experience_page(f"Candidate {i}", entries, seed=i)[capture]
+                for i in range(5)
+            ]
+            results[f"extract/{size}/{capture}"] = time_each(
+                lambda html: extract_experience_data(parse_html(html)), pages, repeat
+            )
+        # The same entries read from the profile API JSON instead of HTML
+        payloads = [
+            json.dumps(experience_payload(f"Candidate {i}", entries, seed=i))
+            for i in range(5)
+        ]
+        results[f"extract/{size}/payload"] = time_each(
+            lambda body: parse_profile_payloads([json.loads(body)]), payloads, repeat
+        )
+    return results
+
+
+def bench_format(repeat: int) -> Dict[str, Dict]:
+    from linkedin_finder.llm.analyzer import format_experience_for_llm
+    from linkedin_finder.scrapers.experience_extractor import (
+        extract_experience_data,
+        parse_html,
+    )
+
+    results = {}
+    for size, entries in EXPERIENCE_SIZES.items():
+        entry_lists = [
+            extract_experience_data(
+                parse_html(experience_page(f"Candidate {i}", entries, seed=i)["scoped"])
+            )
+            for i in range(5)
+        ]
+        results[f"format/{size}"] = time_each(
+            format_experience_for_llm, entry_lists, repeat * 20
+        )
+    return results
+
+
+def bench_llm_stream(profiles: int, llm_latency_ms: float) -> Dict[str, Dict]:
+    """Per-candidate LLM latency with full replies vs streamed, early-stopped ones"""
+    import asyncio
+
+    from mock_llm import MOCK_MODEL, register_mock_llm
+
+    register_mock_llm(llm_latency_ms)
+    os.environ.update({"LLM_MODEL_NAME": MOCK_MODEL, "LLM_CACHE_MODE": "bypass"})
+    from linkedin_finder.instrumentation import metrics
+    from linkedin_finder.llm.analyzer import analyze_candidate_experience_async
+
+    texts = [
+        experience_page(f"Candidate {i}", 3, seed=i)["full"][:2000]
+        for i in range(profiles)
+    ]
+    results = {}
+    enabled = metrics.enabled
+    metrics.enabled = True
+    try:
+        for stream in (False, True):
+            metrics.reset()
+            latencies = []
+            for text in texts:
+                start = time.perf_counter()
+                asyncio.run(
+                    analyze_candidate_experience_async(
+                        text, "Cyber Security Engineer", stream=stream
+                    )
+                )
+                latencies.append(time.perf_counter() - start)
+            results[f"llm/{'stream' if stream else 'full'}"] = summarize(
+                latencies, 0, profiles
+            )
+            if stream:
+                to_verdict = metrics.samples("llm_time_to_verdict")
+                if to_verdict:
+                    results["llm/time_to_verdict"] = summarize(
+                        to_verdict, 0, len(to_verdict)
+                    )
+    finally:
+        metrics.enabled = enabled
+        metrics.reset()
+    return results
+
+
+def bench_llm_concurrency(
+    profiles: int, llm_latency_ms: float, levels: List[int]
+) -> Dict[str, Dict]:
+    """Wall time to analyze every candidate at each concurrency limit"""
+    from mock_llm import MOCK_MODEL, register_mock_llm
+
+    mock = register_mock_llm(llm_latency_ms)
+    os.environ.update({"LLM_MODEL_NAME": MOCK_MODEL, "LLM_CACHE_MODE": "bypass"})
+    from linkedin_finder.llm.concurrent_analyzer import analyze_candidates_concurrently
+
+    texts = [
+        experience_page(f"Candidate {i}", 3, seed=i)["full"][:2000]
+        for i in range(profiles)
+    ]
+    results = {}
+    baseline = None
+    for level in levels:
+        mock.calls = 0
+        start = time.perf_counter()
+        analyses = analyze_candidates_concurrently(
+            texts, "Cyber Security Engineer", max_concurrency=level
+        )
+        elapsed = time.perf_counter() - start
+        failed = [error for _, error in analyses if error is not None]
+        if failed:
+            raise RuntimeError(f"{len(failed)} analyses failed: {failed[0]}")
+
+        baseline = baseline or elapsed
+        summary = throughput(profiles, elapsed)
+        summary["concurrency"] = level
+        summary["speedup"] = baseline / elapsed
+        summary["llm_calls"] = mock.calls
+        results[f"llm_concurrency/{level}"] = summary
+    return results
+
+
+# Per-profile stages timed by the pipeline's own instrumentation
+PIPELINE_STAGES = (
+    "profile_navigation",
+    "page_ready",
+    "html_capture",
+    "html_parse",
+    "extraction",
+    "llm_request",
+)
+
+
+def bench_pipeline(profiles: int, llm_latency_ms: float, workers: int) -> Dict[str, Dict]:
+    from mock_llm import MOCK_MODEL, register_mock_llm
+    from stand_in_server import StandInConfig, StandInServer
+
+    mock = register_mock_llm(llm_latency_ms)
+    work_dir = tempfile.mkdtemp(prefix="linkedin-bench-")
+    auth_file = os.path.join(work_dir, "auth.json")
+    with open(auth_file, "w", encoding="utf-8") as f:
+        json.dump({"cookies": [], "origins": []}, f)
+
+    results = {}
+    with StandInServer(StandInConfig(total_profiles=profiles)) as server:
+        os.environ.update(
+            {
+                "LINKEDIN_BASE_URL": server.base_url,
+                "LINKEDIN_AUTH_FILE": auth_file,
+                "LLM_MODEL_NAME": MOCK_MODEL,
+                "SCRAPER_WORKERS": str(workers),
+                "PAGE_CACHE_MODE": "bypass",
+                "LLM_CACHE_MODE": "bypass",
+                # Measure worker scaling, not the shared 1 req/s navigation
+                # limiter
+                "RATE_LIMIT": "off",
+                "HEADLESS": "1",
+            }
+        )
+        from linkedin_finder.instrumentation import metrics
+        from linkedin_finder.main import scrape_and_shortlist_linkedin
+        from linkedin_finder.scrapers.linkedin_scraper import ScraperSession
+        from linkedin_finder.scrapers.page_waits import get_wait_records
+
+        previous_cwd = os.getcwd()
+        os.chdir(work_dir)
+        # Each run resets the wait records, so collect them after every run
+        wait_records = []
+        enabled = metrics.enabled
+        metrics.enabled = True
+        try:
+            for stream in (False, True):
+                tracemalloc.start()
+                start = time.perf_counter()
+                # A fresh session per mode, so the streaming run doesn't just
+                # reuse the profiles the batch run scraped
+                with ScraperSession() as session:
+                    scrape_and_shortlist_linkedin(
+                        "Cyber Security Engineer",
+                        "Dublin, Ireland",
+                        profiles,
+                        stream=stream,
+                        session=session,
+                    )
+                elapsed = time.perf_counter() - start
+                wait_records.extend(get_wait_records())
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                mode = "stream" if stream else "batch"
+                summary = throughput(profiles, elapsed, peak)
+                summary["llm_calls"] = mock.calls
+                results[f"pipeline/{mode}"] = summary
+                mock.calls = 0
+                # The run resets metrics when it starts, so these samples
+                # are this mode's own
+                for stage in PIPELINE_STAGES:
+                    samples = metrics.samples(stage)
+                    if samples:
+                        results[f"pipeline/{mode}/{stage}"] = summarize(
+                            samples, 0, len(samples)
+                        )
+
+            for label in ("search results", "experience entries"):
+                waits = [r["seconds"] for r in wait_records if r["label"] == label]
+                if waits:
+                    results[f"wait/{label.replace(' ', '_')}"] = summarize(
+                        waits, 0, len(waits)
+                    )
+        finally:
+            metrics.enabled = enabled
+            metrics.reset()
+            os.chdir(previous_cwd)
+    return results
+
+
+def bench_scrape_workers(
+    profiles: int, page_latency_ms: float, levels: List[int]
+) -> Dict[str, Dict]:
+    """Wall time to scrape every profile at each browser worker count"""
+    from stand_in_server import StandInConfig, StandInServer
+
+    work_dir = tempfile.mkdtemp(prefix="linkedin-bench-")
+    auth_file = os.path.join(work_dir, "auth.json")
+    with open(auth_file, "w", encoding="utf-8") as f:
+        json.dump({"cookies": [], "origins": []}, f)
+
+    results = {}
+    config = StandInConfig(total_profiles=profiles, latency_ms=page_latency_ms)
+    with StandInServer(config) as server:
+        os.environ.update(
+            {
+                "LINKEDIN_BASE_URL": server.base_url,
+                "LINKEDIN_AUTH_FILE": auth_file,
+                "PAGE_CACHE_MODE": "bypass",
+                "RATE_LIMIT": "off",
+                "HEADLESS": "1",
+            }
+        )
+        from linkedin_finder.scrapers.linkedin_scraper import (
+            ScraperSession,
+            scrape_linkedin_profiles,
+        )
+
+        previous_cwd = os.getcwd()
+        os.chdir(work_dir)
+        baseline = None
+        try:
+            for level in levels:
+                # Browser startup is left out; only the scrape is timed
+                with ScraperSession(num_workers=level) as session:
+                    start = time.perf_counter()
+                    scraped = scrape_linkedin_profiles(
+                        "Cyber Security Engineer",
+                        "Dublin, Ireland",
+                        profiles,
+                        session=session,
+                    )
+                    elapsed = time.perf_counter() - start
+                if len(scraped) != profiles:
+                    raise RuntimeError(
+                        f"expected {profiles} profiles, got {len(scraped)}"
+                    )
+
+                baseline = baseline or elapsed
+                summary = throughput(profiles, elapsed)
+                summary["workers"] = level
+                summary["speedup"] = baseline / elapsed
+                results[f"scrape/{level}_workers"] = summary
+                page_ready = [
+                    profile["fetch_stats"]["page_ready_seconds"]
+                    for profile in scraped
+                    if profile.get("fetch_stats", {}).get("page_ready_seconds")
+                    is not None
+                ]
+                if page_ready:
+                    results[f"scrape/{level}_workers/page_ready"] = summarize(
+                        page_ready, 0, len(page_ready)
+                    )
+        finally:
+            os.chdir(previous_cwd)
+    return results
+
+
+def _run_distributed_worker(work_dir: str, llm_latency_ms: float, idle_exit: float):
+    """Worker process entry point; the environment is inherited from the parent"""
+    from mock_llm import register_mock_llm
+
+    register_mock_llm(llm_latency_ms)
+    os.chdir(work_dir)
+    from linkedin_finder.distributed import run_worker
+
+    run_worker(idle_exit_seconds=idle_exit)
+
+
+def bench_distributed(
+    profiles: int, llm_latency_ms: float, workers: int
+) -> Dict[str, Dict]:
+    from mock_llm import MOCK_MODEL
+    from stand_in_server import StandInConfig, StandInServer
+
+    work_dir = tempfile.mkdtemp(prefix="linkedin-bench-")
+    auth_file = os.path.join(work_dir, "auth.json")
+    with open(auth_file, "w", encoding="utf-8") as f:
+        json.dump({"cookies": [], "origins": []}, f)
+    results_path = os.path.join(work_dir, "results.jsonl")
+
+    with StandInServer(StandInConfig(total_profiles=profiles)) as server:
+        os.environ.update(
+            {
+                "LINKEDIN_BASE_URL": server.base_url,
+                "LINKEDIN_AUTH_FILE": auth_file,
+                "LLM_MODEL_NAME": MOCK_MODEL,
+                "PAGE_CACHE_MODE": "bypass",
+                "LLM_CACHE_MODE": "bypass",
+                "HEADLESS": "1",
+                "WORK_QUEUE_PATH": os.path.join(work_dir, "work_queue.sqlite3"),
+                "WORK_POLL_SECONDS": "0.2",
+                "RESULTS_BACKEND": "jsonl",
+                "RESULTS_PATH": results_path,
+            }
+        )
+        from linkedin_finder.distributed import run_coordinator
+
+        # Spawned, not forked, so every worker starts its own Playwright
+        spawn = multiprocessing.get_context("spawn")
+        processes = [
+            spawn.Process(
+                target=_run_distributed_worker, args=(work_dir, llm_latency_ms, 5.0)
+            )
+            for _ in range(workers)
+        ]
+        previous_cwd = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            start = time.perf_counter()
+            for process in processes:
+                process.start()
+            counts = run_coordinator(
+                "Cyber Security Engineer", "Dublin, Ireland", profiles
+            )
+            elapsed = time.perf_counter() - start
+            for process in processes:
+                process.join(timeout=60)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            os.chdir(previous_cwd)
+
+    verdicts = counts["shortlisted"] + counts["rejected"]
+    if verdicts != profiles:
+        raise RuntimeError(f"expected {profiles} verdicts, got {verdicts}")
+    with open(results_path, "r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    summary = throughput(profiles, elapsed)
+    summary["workers"] = workers
+    summary["results_written"] = len(records)
+    results = {f"distributed/{workers}_workers": summary}
+    # Worker processes keep their own metrics; the per-profile fetch stats
+    # travel with each result record
+    page_ready = [
+        record["timings"]["page_ready_seconds"]
+        for record in records
+        if record.get("timings", {}).get("page_ready_seconds") is not None
+    ]
+    if page_ready:
+        results[f"distributed/{workers}_workers/page_ready"] = summarize(
+            page_ready, 0, len(page_ready)
+        )
+    return results
+
+
+def print_report(results: Dict[str, Dict]):
+    print(
+        f"\n{'stage':<34}{'n':>6}{'prof/s':>10}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'peak KiB':>10}"
+    )
+    def ms(value) -> str:
+        return "-" if value is None else f"{value:.2f}"
+
+    for name, stats in results.items():
+        print(
+            f"{name:<34}{stats['items']:>6}{stats['profiles_per_sec']:>10.1f}"
+            f"{ms(stats['p50_ms']):>10}{ms(stats['p95_ms']):>10}"
+            f"{ms(stats['p99_ms']):>10}{stats['peak_kib']:>10.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", default="extract,format,pipeline")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument(
+        "--concurrency",
+        default="1,4,16",
+        help="in-flight LLM request limits for the llm-concurrency sweep",
+    )
+    parser.add_argument(
+        "--worker-sweep",
+        default="1,2,4",
+        help="browser worker counts for the scrape-workers sweep",
+    )
+    parser.add_argument(
+        "--page-latency-ms",
+        type=float,
+        default=200.0,
+        help="stand-in server delay per response in the scrape-workers sweep",
+    )
+    parser.add_argument("--json", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    results: Dict[str, Dict] = {}
+    if "extract" in stages:
+        results.update(bench_extract(args.repeat))
+    if "format" in stages:
+        results.update(bench_format(args.repeat))
+    if "llm-stream" in stages:
+        results.update(bench_llm_stream(args.profiles, args.llm_latency_ms))
+    if "llm-concurrency" in stages:
+        levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+        results.update(
+            bench_llm_concurrency(args.profiles, args.llm_latency_ms, levels)
+        )
+    browser_stages = [
+        stage
+        for stage in ("scrape-workers", "pipeline", "distributed")
+        if stage in stages
+    ]
+    if browser_stages:
+        from stand_in_server import browser_unavailable_reason
+
+        # Only a missing browser skips these stages; any other error fails
+        # the run
+        reason = browser_unavailable_reason()
+        if reason:
+            print(
+                f"⚠️ Skipping {', '.join(browser_stages)}: "
+                f"Chromium is not available ({reason})"
+            )
+            browser_stages = []
+    if "scrape-workers" in browser_stages:
+        levels = [int(level) for level in args.worker_sweep.split(",") if level.strip()]
+        results.update(
+            bench_scrape_workers(args.profiles, args.page_latency_ms, levels)
+        )
+    if "pipeline" in browser_stages:
+        results.update(bench_pipeline(args.profiles, args.llm_latency_ms, args.workers))
+    if "distributed" in browser_stages:
+        results.update(
+            bench_distributed(args.profiles, args.llm_latency_ms, args.workers)
+        )
+
+    print_report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Local HTTP stand-in for the parts of LinkedIn the scraper visits.
+
+Serves synthetic people-search pages and experience detail pages from
+fixtures.py, with optional injected latency. Point the scraper at it with
+LINKEDIN_BASE_URL=http://127.0.0.1:<port>.
+
+With --payloads, every experience page also fetches its data as JSON from
+profile API endpoints, for PROFILE_SOURCE=network: an unrelated payload,
+the positions in pages, someone else's profile and finally the profile
+itself.
+
+Usage: python benchmarks/stand_in_server.py [--port 8765] [--profiles 50]
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from fixtures import (
+    EXPERIENCE_SIZES,
+    experience_page,
+    experience_payload_sequence,
+    search_results_page,
+)
+
+PROFILE_RE = re.compile(r"^/in/(?P<slug>[^/]+)/details/experience/?$")
+PAYLOAD_PREFIX = "/voyager/api/"
+
+
+class StandInConfig:
+    def __init__(
+        self,
+        total_profiles: int = 50,
+        per_page: int = 10,
+        latency_ms: float = 0.0,
+        size: Optional[str] = None,
+        payloads: bool = False,
+    ):
+        self.total_profiles = total_profiles
+        self.per_page = per_page
+        self.latency_ms = latency_ms
+        self.size = size
+        self.payloads = payloads
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def entries_for(self, slug: str) -> int:
+        """Experience entry count for a profile, fixed or spread across sizes"""
+        if self.size:
+            return EXPERIENCE_SIZES[self.size]
+        sizes = list(EXPERIENCE_SIZES.values())
+        return sizes[zlib.crc32(slug.encode()) % len(sizes)]
+
+
+def make_handler(config: StandInConfig):
+    class StandInHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: str, content_type: str = "text/html"):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _payload_sequence(self, slug: str):
+            return experience_payload_sequence(
+                slug.replace("-", " ").title(),
+                config.entries_for(slug),
+                seed=zlib.crc32(slug.encode()),
+                public_identifier=slug,
+            )
+
+        def do_GET(self):
+            with config.lock:
+                config.requests += 1
+            if config.latency_ms:
+                time.sleep(config.latency_ms / 1000)
+
+            url = urlparse(self.path)
+            base_url = f"http://{self.headers.get('Host')}"
+
+            if url.path.rstrip("/") == "/search/results/people":
+                page_num = int(parse_qs(url.query).get("page", ["1"])[0])
+                self._send(
+                    200,
+                    search_results_page(
+                        base_url, page_num, config.per_page, config.total_profiles
+                    ),
+                )
+                return
+
+            match = PROFILE_RE.match(url.path)
+            if match:
+                slug = match.group("slug")
+                payload_urls = None
+                if config.payloads:
+                    payload_urls = [
+                        f"{PAYLOAD_PREFIX}{path}?profileSlug={slug}&part={part}"
+                        for part, (path, _) in enumerate(self._payload_sequence(slug))
+                    ]
+                page = experience_page(
+                    slug.replace("-", " ").title(),
+                    config.entries_for(slug),
+                    seed=zlib.crc32(slug.encode()),
+                    payload_urls=payload_urls,
+                )
+                self._send(200, page["full"])
+                return
+
+            if url.path.startswith(PAYLOAD_PREFIX):
+                query = parse_qs(url.query)
+                slug = query.get("profileSlug", [""])[0]
+                part = int(query.get("part", ["0"])[0])
+                sequence = self._payload_sequence(slug) if slug else []
+                if part >= len(sequence):
+                    self._send(404, "{}", "application/json")
+                    return
+                _, payload = sequence[part]
+                self._send(
+                    200,
+                    json.dumps(payload),
+                    "application/vnd.linkedin.normalized+json+2.1",
+                )
+                return
+
+            if url.path in ("/login", "/feed", "/feed/"):
+                self._send(200, "<html><body><h1>Stand-in</h1></body></html>")
+                return
+
+            self._send(404, "<html><body>Not found</body></html>")
+
+    return StandInHandler
+
+
+def browser_unavailable_reason() -> Optional[str]:
+    """Why Playwright's Chromium can't be launched here, or None when it can"""
+    try:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            p.chromium.launch(headless=True).close()
+    except Exception as e:
+        return str(e).strip().splitlines()[0]
+    return None
+
+
+class StandInServer:
+    """Threaded stand-in server that can run in the background of a benchmark"""
+
+    def __init__(self, config: StandInConfig, port: int = 0):
+        self.config = config
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), make_handler(config))
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--profiles", type=int, default=50)
+    parser.add_argument("--per-page", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--size", choices=sorted(EXPERIENCE_SIZES))
+    parser.add_argument(
+        "--payloads", action="store_true", help="serve profile JSON for the pages"
+    )
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        args.profiles, args.per_page, args.latency_ms, args.size, args.payloads
+    )
+    server = StandInServer(config, args.port)
+    print(f"Serving stand-in LinkedIn at {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+# Same as the linkedin-finder command, e.g.
+#   python -m linkedin_finder login
+#   python -m linkedin_finder scrape "Cyber Security Engineer" "Dublin, Ireland" -n 1
+import sys
+
+from linkedin_finder.cli import main
+
+sys.exit(main())
@@ -0,0 +1,91 @@
+import json
+import sys
+from typing import Dict, List
+
+from linkedin_finder.instrumentation import export_metrics, metrics
+from linkedin_finder.main import scrape_and_shortlist_linkedin
+from linkedin_finder.scrapers.linkedin_scraper import ScraperSession
+
+
+def load_jobs(path: str) -> List[Dict]:
+    """Read a job file with one JSON search per line.
+
+    Each line needs "search_query" and "location" and may set
+    "max_profiles" (default 1). Blank lines and lines starting with # are
+    ignored.
+    """
+    jobs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"❌ Invalid job on line {line_num} of {path}: {e}")
+            if not record.get("search_query") or not record.get("location"):
+                raise ValueError(
+                    f"❌ Job on line {line_num} of {path} needs search_query and location"
+                )
+            jobs.append(
+                {
+                    "search_query": record["search_query"],
+                    "location": record["location"],
+                    "max_profiles": int(record.get("max_profiles", 1)),
+                }
+            )
+    return jobs
+
+
+def run_batch(jobs: List[Dict], **options) -> List[Dict]:
+    """Run several searches in one process, sharing browsers and caches.
+
+    One ScraperSession serves every job, so Chromium is launched once and a
+    profile found by several searches is scraped once; only its verdict is
+    recomputed for each search. The page and verdict caches are process-wide
+    already. Extra options are passed to scrape_and_shortlist_linkedin. A
+    failing job is reported and the batch moves on to the next one.
+
+    Metrics cover the whole batch and are exported once at the end.
+    """
+    summary = []
+    metrics.reset()
+    with ScraperSession() as session:
+        for index, job in enumerate(jobs, 1):
+            print(
+                f"\n🗂️ Job {index}/{len(jobs)}: {job['search_query']} in "
+                f"{job['location']} (max {job['max_profiles']})"
+            )
+            try:
+                counts = scrape_and_shortlist_linkedin(
+                    job["search_query"],
+                    job["location"],
+                    job["max_profiles"],
+                    session=session,
+                    export=False,
+                    **options,
+                )
+            except Exception as e:
+                print(f"❌ Job {index} failed: {e}")
+                summary.append({**job, "error": str(e)})
+                continue
+            summary.append({**job, **counts})
+
+        print(f"\n🗂️ BATCH RESULTS ({len(session.profiles)} profiles scraped):")
+        for job in summary:
+            outcome = (
+                f"failed: {job['error']}"
+                if "error" in job
+                else f"✅ {job['shortlisted']} shortlisted, ❌ {job['rejected']} rejected"
+            )
+            print(f"  {job['search_query']} / {job['location']}: {outcome}")
+    export_metrics()
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m linkedin_finder.batch <jobs.jsonl>")
+        sys.exit(1)
+    run_batch(load_jobs(sys.argv[1]))
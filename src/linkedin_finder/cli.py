@@ -0,0 +1,218 @@
+"""Command-line entry point for the LinkedIn candidate finder.
+
+Subcommands import only the modules they use, so `--help`, `login` and
+`cache` start without loading litellm; pass --timings to see how long
+startup and imports took.
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+from typing import List, Optional  # noqa: E402
+
+
+def _report_startup(args: argparse.Namespace, import_seconds: float):
+    if args.timings:
+        print(
+            f"⏱️ {args.command} ready in "
+            f"{(time.perf_counter() - _START) * 1000:.0f} ms "
+            f"({import_seconds * 1000:.0f} ms importing)",
+            file=sys.stderr,
+        )
+
+
+def cmd_login(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    from linkedin_finder.scrapers.linkedin_scraper import save_linkedin_session
+
+    _report_startup(args, time.perf_counter() - start)
+    return 0 if save_linkedin_session(timeout_seconds=args.timeout) else 1
+
+
+def cmd_scrape(args: argparse.Namespace) -> int:
+    if args.workers is not None:
+        os.environ["SCRAPER_WORKERS"] = str(args.workers)
+    start = time.perf_counter()
+    from linkedin_finder.main import scrape_and_shortlist_linkedin
+
+    _report_startup(args, time.perf_counter() - start)
+    scrape_and_shortlist_linkedin(
+        args.query,
+        args.location,
+        args.max_profiles,
+        max_concurrency=args.concurrency,
+        stream=args.stream,
+        batched=args.batched,
+        resume=not args.fresh,
+        results_backend=args.results_backend,
+        compact_prompts=args.compact_prompts or None,
+        prescreen=args.prescreen or None,
+        refresh=args.refresh or None,
+    )
+    return 0
+
+
+def cmd_analyze(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    from linkedin_finder.llm.analyzer import analyze_candidate_experience
+
+    _report_startup(args, time.perf_counter() - start)
+    if args.file == "-":
+        experience_text = sys.stdin.read()
+    else:
+        with open(args.file, "r", encoding="utf-8") as f:
+            experience_text = f.read()
+
+    verdict = analyze_candidate_experience(
+        experience_text, args.query, stream=args.stream or None
+    )
+    print(f"RECOMMENDATION: {verdict.recommendation or 'UNKNOWN'}")
+    print(f"REASON: {verdict.reason}")
+    return 0 if verdict.recommendation else 1
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    from linkedin_finder.batch import load_jobs, run_batch
+
+    _report_startup(args, time.perf_counter() - start)
+    summary = run_batch(load_jobs(args.jobs_file))
+    return 1 if any("error" in job for job in summary) else 0
+
+
+def cmd_benchmark(args: argparse.Namespace) -> int:
+    benchmarks_dir = os.path.join(os.path.dirname(__file__), "..", "..", "benchmarks")
+    if not os.path.isdir(benchmarks_dir):
+        print("❌ Benchmarks are only available from a source checkout")
+        return 1
+    sys.path.insert(0, os.path.abspath(benchmarks_dir))
+    start = time.perf_counter()
+    import run_benchmarks
+
+    _report_startup(args, time.perf_counter() - start)
+    sys.argv = ["run_benchmarks.py", *args.benchmark_args]
+    run_benchmarks.main()
+    return 0
+
+
+def cmd_cache(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    from linkedin_finder.llm.verdict_cache import VerdictCache
+    from linkedin_finder.scrapers.page_cache import ExperiencePageCache
+
+    _report_startup(args, time.perf_counter() - start)
+    caches = {"pages": ExperiencePageCache(), "verdicts": VerdictCache()}
+    for name, cache in caches.items():
+        if args.which not in ("all", name):
+            continue
+        if args.action == "clear":
+            cache.clear()
+            print(f"🧹 Cleared {name} cache")
+        else:
+            usage = cache.usage()
+            print(
+                f"🗄️ {name}: {usage['entries']} entries, "
+                f"{usage['bytes'] / (1024 * 1024):.1f} MiB"
+            )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="linkedin-finder",
+        description="Find and shortlist LinkedIn candidates with an LLM.",
+    )
+    parser.add_argument(
+        "--timings", action="store_true", help="report startup and import time"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    login = commands.add_parser("login", help="log in and save the browser session")
+    login.add_argument(
+        "--timeout", type=float, help="seconds to wait for the login to finish"
+    )
+    login.set_defaults(handler=cmd_login)
+
+    scrape = commands.add_parser("scrape", help="scrape a search and shortlist")
+    scrape.add_argument("query", help="role to search for")
+    scrape.add_argument("location", help="location to search in")
+    scrape.add_argument("-n", "--max-profiles", type=int, default=1)
+    scrape.add_argument("--workers", type=int, help="browser pages scraping at once")
+    scrape.add_argument("--concurrency", type=int, help="LLM requests in flight")
+    mode = scrape.add_mutually_exclusive_group()
+    mode.add_argument("--stream", action="store_true", help="analyze while scraping")
+    mode.add_argument(
+        "--batched", action="store_true", help="several candidates per LLM request"
+    )
+    scrape.add_argument(
+        "--fresh", action="store_true", help="ignore the journal of an earlier run"
+    )
+    scrape.add_argument(
+        "--results-backend", choices=("text", "jsonl", "sqlite"), help="results sink"
+    )
+    scrape.add_argument(
+        "--compact-prompts", action="store_true", help="trim prompts to a token budget"
+    )
+    scrape.add_argument(
+        "--prescreen", action="store_true", help="skip obvious mismatches locally"
+    )
+    scrape.add_argument(
+        "--refresh",
+        action="store_true",
+        help="keep the previous verdict for candidates whose experience is unchanged",
+    )
+    scrape.set_defaults(handler=cmd_scrape)
+
+    analyze = commands.add_parser(
+        "analyze", help="get a verdict for one candidate's experience text"
+    )
+    analyze.add_argument("query", help="role the candidate is evaluated for")
+    analyze.add_argument(
+        "file", nargs="?", default="-", help="experience text file (default stdin)"
+    )
+    analyze.add_argument(
+        "--stream", action="store_true", help="stream the reply and stop early"
+    )
+    analyze.set_defaults(handler=cmd_analyze)
+
+    batch = commands.add_parser("batch", help="run every search in a JSONL job file")
+    batch.add_argument(
+        "jobs_file", help="one {search_query, location, max_profiles} per line"
+    )
+    batch.set_defaults(handler=cmd_batch)
+
+    # Any other arguments are passed on to benchmarks/run_benchmarks.py
+    benchmark = commands.add_parser(
+        "benchmark", help="run the offline benchmarks (extra args are passed on)"
+    )
+    benchmark.set_defaults(handler=cmd_benchmark)
+
+    cache = commands.add_parser("cache", help="inspect or clear the local caches")
+    cache.add_argument("action", choices=("stats", "clear"))
+    cache.add_argument(
+        "which", nargs="?", choices=("all", "pages", "verdicts"), default="all"
+    )
+    cache.set_defaults(handler=cmd_cache)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args, extra_args = parser.parse_known_args(argv)
+    if args.command == "benchmark":
+        args.benchmark_args = extra_args
+    elif extra_args:
+        parser.error(f"unrecognized arguments: {' '.join(extra_args)}")
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
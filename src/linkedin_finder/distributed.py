@@ -0,0 +1,302 @@
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+from dotenv import load_dotenv
+
+from linkedin_finder.journal import make_job_id
+from linkedin_finder.llm.analyzer import (
+    analyze_candidate_experience,
+    format_experience_for_llm,
+)
+from linkedin_finder.results_store import build_result_record, open_results_sink
+from linkedin_finder.scrapers.browser_pool import BrowserPool, SessionExpiredError
+from linkedin_finder.scrapers.frontier import ProfileFrontier
+from linkedin_finder.scrapers.linkedin_scraper import (
+    get_auth_file,
+    get_headless,
+    harvest_search_results,
+    load_cached_profile,
+    scrape_profile,
+)
+from linkedin_finder.scrapers.page_cache import ExperiencePageCache
+from linkedin_finder.scrapers.resource_policy import ResourcePolicy
+from linkedin_finder.work_queue import WorkQueue
+
+load_dotenv()
+
+TASK_KINDS = ("scrape", "analyze")
+
+
+def get_poll_interval() -> float:
+    """Seconds between queue polls when idle, from WORK_POLL_SECONDS"""
+    return float(os.getenv("WORK_POLL_SECONDS", "1"))
+
+
+class _Heartbeat:
+    """Renews a task's lease in the background while the task runs"""
+
+    def __init__(self, queue: WorkQueue, task: Dict, worker_id: str):
+        self.queue = queue
+        self.task = task
+        self.worker_id = worker_id
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        interval = max(0.1, self.queue.lease_seconds / 3)
+        while not self._stop.wait(interval):
+            if not self.queue.heartbeat(self.task["id"], self.worker_id):
+                print(f"⚠️ Lost the lease on {self.task['kind']} {self.task['key']}")
+                return
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_coordinator(
+    search_query: str,
+    location: str,
+    max_profiles: int = 1,
+    queue: Optional[WorkQueue] = None,
+    results_backend: Optional[str] = None,
+    poll_interval: Optional[float] = None,
+) -> Dict[str, int]:
+    """Harvest search results into the work queue and wait for the workers.
+
+    Each new profile becomes a "scrape" task; the worker that scrapes it
+    queues the "analyze" task. The coordinator keeps max_profiles scrape
+    tasks alive, harvesting more links when some fail for good, and saves
+    the verdicts to the results sink once every task has settled. Rerunning
+    it for the same search picks up the tasks already in the queue.
+    """
+    queue = queue or WorkQueue()
+    poll_interval = poll_interval if poll_interval is not None else get_poll_interval()
+    job_id = make_job_id(search_query, location)
+    prefix = f"{job_id}:"
+
+    frontier = ProfileFrontier(
+        task["payload"]["profile_url"] for task in queue.tasks("scrape", prefix)
+    )
+    with BrowserPool(
+        size=1,
+        storage_state=get_auth_file(),
+        headless=get_headless(),
+        resource_policy=ResourcePolicy.from_env(),
+    ) as search_pool:
+        harvest = search_pool.submit(
+            lambda page: harvest_search_results(page, search_query, location, frontier)
+        )
+
+        last_progress = None
+        try:
+            while True:
+                counts = queue.counts(prefix)
+                scrapes = counts.get("scrape", {})
+                analyses = counts.get("analyze", {})
+                scraped = scrapes.get("done", 0)
+                active = scrapes.get("pending", 0) + scrapes.get("leased", 0)
+
+                # Keep max_profiles scrapes alive; failed ones are replaced
+                # from the frontier
+                while scraped + active < max_profiles:
+                    profile_url = frontier.get(block=False)
+                    if profile_url is None:
+                        break
+                    if queue.enqueue(
+                        "scrape",
+                        prefix + profile_url,
+                        {
+                            "profile_url": profile_url,
+                            "search_query": search_query,
+                            "location": location,
+                        },
+                    ):
+                        active += 1
+                frontier.set_demand(max_profiles - scraped - active)
+
+                progress = (
+                    f"🛰️ Job {job_id}: scrape {scraped} done / {active} active / "
+                    f"{scrapes.get('failed', 0)} failed, analyze "
+                    f"{analyses.get('done', 0)} done / "
+                    f"{analyses.get('pending', 0) + analyses.get('leased', 0)} active"
+                )
+                if progress != last_progress:
+                    print(progress)
+                    last_progress = progress
+
+                out_of_links = (
+                    harvest.done() and frontier.stats()["queued"] == 0 and not active
+                )
+                analyses_settled = (
+                    analyses.get("done", 0) + analyses.get("failed", 0) >= scraped
+                )
+                if (scraped >= max_profiles or out_of_links) and analyses_settled:
+                    break
+                time.sleep(poll_interval)
+        finally:
+            frontier.stop()
+
+    shortlisted = rejected = 0
+    with open_results_sink(results_backend) as sink:
+        for task in queue.tasks("analyze", prefix):
+            if task["status"] != "done":
+                continue
+            result = task["result"]
+            if result["is_shortlisted"]:
+                shortlisted += 1
+            else:
+                rejected += 1
+            if result["analysis"] is None:
+                continue
+            sink.write(
+                build_result_record(
+                    task["payload"]["profile"],
+                    result["experience_text"],
+                    result["analysis"],
+                    result["is_shortlisted"],
+                    search_query=search_query,
+                    location=location,
+                )
+            )
+
+    print(f"\n📊 FINAL RESULTS:")
+    print(f"✅ Shortlisted: {shortlisted}")
+    print(f"❌ Rejected: {rejected}")
+    print(f"📁 Results saved to {sink.describe()}")
+    return {"shortlisted": shortlisted, "rejected": rejected}
+
+
+def _scrape_task(
+    task: Dict, queue: WorkQueue, pool: BrowserPool, cache: ExperiencePageCache
+) -> Dict:
+    payload = task["payload"]
+    profile_url = payload["profile_url"]
+    profile = load_cached_profile(cache, profile_url)
+    if profile is None:
+        profile = pool.submit(
+            lambda page: scrape_profile(page, profile_url, cache)
+        ).result()
+    # Queued before the scrape is marked done; a retried scrape is deduped
+    queue.enqueue(
+        "analyze",
+        task["key"],
+        {
+            "profile": profile,
+            "search_query": payload["search_query"],
+            "location": payload["location"],
+        },
+    )
+    return {"name": profile["name"], "entries": len(profile["experience_entries"])}
+
+
+def _analyze_task(task: Dict) -> Dict:
+    payload = task["payload"]
+    entries = payload["profile"]["experience_entries"]
+    experience_text = format_experience_for_llm(entries)
+    if not entries:
+        return {
+            "analysis": None,
+            "experience_text": experience_text,
+            "is_shortlisted": False,
+        }
+
+    verdict = analyze_candidate_experience(experience_text, payload["search_query"])
+    return {
+        "analysis": verdict.raw,
+        "experience_text": experience_text,
+        "is_shortlisted": verdict.is_shortlisted,
+    }
+
+
+def run_worker(
+    queue: Optional[WorkQueue] = None,
+    kinds: Sequence[str] = TASK_KINDS,
+    worker_id: Optional[str] = None,
+    idle_exit_seconds: Optional[float] = None,
+    poll_interval: Optional[float] = None,
+) -> int:
+    """Claim and run tasks until idle for idle_exit_seconds (forever if None).
+
+    A worker launches its own browser from the saved login session the
+    first time it claims a scrape task, so any number of worker processes,
+    on one machine or several sharing the queue file, can run side by side.
+    Returns the number of tasks completed.
+    """
+    queue = queue or WorkQueue()
+    poll_interval = poll_interval if poll_interval is not None else get_poll_interval()
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    pool: Optional[BrowserPool] = None
+    cache = ExperiencePageCache()
+    completed = 0
+
+    print(f"👷 Worker {worker_id} waiting for {', '.join(kinds)} tasks...")
+    idle_since = time.monotonic()
+    try:
+        while True:
+            task = queue.claim(worker_id, kinds)
+            if task is None:
+                if (
+                    idle_exit_seconds is not None
+                    and time.monotonic() - idle_since >= idle_exit_seconds
+                ):
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            print(
+                f"👷 {worker_id}: {task['kind']} {task['key']} "
+                f"(attempt {task['attempt']})"
+            )
+            try:
+                with _Heartbeat(queue, task, worker_id):
+                    if task["kind"] == "scrape":
+                        if pool is None:
+                            pool = BrowserPool(
+                                size=1,
+                                storage_state=get_auth_file(),
+                                headless=get_headless(),
+                                resource_policy=ResourcePolicy.from_env(),
+                            ).start()
+                        result = _scrape_task(task, queue, pool, cache)
+                    else:
+                        result = _analyze_task(task)
+            except Exception as e:
+                print(f"❌ {task['kind']} {task['key']} failed: {e}")
+                queue.fail(task["id"], worker_id, f"{type(e).__name__}: {e}")
+                if isinstance(e, SessionExpiredError):
+                    # Every further scrape would fail the same way
+                    raise
+            else:
+                if queue.complete(task["id"], worker_id, result):
+                    completed += 1
+            idle_since = time.monotonic()
+    finally:
+        if pool is not None:
+            pool.close()
+
+    print(f"👷 Worker {worker_id} finished after {completed} task(s)")
+    return completed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == "coordinator":
+        max_profiles = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+        run_coordinator(sys.argv[2], sys.argv[3], max_profiles)
+    elif len(sys.argv) >= 2 and sys.argv[1] == "worker":
+        run_worker(kinds=sys.argv[2].split(",") if len(sys.argv) > 2 else TASK_KINDS)
+    else:
+        print(
+            "Usage: python -m linkedin_finder.distributed coordinator <query> "
+            "<location> [max_profiles]\n"
+            "       python -m linkedin_finder.distributed worker [scrape,analyze]"
+        )
+        sys.exit(1)
@@ -0,0 +1,222 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+METRIC_PREFIX = "linkedin_finder"
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class _NullTimer:
+    """Timer used when instrumentation is disabled; does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    def __init__(self, metrics: "Metrics", stage: str):
+        self.metrics = metrics
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class Metrics:
+    """Per-stage timers and counters for a run.
+
+    When disabled, timer() returns a shared no-op context manager and
+    observe()/increment() return immediately, so instrumented code pays
+    only an attribute check.
+
+    Without an explicit enabled flag, METRICS_ENABLED is read on first use
+    rather than at construction, so a .env loaded after import still counts.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self._enabled = enabled
+        self._timings: Dict[str, List[float]] = defaultdict(list)
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            flag = os.getenv("METRICS_ENABLED", "").lower()
+            self._enabled = flag in ("1", "true", "yes", "on")
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+
+    def timer(self, stage: str):
+        """Context manager that records the duration of a stage"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self, stage)
+
+    def observe(self, stage: str, seconds: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._timings[stage].append(seconds)
+
+    def increment(self, name: str, value: float = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] += value
+
+    def record_llm_usage(self, response):
+        """Count prompt and completion tokens from a litellm response"""
+        if not self.enabled:
+            return
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        self.record_token_usage(
+            getattr(usage, "prompt_tokens", 0) or 0,
+            getattr(usage, "completion_tokens", 0) or 0,
+        )
+
+    def record_token_usage(self, prompt_tokens: int, completion_tokens: int):
+        if not self.enabled:
+            return
+        self.increment("llm_prompt_tokens", prompt_tokens)
+        self.increment("llm_completion_tokens", completion_tokens)
+
+    def samples(self, stage: str) -> List[float]:
+        """Every duration recorded for a stage, in recording order"""
+        with self._lock:
+            return list(self._timings.get(stage, ()))
+
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+            self.started_at = time.time()
+
+    def summary(self) -> Dict:
+        """Aggregate timings and counters into a JSON-friendly dict"""
+        with self._lock:
+            timings = {stage: sorted(values) for stage, values in self._timings.items()}
+            counters = dict(self._counters)
+
+        stages = {}
+        for stage, values in timings.items():
+            total = sum(values)
+            stages[stage] = {
+                "count": len(values),
+                "total_seconds": total,
+                "mean_seconds": total / len(values),
+                "max_seconds": values[-1],
+                **{f"p{int(q * 100)}_seconds": _quantile(values, q) for q in QUANTILES},
+            }
+
+        elapsed = time.time() - self.started_at
+        scraped = counters.get("profiles_scraped", 0)
+        return {
+            "elapsed_seconds": elapsed,
+            "profiles_per_second": scraped / elapsed if elapsed else 0.0,
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def write_json(self, path: str):
+        _atomic_write(path, json.dumps(self.summary(), indent=2))
+
+    def write_prometheus(self, path: str):
+        """Write the summary in Prometheus textfile-collector format"""
+        summary = self.summary()
+        with self._lock:
+            timings = {stage: sorted(values) for stage, values in self._timings.items()}
+
+        lines = [
+            f"# HELP {METRIC_PREFIX}_stage_seconds Time spent per pipeline stage.",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds summary",
+        ]
+        for stage, values in sorted(timings.items()):
+            for q in QUANTILES:
+                lines.append(
+                    f'{METRIC_PREFIX}_stage_seconds{{stage="{stage}",quantile="{q}"}} '
+                    f"{_quantile(values, q):.6f}"
+                )
+            lines.append(
+                f'{METRIC_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {sum(values):.6f}'
+            )
+            lines.append(
+                f'{METRIC_PREFIX}_stage_seconds_count{{stage="{stage}"}} {len(values)}'
+            )
+
+        for name, value in sorted(summary["counters"].items()):
+            metric = f"{METRIC_PREFIX}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {_format_counter(value)}")
+
+        lines.append(f"# TYPE {METRIC_PREFIX}_run_elapsed_seconds gauge")
+        lines.append(
+            f"{METRIC_PREFIX}_run_elapsed_seconds {summary['elapsed_seconds']:.3f}"
+        )
+        _atomic_write(path, "\n".join(lines) + "\n")
+
+
+def _format_counter(value: float) -> str:
+    # Token counts outgrow %g's six significant digits; keep them exact
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _atomic_write(path: str, content: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+metrics = Metrics()
+
+
+def export_metrics(
+    json_path: Optional[str] = None, prometheus_path: Optional[str] = None
+):
+    """Write the run summary as JSON and a Prometheus textfile, if enabled"""
+    if not metrics.enabled:
+        return
+    json_path = json_path or os.getenv("METRICS_JSON_PATH", "metrics.json")
+    prometheus_path = prometheus_path or os.getenv(
+        "METRICS_PROMETHEUS_PATH", "metrics.prom"
+    )
+    metrics.write_json(json_path)
+    metrics.write_prometheus(prometheus_path)
+    print(f"📈 Metrics written to {json_path} and {prometheus_path}")
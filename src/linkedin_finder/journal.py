@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+def get_journal_dir() -> str:
+    """Directory for job journals, from JOURNAL_DIR (default .cache/journals)"""
+    return os.getenv("JOURNAL_DIR", os.path.join(".cache", "journals"))
+
+
+def make_job_id(search_query: str, location: str) -> str:
+    """Stable identifier for a search, shared by its journal and queued tasks"""
+    return hashlib.sha256(
+        json.dumps([search_query, location]).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+class JobJournal:
+    """Durable, append-only record of one scrape-and-shortlist job.
+
+    Every event is written as a JSON line and fsynced before the caller
+    moves on, so a crashed run can be replayed: the current search page,
+    the profile URLs seen, each scraped profile and each LLM verdict. A job
+    is identified by its search query and location; once a job has been
+    marked complete, the next run with the same search starts afresh.
+    """
+
+    def __init__(
+        self,
+        search_query: str,
+        location: str,
+        directory: Optional[str] = None,
+        resume: bool = True,
+    ):
+        self.search_query = search_query
+        self.location = location
+        self.job_id = make_job_id(search_query, location)
+        directory = directory or get_journal_dir()
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{self.job_id}.jsonl")
+
+        self.current_page = 1
+        self.seen: List[str] = []
+        self._seen_set = set()
+        self.scraped: Dict[str, Dict] = {}
+        self.analyzed: Dict[str, Dict] = {}
+        self.completed = False
+        self._lock = threading.Lock()
+
+        if resume and os.path.exists(self.path):
+            self._replay()
+            if self.completed:
+                self._reset_state()
+                os.remove(self.path)
+            elif self.scraped or self.analyzed:
+                print(
+                    f"♻️ Resuming job {self.job_id} from page {self.current_page}: "
+                    f"{len(self.scraped)} scraped, {len(self.analyzed)} analyzed"
+                )
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._has_torn_tail():
+            # Terminate the partial line so the next event starts cleanly
+            self._file.write("\n")
+            self._file.flush()
+        if os.path.getsize(self.path) == 0:
+            self._append(
+                {"event": "job", "search_query": search_query, "location": location}
+            )
+
+    def _has_torn_tail(self) -> bool:
+        if os.path.getsize(self.path) == 0:
+            return False
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def _reset_state(self):
+        self.current_page = 1
+        self.seen = []
+        self._seen_set = set()
+        self.scraped = {}
+        self.analyzed = {}
+        self.completed = False
+
+    def _replay(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-write; ignore it
+                    continue
+                self._apply(event)
+
+    def _apply(self, event: Dict):
+        kind = event.get("event")
+        if kind == "search_page":
+            self.current_page = event["page"]
+        elif kind == "seen":
+            for url in event["urls"]:
+                if url not in self._seen_set:
+                    self._seen_set.add(url)
+                    self.seen.append(url)
+        elif kind == "scraped":
+            profile = event["profile"]
+            self.scraped[profile["profile_url"]] = profile
+        elif kind == "analyzed":
+            self.analyzed[event["profile_url"]] = {
+                "analysis": event["analysis"],
+                "is_shortlisted": event["is_shortlisted"],
+            }
+        elif kind == "complete":
+            self.completed = True
+
+    def _append(self, event: Dict):
+        event["ts"] = time.time()
+        with self._lock:
+            self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._apply(event)
+
+    def record_search_page(self, page_num: int):
+        if page_num != self.current_page:
+            self._append({"event": "search_page", "page": page_num})
+
+    def record_seen(self, urls: List[str]):
+        new_urls = [url for url in urls if url not in self._seen_set]
+        if new_urls:
+            self._append({"event": "seen", "urls": new_urls})
+
+    def record_scraped(self, profile: Dict):
+        self._append({"event": "scraped", "profile": profile})
+
+    def record_analyzed(self, profile_url: str, analysis: str, is_shortlisted: bool):
+        self._append(
+            {
+                "event": "analyzed",
+                "profile_url": profile_url,
+                "analysis": analysis,
+                "is_shortlisted": is_shortlisted,
+            }
+        )
+
+    def record_complete(self):
+        self._append({"event": "complete"})
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
@@ -0,0 +1,365 @@
+from litellm import acompletion, completion, token_counter
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import os
+import time
+
+from linkedin_finder.instrumentation import metrics
+from linkedin_finder.llm.verdict_cache import VerdictCache, get_verdict_cache
+from linkedin_finder.llm.verdict import Verdict, VerdictStreamParser, parse_verdict
+from linkedin_finder.rate_limiter import (
+    backoff_delay,
+    get_llm_limiter,
+    is_throttle_error,
+)
+
+EXPERIENCE_HEADER = "PROFESSIONAL EXPERIENCE:\n\n"
+
+def format_experience_for_llm(experience_entries: List[Dict]) -> str:
+    """Format experience data for LLM analysis"""
+    if not experience_entries:
+        return "No professional experience information found."
+
+    formatted_text = EXPERIENCE_HEADER
+
+    for i, job in enumerate(experience_entries, 1):
+        formatted_text += f"--- Position {i} ---\n"
+        formatted_text += f"Job Title: {job.get('title', 'Not specified')}\n"
+        formatted_text += f"Company: {job.get('company', 'Not specified')}\n"
+        if job.get("employment_type"):
+            formatted_text += f"Employment Type: {job.get('employment_type')}\n"
+        formatted_text += f"Duration: {job.get('duration', 'Not specified')}\n"
+        if job.get("location"):
+            formatted_text += f"Location: {job.get('location')}\n"
+        formatted_text += f"Description & Responsibilities:\n{job.get('description', 'No description available')}\n\n"
+
+    return formatted_text
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Count prompt tokens for the configured model, estimating when no tokenizer is available"""
+    try:
+        return token_counter(model=model or os.getenv("LLM_MODEL_NAME", ""), text=text)
+    except Exception:
+        return max(1, len(text) // 4)
+
+def get_throttle_retries() -> int:
+    """Retries allowed for rate-limited LLM requests, from LLM_THROTTLE_RETRIES"""
+    return int(os.getenv("LLM_THROTTLE_RETRIES", "5"))
+
+def _retries_for(error: Exception, max_retries: int) -> int:
+    """Rate limits get at least LLM_THROTTLE_RETRIES retries; other errors max_retries"""
+    if is_throttle_error(error):
+        get_llm_limiter().record_throttle()
+        return max(max_retries, get_throttle_retries())
+    return max_retries
+
+def get_streaming_settings() -> Tuple[bool, bool]:
+    """Whether to stream verdicts (LLM_STREAMING) and stop once the REASON
+    line is complete (LLM_STREAM_STOP_AFTER_REASON, default on)"""
+    stream = os.getenv("LLM_STREAMING", "").lower() in ("1", "true", "yes", "on")
+    stop_after_reason = os.getenv("LLM_STREAM_STOP_AFTER_REASON", "on").lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+    return stream, stop_after_reason
+
+def _feed_stream_chunk(
+    parser: VerdictStreamParser, chunk, start: float, stop_after_reason: bool
+) -> bool:
+    """Feed one streamed chunk to the parser; True when generation can stop"""
+    delta = chunk.choices[0].delta.content if chunk.choices else None
+    if not delta:
+        return False
+    had_verdict = parser.recommendation is not None
+    parser.feed(delta)
+    if not had_verdict and parser.recommendation is not None:
+        metrics.observe("llm_time_to_verdict", time.perf_counter() - start)
+    if stop_after_reason and parser.reason_complete:
+        metrics.increment("llm_streams_stopped_early")
+        return True
+    return False
+
+def _record_stream_usage(model: str, messages: List[Dict], text: str, usage):
+    """Record a streamed reply's token usage.
+
+    The provider reports usage in the stream's last chunk, which a stream
+    stopped after the REASON line never reaches; those are counted locally
+    from the prompt and the text received.
+    """
+    if not metrics.enabled:
+        return
+    if usage is not None:
+        metrics.record_token_usage(
+            getattr(usage, "prompt_tokens", 0) or 0,
+            getattr(usage, "completion_tokens", 0) or 0,
+        )
+        return
+    try:
+        prompt_tokens = token_counter(model=model, messages=messages)
+    except Exception:
+        prompt_tokens = sum(len(message["content"]) for message in messages) // 4
+    metrics.record_token_usage(prompt_tokens, count_tokens(text, model))
+    metrics.increment("llm_usage_estimated")
+
+def _stream_completion(
+    model: str, messages: List[Dict], max_tokens: int, stop_after_reason: bool
+) -> str:
+    start = time.perf_counter()
+    response = completion(
+        model=model,
+        messages=messages,
+        temperature=0.3,
+        max_tokens=max_tokens,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    parser = VerdictStreamParser()
+    usage = None
+    try:
+        for chunk in response:
+            usage = getattr(chunk, "usage", None) or usage
+            if _feed_stream_chunk(parser, chunk, start, stop_after_reason):
+                break
+    finally:
+        # Closing the stream early cancels the rest of the generation
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
+    _record_stream_usage(model, messages, parser.text, usage)
+    return parser.text
+
+async def _astream_completion(
+    model: str, messages: List[Dict], max_tokens: int, stop_after_reason: bool
+) -> str:
+    start = time.perf_counter()
+    response = await acompletion(
+        model=model,
+        messages=messages,
+        temperature=0.3,
+        max_tokens=max_tokens,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    parser = VerdictStreamParser()
+    usage = None
+    try:
+        async for chunk in response:
+            usage = getattr(chunk, "usage", None) or usage
+            if _feed_stream_chunk(parser, chunk, start, stop_after_reason):
+                break
+    finally:
+        close = getattr(response, "aclose", None)
+        if close is not None:
+            await close()
+    _record_stream_usage(model, messages, parser.text, usage)
+    return parser.text
+
+def get_model_name() -> str:
+    """Resolve the configured LLM model name"""
+    model = os.getenv("LLM_MODEL_NAME")
+    if not model:
+        raise ValueError("❌ LLM_MODEL_NAME not set. Set the environment variable or pass explicitly.")
+    return model
+
+def _build_messages(experience_text: str, search_query: str) -> List[Dict]:
+    """Build the chat messages for a single candidate evaluation"""
+    prompt = f"""
+You're an expert tech recruiter reviewing a candidate's professional experience for {search_query}.
+
+Analyze the work experience carefully, considering:
+- Actual job titles and progression
+- Company types and reputation
+- Duration of employment (longer tenure indicates stability)
+- Specific technologies, frameworks, and tools mentioned
+- Hands-on development responsibilities vs. academic/theoretical knowledge
+- Career progression and growth
+
+Based on the professional experience below, provide a concise assessment of whether this candidate should be shortlisted for {search_query}. Focus on REAL professional experience, not education or training.
+
+Professional Experience:
+\"\"\"
+{experience_text}
+\"\"\"
+
+Provide your recommendation in this format:
+RECOMMENDATION: [SHORTLIST/REJECT]
+REASON: [Brief justification focusing on relevant experience and professional background]
+"""
+
+    return [
+        {
+            "role": "system",
+            "content": "You are a helpful assistant that evaluates developer resumes.",
+        },
+        {"role": "user", "content": prompt},
+    ]
+
+
+def analyze_candidate_experience(
+    experience_text: str,
+    search_query: str,
+    cache: Optional[VerdictCache] = None,
+    stream: Optional[bool] = None,
+) -> Verdict:
+    """Analyze candidate experience using LLM and return the parsed Verdict.
+
+    With stream (or LLM_STREAMING=1) the reply is streamed and parsed as it
+    arrives, stopping once the REASON line is complete. The reply text is
+    kept in Verdict.raw.
+    """
+    env_stream, stop_after_reason = get_streaming_settings()
+    model = get_model_name()
+    messages = _build_messages(experience_text, search_query)
+
+    cache = cache or get_verdict_cache()
+    cache_key = cache.make_key(model, messages)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        metrics.increment("llm_cache_hits")
+        return parse_verdict(cached)
+
+    analysis = complete_with_retry(
+        model,
+        messages,
+        stream=env_stream if stream is None else stream,
+        stop_after_reason=stop_after_reason,
+    )
+    cache.put(cache_key, model, analysis)
+    return parse_verdict(analysis)
+
+def complete_with_retry(
+    model: str,
+    messages: List[Dict],
+    max_tokens: int = 300,
+    max_retries: int = 2,
+    retry_backoff: float = 1.0,
+    stream: bool = False,
+    stop_after_reason: bool = True,
+) -> str:
+    """Run a completion under the LLM rate limiter, retrying with jittered backoff"""
+    limiter = get_llm_limiter()
+    attempt = 0
+    while True:
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            if stream:
+                content = _stream_completion(
+                    model, messages, max_tokens, stop_after_reason
+                )
+            else:
+                response = completion(
+                    model=model,
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=max_tokens,
+                )
+                metrics.record_llm_usage(response)
+                content = response.choices[0].message.content
+            elapsed = time.perf_counter() - start
+            limiter.record_success(elapsed)
+            metrics.observe("llm_request", elapsed)
+            metrics.increment("llm_requests")
+            return content
+        except Exception as e:
+            metrics.increment("llm_errors")
+            retries = _retries_for(e, max_retries)
+            if attempt >= retries:
+                raise
+            attempt += 1
+            metrics.increment("llm_retries")
+            delay = backoff_delay(attempt, retry_backoff)
+            print(f"🔁 LLM request failed ({type(e).__name__}), retry {attempt}/{retries} in {delay:.1f}s")
+            time.sleep(delay)
+
+async def acomplete_with_retry(
+    model: str,
+    messages: List[Dict],
+    max_tokens: int = 300,
+    timeout: float = 60.0,
+    max_retries: int = 2,
+    retry_backoff: float = 1.0,
+    stream: bool = False,
+    stop_after_reason: bool = True,
+) -> str:
+    """Run an async completion under the LLM rate limiter, with a per-request
+    timeout and jittered exponential-backoff retries"""
+    limiter = get_llm_limiter()
+    attempt = 0
+    while True:
+        await limiter.acquire_async()
+        start = time.perf_counter()
+        try:
+            if stream:
+                content = await asyncio.wait_for(
+                    _astream_completion(model, messages, max_tokens, stop_after_reason),
+                    timeout=timeout,
+                )
+            else:
+                response = await asyncio.wait_for(
+                    acompletion(
+                        model=model,
+                        messages=messages,
+                        temperature=0.3,
+                        max_tokens=max_tokens,
+                    ),
+                    timeout=timeout,
+                )
+                metrics.record_llm_usage(response)
+                content = response.choices[0].message.content
+            elapsed = time.perf_counter() - start
+            limiter.record_success(elapsed)
+            metrics.observe("llm_request", elapsed)
+            metrics.increment("llm_requests")
+            return content
+        except Exception as e:
+            metrics.increment("llm_errors")
+            if isinstance(e, asyncio.TimeoutError):
+                limiter.record_timeout()
+            retries = _retries_for(e, max_retries)
+            if attempt >= retries:
+                raise
+            attempt += 1
+            metrics.increment("llm_retries")
+            delay = backoff_delay(attempt, retry_backoff)
+            print(f"🔁 LLM request failed ({type(e).__name__}), retry {attempt}/{retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+async def analyze_candidate_experience_async(
+    experience_text: str,
+    search_query: str,
+    timeout: float = 60.0,
+    max_retries: int = 2,
+    retry_backoff: float = 1.0,
+    cache: Optional[VerdictCache] = None,
+    stream: Optional[bool] = None,
+) -> Verdict:
+    """Analyze candidate experience using the async LLM client, with a per-request timeout and retries.
+
+    Streams the reply like analyze_candidate_experience when stream (or
+    LLM_STREAMING=1) is set.
+    """
+    env_stream, stop_after_reason = get_streaming_settings()
+    model = get_model_name()
+    messages = _build_messages(experience_text, search_query)
+
+    cache = cache or get_verdict_cache()
+    cache_key = cache.make_key(model, messages)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        metrics.increment("llm_cache_hits")
+        return parse_verdict(cached)
+
+    analysis = await acomplete_with_retry(
+        model,
+        messages,
+        timeout=timeout,
+        max_retries=max_retries,
+        retry_backoff=retry_backoff,
+        stream=env_stream if stream is None else stream,
+        stop_after_reason=stop_after_reason,
+    )
+    cache.put(cache_key, model, analysis)
+    return parse_verdict(analysis)
@@ -0,0 +1,279 @@
+import asyncio
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from linkedin_finder.llm.analyzer import (
+    acomplete_with_retry,
+    analyze_candidate_experience_async,
+    count_tokens,
+    get_model_name,
+)
+from linkedin_finder.instrumentation import metrics
+from linkedin_finder.llm.concurrent_analyzer import (
+    AnalysisResult,
+    get_concurrency_settings,
+)
+from linkedin_finder.llm.verdict import parse_verdict
+from linkedin_finder.llm.verdict_cache import VerdictCache, get_verdict_cache
+
+BATCH_INSTRUCTIONS = """
+You're an expert tech recruiter reviewing several candidates' professional experience for {search_query}.
+
+For EACH candidate, analyze the work experience carefully, considering:
+- Actual job titles and progression
+- Company types and reputation
+- Duration of employment (longer tenure indicates stability)
+- Specific technologies, frameworks, and tools mentioned
+- Hands-on development responsibilities vs. academic/theoretical knowledge
+- Career progression and growth
+
+Decide independently for each candidate whether they should be shortlisted for {search_query}. Focus on REAL professional experience, not education or training.
+
+Respond with ONLY a JSON array, one object per candidate, in this exact shape:
+[{{"candidate_id": <id>, "recommendation": "SHORTLIST" or "REJECT", "reason": "<brief justification>"}}]
+"""
+
+# Output tokens reserved per candidate in a batch response
+TOKENS_PER_VERDICT = 120
+
+
+def get_batch_settings() -> Tuple[int, int]:
+    """Read the batch token budget and candidate cap from the environment"""
+    token_budget = int(os.getenv("LLM_BATCH_TOKEN_BUDGET", "6000"))
+    max_candidates = int(os.getenv("LLM_BATCH_MAX_CANDIDATES", "8"))
+    return token_budget, max(1, max_candidates)
+
+
+def _format_candidate_block(candidate_id: int, experience_text: str) -> str:
+    return f'=== CANDIDATE {candidate_id} ===\n"""\n{experience_text}\n"""\n'
+
+
+def pack_batches(
+    experience_texts: List[str],
+    search_query: str,
+    token_budget: int,
+    max_candidates: int,
+    model: Optional[str] = None,
+) -> List[List[int]]:
+    """Group candidate indices into batches whose prompt fits token_budget.
+
+    A candidate that does not fit a batch on its own still gets a batch of
+    one, so nothing is dropped.
+    """
+    base_tokens = count_tokens(BATCH_INSTRUCTIONS.format(search_query=search_query), model)
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = base_tokens
+    for index, experience_text in enumerate(experience_texts):
+        candidate_tokens = count_tokens(
+            _format_candidate_block(len(current), experience_text), model
+        )
+        if current and (
+            current_tokens + candidate_tokens > token_budget
+            or len(current) >= max_candidates
+        ):
+            batches.append(current)
+            current = []
+            current_tokens = base_tokens
+        current.append(index)
+        current_tokens += candidate_tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _build_batch_messages(experience_texts: List[str], search_query: str) -> List[Dict]:
+    # Candidates are numbered within the batch, so the same batch always
+    # produces the same prompt and cache key
+    prompt = BATCH_INSTRUCTIONS.format(search_query=search_query)
+    prompt += "\nCandidates:\n\n"
+    for candidate_id, experience_text in enumerate(experience_texts):
+        prompt += _format_candidate_block(candidate_id, experience_text) + "\n"
+
+    return [
+        {
+            "role": "system",
+            "content": "You are a helpful assistant that evaluates developer resumes. You always answer with valid JSON.",
+        },
+        {"role": "user", "content": prompt},
+    ]
+
+
+def parse_batch_response(
+    content: str, expected_ids: List[int]
+) -> Optional[Dict[int, str]]:
+    """Parse a batch verdict list into per-candidate analysis strings.
+
+    Each analysis is rendered in the single-candidate
+    "RECOMMENDATION: ... / REASON: ..." format. Returns None when the
+    response is not a JSON list covering exactly the expected candidates,
+    each once, with valid recommendations.
+    """
+    if not content:
+        return None
+
+    # Tolerate markdown fences and chatter around the JSON array
+    text = re.sub(r"```(?:json)?", "", content)
+    start = text.find("[")
+    end = text.rfind("]")
+    if start == -1 or end <= start:
+        return None
+
+    try:
+        verdicts = json.loads(text[start : end + 1])
+    except ValueError:
+        return None
+    if not isinstance(verdicts, list):
+        return None
+
+    analyses: Dict[int, str] = {}
+    for verdict in verdicts:
+        if not isinstance(verdict, dict):
+            return None
+        try:
+            candidate_id = int(verdict.get("candidate_id"))
+        except (TypeError, ValueError):
+            return None
+        if candidate_id in analyses:
+            return None
+        recommendation = str(verdict.get("recommendation", "")).strip().upper()
+        if recommendation not in ("SHORTLIST", "REJECT"):
+            return None
+        reason = str(verdict.get("reason", "")).strip()
+        analyses[candidate_id] = f"RECOMMENDATION: {recommendation}\nREASON: {reason}"
+
+    if set(analyses) != set(expected_ids):
+        return None
+    return analyses
+
+
+async def _analyze_batch(
+    candidates: List[Tuple[int, str]],
+    search_query: str,
+    model: str,
+    timeout: float,
+    max_retries: int,
+) -> Dict[int, AnalysisResult]:
+    """Evaluate one batch, falling back to single-candidate calls on a malformed reply.
+
+    The batch reply is cached under the batch prompt, like any other verdict,
+    so only the same candidates batched together again reuse it.
+    """
+    expected_ids = list(range(len(candidates)))
+
+    analyses = None
+    if len(candidates) > 1:
+        messages = _build_batch_messages([text for _, text in candidates], search_query)
+        cache = get_verdict_cache()
+        cache_key = VerdictCache.make_key(model, messages)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            analyses = parse_batch_response(cached, expected_ids)
+        if analyses is not None:
+            metrics.increment("llm_cache_hits", len(candidates))
+        else:
+            try:
+                content = await acomplete_with_retry(
+                    model,
+                    messages,
+                    max_tokens=TOKENS_PER_VERDICT * len(candidates) + 100,
+                    timeout=timeout,
+                    max_retries=max_retries,
+                )
+                analyses = parse_batch_response(content, expected_ids)
+                if analyses is None:
+                    print(
+                        f"⚠️ Malformed batch response for {len(candidates)} candidates, falling back to single calls"
+                    )
+                else:
+                    cache.put(cache_key, model, content)
+            except Exception as e:
+                print(f"⚠️ Batch request failed ({e}), falling back to single calls")
+
+    results: Dict[int, AnalysisResult] = {}
+    if analyses is not None:
+        for position, (index, _) in enumerate(candidates):
+            results[index] = (parse_verdict(analyses[position]), None)
+        return results
+
+    for index, experience_text in candidates:
+        try:
+            verdict = await analyze_candidate_experience_async(
+                experience_text, search_query, timeout=timeout, max_retries=max_retries
+            )
+            results[index] = (verdict, None)
+        except Exception as e:
+            results[index] = (None, e)
+    return results
+
+
+async def _analyze_batched(
+    experience_texts: List[str],
+    search_query: str,
+    token_budget: int,
+    max_candidates: int,
+    max_concurrency: int,
+    timeout: float,
+    max_retries: int,
+) -> List[AnalysisResult]:
+    model = get_model_name()
+
+    results: List[Optional[AnalysisResult]] = [None] * len(experience_texts)
+    batches = pack_batches(
+        experience_texts, search_query, token_budget, max_candidates, model
+    )
+    print(
+        f"📦 Packed {len(experience_texts)} candidates into {len(batches)} LLM batch request(s)"
+    )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_batch(batch: List[int]) -> Dict[int, AnalysisResult]:
+        async with semaphore:
+            candidates = [(index, experience_texts[index]) for index in batch]
+            return await _analyze_batch(
+                candidates, search_query, model, timeout, max_retries
+            )
+
+    for batch_results in await asyncio.gather(*(run_batch(b) for b in batches)):
+        for index, result in batch_results.items():
+            results[index] = result
+    return results
+
+
+def analyze_candidates_batched(
+    experience_texts: List[str],
+    search_query: str,
+    token_budget: Optional[int] = None,
+    max_candidates: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[AnalysisResult]:
+    """Analyze candidates several per request under a prompt token budget.
+
+    Returns one (verdict, error) tuple per input text, in input order, in
+    the same shape as analyze_candidates_concurrently. Batches whose reply
+    cannot be parsed are re-run one candidate at a time. Unset settings fall
+    back to LLM_BATCH_TOKEN_BUDGET, LLM_BATCH_MAX_CANDIDATES and the
+    concurrency settings.
+    """
+    if not experience_texts:
+        return []
+
+    env_budget, env_max_candidates = get_batch_settings()
+    env_concurrency, timeout, max_retries = get_concurrency_settings()
+
+    return asyncio.run(
+        _analyze_batched(
+            experience_texts,
+            search_query,
+            token_budget or env_budget,
+            max_candidates or env_max_candidates,
+            max_concurrency or env_concurrency,
+            timeout,
+            max_retries,
+        )
+    )
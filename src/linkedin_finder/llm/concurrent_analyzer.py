@@ -0,0 +1,137 @@
+import asyncio
+import os
+import threading
+from collections import deque
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from linkedin_finder.llm.analyzer import analyze_candidate_experience_async
+from linkedin_finder.llm.verdict import Verdict
+
+AnalysisResult = Tuple[Optional[Verdict], Optional[Exception]]
+
+
+def get_concurrency_settings() -> Tuple[int, float, int]:
+    """Read LLM concurrency, timeout and retry settings from the environment"""
+    max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "5"))
+    timeout = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+    max_retries = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    return max(1, max_concurrency), timeout, max(0, max_retries)
+
+
+async def _analyze_all(
+    experience_texts: List[str],
+    search_query: str,
+    max_concurrency: int,
+    timeout: float,
+    max_retries: int,
+) -> List[AnalysisResult]:
+    """Run every analysis with at most max_concurrency requests in flight"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(experience_text: str) -> AnalysisResult:
+        async with semaphore:
+            try:
+                verdict = await analyze_candidate_experience_async(
+                    experience_text,
+                    search_query,
+                    timeout=timeout,
+                    max_retries=max_retries,
+                )
+                return verdict, None
+            except Exception as e:
+                return None, e
+
+    # gather keeps results in input order regardless of completion order
+    return await asyncio.gather(*(run_one(text) for text in experience_texts))
+
+
+def analyze_candidates_concurrently(
+    experience_texts: List[str],
+    search_query: str,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_retries: Optional[int] = None,
+) -> List[AnalysisResult]:
+    """Analyze many candidates concurrently.
+
+    Returns one (verdict, error) tuple per input text, in input order.
+    Unset settings fall back to LLM_MAX_CONCURRENCY, LLM_TIMEOUT_SECONDS
+    and LLM_MAX_RETRIES.
+    """
+    env_concurrency, env_timeout, env_retries = get_concurrency_settings()
+    if not experience_texts:
+        return []
+
+    return asyncio.run(
+        _analyze_all(
+            experience_texts,
+            search_query,
+            max_concurrency or env_concurrency,
+            timeout if timeout is not None else env_timeout,
+            max_retries if max_retries is not None else env_retries,
+        )
+    )
+
+
+def stream_candidate_analyses(
+    items: Iterable[Tuple[Any, str]],
+    search_query: str,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_retries: Optional[int] = None,
+) -> Iterator[Tuple[Any, str, Optional[Verdict], Optional[Exception]]]:
+    """Analyze (item, experience_text) pairs as the producer yields them.
+
+    Requests run on a background event loop while the producer keeps
+    working. At most max_concurrency requests are outstanding: when the
+    window is full the producer is not pulled again until the oldest result
+    has been yielded, which gives backpressure and keeps results in input
+    order. Yields (item, experience_text, verdict, error).
+    """
+    env_concurrency, env_timeout, env_retries = get_concurrency_settings()
+    max_concurrency = max_concurrency or env_concurrency
+    timeout = timeout if timeout is not None else env_timeout
+    max_retries = max_retries if max_retries is not None else env_retries
+
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(
+        target=loop.run_forever, name="llm-event-loop", daemon=True
+    )
+    loop_thread.start()
+
+    pending = deque()
+
+    def resolve(entry):
+        item, experience_text, future = entry
+        try:
+            return item, experience_text, future.result(), None
+        except Exception as e:
+            return item, experience_text, None, e
+
+    try:
+        for item, experience_text in items:
+            future = asyncio.run_coroutine_threadsafe(
+                analyze_candidate_experience_async(
+                    experience_text,
+                    search_query,
+                    timeout=timeout,
+                    max_retries=max_retries,
+                ),
+                loop,
+            )
+            pending.append((item, experience_text, future))
+
+            # Hand back finished results early; block on the oldest once full
+            while pending and (
+                pending[0][2].done() or len(pending) >= max_concurrency
+            ):
+                yield resolve(pending.popleft())
+
+        while pending:
+            yield resolve(pending.popleft())
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.close()
@@ -0,0 +1,139 @@
+import os
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+WORD_RE = re.compile(r"[a-z0-9+#]+")
+YEARS_RE = re.compile(r"(\d+)\s*(?:yrs?|years?)\b", re.IGNORECASE)
+MONTHS_RE = re.compile(r"(\d+)\s*(?:mos?|months?)\b", re.IGNORECASE)
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is of on or the to with our we "
+    "job title company duration location description responsibilities position "
+    "professional experience employment type specified".split()
+)
+
+# Ten years of tenure counts as a full tenure score
+FULL_TENURE_MONTHS = 120
+
+# TF-IDF similarities of relevant candidates are small in absolute terms
+# (typically 0.02-0.2), so the default cutoff only drops candidates that
+# share next to nothing with the search query
+DEFAULT_MIN_SCORE = 0.01
+
+
+def get_prescreen_settings() -> Dict:
+    """Read pre-screen cutoffs and weights from the environment.
+
+    PRESCREEN_MIN_SCORE defaults to DEFAULT_MIN_SCORE; PRESCREEN_TOP_K is
+    unset by default.
+    """
+    top_k = os.getenv("PRESCREEN_TOP_K")
+    return {
+        "top_k": int(top_k) if top_k else None,
+        "min_score": float(os.getenv("PRESCREEN_MIN_SCORE") or DEFAULT_MIN_SCORE),
+        "tenure_weight": float(os.getenv("PRESCREEN_TENURE_WEIGHT", "0.2")),
+    }
+
+
+def parse_tenure_months(duration: str) -> int:
+    """Months of tenure from a LinkedIn duration such as 'Jan 2020 - Present · 4 yrs 2 mos'"""
+    if not duration:
+        return 0
+    # The span after the last '·' is the computed length
+    length = duration.split("·")[-1]
+    years = YEARS_RE.search(length)
+    months = MONTHS_RE.search(length)
+    return (int(years.group(1)) * 12 if years else 0) + (
+        int(months.group(1)) if months else 0
+    )
+
+
+def _tokenize(text: str) -> List[str]:
+    return [t for t in WORD_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def tfidf_similarity(documents: List[str], query: str) -> np.ndarray:
+    """Cosine similarity of each document to the query over batch TF-IDF vectors"""
+    tokenized = [_tokenize(document) for document in documents]
+    query_tokens = _tokenize(query)
+
+    vocabulary: Dict[str, int] = {}
+    for tokens in tokenized + [query_tokens]:
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    if not vocabulary:
+        return np.zeros(len(documents))
+
+    counts = np.zeros((len(documents) + 1, len(vocabulary)), dtype=np.float64)
+    for row, tokens in enumerate(tokenized + [query_tokens]):
+        np.add.at(counts[row], [vocabulary[t] for t in tokens], 1.0)
+
+    # Smoothed IDF over the candidate documents only
+    document_frequency = (counts[:-1] > 0).sum(axis=0)
+    idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1.0
+    weights = np.log1p(counts) * idf
+
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    weights /= norms
+    return weights[:-1] @ weights[-1]
+
+
+def prescreen_candidates(
+    experience_texts: List[str],
+    experience_entries: List[List[Dict]],
+    search_query: str,
+    top_k: Optional[int] = None,
+    min_score: Optional[float] = None,
+    tenure_weight: Optional[float] = None,
+) -> List[Dict]:
+    """Score every candidate locally and mark which ones should reach the LLM.
+
+    The score is the TF-IDF similarity between each formatted experience
+    and the search query (computed across the whole batch), weighted by
+    total tenure parsed from each position's duration. Candidates below
+    min_score (DEFAULT_MIN_SCORE unless configured) are skipped, and at
+    most top_k of the rest are kept. Returns one dict per input, in input
+    order.
+    """
+    settings = get_prescreen_settings()
+    top_k = top_k if top_k is not None else settings["top_k"]
+    min_score = min_score if min_score is not None else settings["min_score"]
+    if tenure_weight is None:
+        tenure_weight = settings["tenure_weight"]
+
+    if not experience_texts:
+        return []
+
+    similarity = tfidf_similarity(experience_texts, search_query)
+    tenure_months = np.array(
+        [
+            sum(parse_tenure_months(job.get("duration", "")) for job in entries)
+            for entries in experience_entries
+        ],
+        dtype=np.float64,
+    )
+    tenure_score = np.minimum(tenure_months / FULL_TENURE_MONTHS, 1.0)
+    # Tenure scales relevance rather than adding to it, so long tenure in an
+    # unrelated field cannot lift a candidate above a relevant one
+    scores = similarity * ((1 - tenure_weight) + tenure_weight * tenure_score)
+
+    selected = np.ones(len(scores), dtype=bool)
+    if min_score is not None:
+        selected &= scores >= min_score
+    if top_k is not None:
+        ranked = [i for i in np.argsort(-scores, kind="stable") if selected[i]]
+        keep = np.zeros(len(scores), dtype=bool)
+        keep[ranked[: max(0, top_k)]] = True
+        selected &= keep
+
+    return [
+        {
+            "score": float(scores[i]),
+            "similarity": float(similarity[i]),
+            "tenure_months": int(tenure_months[i]),
+            "selected": bool(selected[i]),
+        }
+        for i in range(len(scores))
+    ]
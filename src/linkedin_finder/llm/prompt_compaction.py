@@ -0,0 +1,138 @@
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from linkedin_finder.llm.analyzer import (
+    EXPERIENCE_HEADER,
+    count_tokens,
+    format_experience_for_llm,
+)
+
+NO_DESCRIPTION = "No detailed description provided"
+OMITTED_DESCRIPTION = "[omitted for brevity]"
+
+# Description fragments that carry no information about the candidate
+BOILERPLATE_RE = re.compile(
+    r"^(?:…\s*)?(?:see more|see less|show all.*|show more|no detailed description provided"
+    r"|no description available)$",
+    re.IGNORECASE,
+)
+WORD_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def get_prompt_token_budget() -> int:
+    """Token budget for compacted experience text, from PROMPT_TOKEN_BUDGET"""
+    return int(os.getenv("PROMPT_TOKEN_BUDGET", "1500"))
+
+
+def _normalize(part: str) -> str:
+    return " ".join(part.lstrip("•").split()).lower()
+
+
+def _clean_descriptions(experience_entries: List[Dict]) -> List[Dict]:
+    """Copy entries, dropping boilerplate and bullets already seen in any position.
+
+    A position left with no description says so plainly; OMITTED_DESCRIPTION
+    is reserved for descriptions cut to fit the token budget.
+    """
+    seen = set()
+    cleaned = []
+    for job in experience_entries:
+        parts = []
+        for part in (job.get("description") or "").split("\n\n"):
+            part = part.strip()
+            key = _normalize(part)
+            if not key or BOILERPLATE_RE.match(key) or key in seen:
+                continue
+            seen.add(key)
+            parts.append(part)
+        job = dict(job)
+        job["_parts"] = parts
+        job["description"] = "\n\n".join(parts) if parts else NO_DESCRIPTION
+        cleaned.append(job)
+    return cleaned
+
+
+def _relevance(job: Dict, query_terms: set) -> int:
+    text = f"{job.get('title', '')} {job.get('description', '')}".lower()
+    return len(query_terms & set(WORD_RE.findall(text)))
+
+
+def _render(entries: List[Dict]) -> str:
+    return format_experience_for_llm(
+        [{k: v for k, v in job.items() if k != "_parts"} for job in entries]
+    )
+
+
+def compact_experience_for_llm(
+    experience_entries: List[Dict],
+    search_query: str = "",
+    token_budget: Optional[int] = None,
+    model: Optional[str] = None,
+) -> Tuple[str, Dict]:
+    """Format experience for the LLM within a token budget.
+
+    Boilerplate and duplicate description bullets are always removed. While
+    the text is still over budget, description bullets are trimmed from the
+    least relevant positions first (fewest search-query terms, then oldest),
+    and once no descriptions are left, whole positions are dropped the same
+    way. The most relevant position is always kept.
+
+    Returns the text and a stats dict with full and compact token counts.
+    """
+    token_budget = token_budget or get_prompt_token_budget()
+    full_text = format_experience_for_llm(experience_entries)
+    full_tokens = count_tokens(full_text, model)
+
+    if not experience_entries:
+        stats = {"full_tokens": full_tokens, "compact_tokens": full_tokens}
+        stats.update(tokens_saved=0, positions_dropped=0)
+        return full_text, stats
+
+    query_terms = {t for t in WORD_RE.findall(search_query.lower()) if len(t) > 2}
+    entries = _clean_descriptions(experience_entries)
+    text = _render(entries)
+    tokens = count_tokens(text, model)
+
+    # LinkedIn lists positions newest first, so a higher index is older
+    def priority(indexed_job):
+        index, job = indexed_job
+        return (_relevance(job, query_terms), -index)
+
+    # Track the token count as parts are removed, and only re-render and
+    # recount the whole text once the running count fits the budget
+    header_tokens = count_tokens(EXPERIENCE_HEADER, model)
+    omitted_tokens = count_tokens(OMITTED_DESCRIPTION, model)
+    positions_dropped = 0
+    while tokens > token_budget:
+        estimate = tokens
+        trimmed = False
+        while estimate > token_budget:
+            trimmable = [(i, job) for i, job in enumerate(entries) if job["_parts"]]
+            if trimmable:
+                _, job = min(trimmable, key=priority)
+                estimate -= count_tokens(job["_parts"].pop(), model)
+                if job["_parts"]:
+                    job["description"] = "\n\n".join(job["_parts"])
+                else:
+                    job["description"] = OMITTED_DESCRIPTION
+                    estimate += omitted_tokens
+            elif len(entries) > 1:
+                index, _ = min(enumerate(entries), key=priority)
+                estimate -= count_tokens(_render([entries.pop(index)]), model)
+                estimate += header_tokens
+                positions_dropped += 1
+            else:
+                break
+            trimmed = True
+        if not trimmed:
+            break
+        text = _render(entries)
+        tokens = count_tokens(text, model)
+
+    return text, {
+        "full_tokens": full_tokens,
+        "compact_tokens": tokens,
+        "tokens_saved": max(0, full_tokens - tokens),
+        "positions_dropped": positions_dropped,
+    }
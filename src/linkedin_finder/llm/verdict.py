@@ -0,0 +1,83 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Tolerates markdown emphasis and the brackets from the prompt's template,
+# e.g. "**RECOMMENDATION:** [SHORTLIST]"
+RECOMMENDATION_RE = re.compile(
+    r"^[\s*#_-]*RECOMMENDATION[\s*_]*:[\s*_\[]*(SHORTLIST|REJECT)(?:ED)?\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+REASON_RE = re.compile(r"^[\s*#_-]*REASON[\s*_]*:[\s*_]*", re.IGNORECASE | re.MULTILINE)
+# Only another field of the reply format ends the reason, so reason lines
+# such as "AWS: 5 years" or "CISSP: certified" are kept
+NEXT_FIELD_RE = re.compile(
+    r"^[\s*#_-]*(?:RECOMMENDATION|REASON)[\s*_]*:", re.IGNORECASE | re.MULTILINE
+)
+
+
+@dataclass
+class Verdict:
+    """Structured outcome of one candidate evaluation.
+
+    recommendation is "SHORTLIST", "REJECT" or None when the reply had no
+    recognizable RECOMMENDATION line; raw is the reply text as received.
+    """
+
+    recommendation: Optional[str]
+    reason: str
+    raw: str
+
+    @property
+    def is_shortlisted(self) -> bool:
+        return self.recommendation == "SHORTLIST"
+
+
+def parse_verdict(text: str) -> Verdict:
+    """Parse an LLM reply in the RECOMMENDATION/REASON format.
+
+    Only an explicit RECOMMENDATION line counts, so prose such as "would
+    not shortlist" in the reason can't flip the decision.
+    """
+    match = RECOMMENDATION_RE.search(text)
+    recommendation = match.group(1).upper() if match else None
+    reason_match = REASON_RE.search(text)
+    reason = ""
+    if reason_match:
+        reason = text[reason_match.end() :]
+        next_field = NEXT_FIELD_RE.search(reason)
+        if next_field:
+            reason = reason[: next_field.start()]
+        reason = reason.strip()
+    return Verdict(recommendation, reason, text)
+
+
+class VerdictStreamParser:
+    """Incrementally parses a streamed reply as chunks arrive.
+
+    recommendation is set as soon as the RECOMMENDATION line has named its
+    verdict, and reason_complete once the REASON line has been finished by
+    a newline, so a caller can stop generation there.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.recommendation: Optional[str] = None
+        self.reason_complete = False
+
+    def feed(self, chunk: str):
+        self.text += chunk
+        if self.recommendation is None:
+            match = RECOMMENDATION_RE.search(self.text)
+            # Only accept the word once something follows it, in case it is
+            # still streaming in
+            if match and match.end() < len(self.text):
+                self.recommendation = match.group(1).upper()
+        if self.recommendation is not None and not self.reason_complete:
+            reason_match = REASON_RE.search(self.text)
+            if reason_match:
+                # Done once some reason text has been followed by a newline
+                self.reason_complete = "\n" in self.text[reason_match.end() :].lstrip()
+
+    def verdict(self) -> Verdict:
+        return parse_verdict(self.text)
@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+
+class VerdictCache:
+    """Persistent memoization of LLM verdicts.
+
+    Verdicts are keyed by a hash of the model and the exact prompt messages,
+    so any change to the experience text, search query or prompt wording
+    produces a new key. Lookups are served from an in-process dict first and
+    a SQLite table second. Entries expire after the TTL, and the least
+    recently used rows are evicted once the table exceeds max_entries.
+
+    Modes: "use" reads and writes, "refresh" skips reads but stores new
+    verdicts, "bypass" neither reads nor writes.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        mode: Optional[str] = None,
+    ):
+        self.path = path or os.getenv(
+            "LLM_CACHE_PATH", os.path.join(".cache", "llm_verdicts.sqlite3")
+        )
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else float(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+        )
+        self.mode = mode or os.getenv("LLM_CACHE_MODE", "use")
+        if self.mode not in CACHE_MODES:
+            raise ValueError(
+                f"❌ Unknown LLM cache mode '{self.mode}'. Use one of {CACHE_MODES}."
+            )
+
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._puts_since_evict = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict]) -> str:
+        """Hash the model and prompt messages into a cache key"""
+        payload = json.dumps([model, messages], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS verdicts (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    analysis TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached analysis for key, or None on a miss"""
+        if self.mode != "use":
+            return None
+
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None and now - cached[1] <= self.ttl_seconds:
+                self.hits += 1
+                return cached[0]
+
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT analysis, created_at FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            conn.execute("UPDATE verdicts SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self._memory[key] = (row[0], row[1])
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, model: str, analysis: str):
+        """Store an analysis under key"""
+        if self.mode == "bypass":
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, model, analysis, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, analysis, now, now),
+            )
+            conn.commit()
+            self._memory[key] = (analysis, now)
+
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= 100:
+                self._puts_since_evict = 0
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop expired rows and trim the table to max_entries by last use"""
+        conn.execute(
+            "DELETE FROM verdicts WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        conn.execute(
+            "DELETE FROM verdicts WHERE key NOT IN "
+            "(SELECT key FROM verdicts ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+        conn.commit()
+        if len(self._memory) > self.max_entries:
+            self._memory.clear()
+
+    def usage(self) -> Dict:
+        """Number of stored verdicts and the size of the database file"""
+        with self._lock:
+            if self._conn is None and not os.path.exists(self.path):
+                # Don't create an empty database just to report on it
+                return {"entries": 0, "bytes": 0}
+            conn = self._connect()
+            entries = conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        return {"entries": entries, "bytes": os.path.getsize(self.path)}
+
+    def clear(self):
+        """Delete every stored verdict"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is None and not os.path.exists(self.path):
+                return
+            conn = self._connect()
+            conn.execute("DELETE FROM verdicts")
+            conn.commit()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this cache instance"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "mode": self.mode}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[VerdictCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_verdict_cache() -> VerdictCache:
+    """Return the process-wide verdict cache configured from LLM_CACHE_*"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = VerdictCache()
+        return _default_cache
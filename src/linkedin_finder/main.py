@@ -0,0 +1,419 @@
+import logging
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from dotenv import load_dotenv
+from linkedin_finder.scrapers.linkedin_scraper import (
+    ScraperSession,
+    get_scraper_session,
+    iter_linkedin_profiles,
+    save_linkedin_session,
+    scrape_linkedin_profiles,
+)
+from linkedin_finder.scrapers.experience_extractor import extract_experience_data
+from linkedin_finder.instrumentation import export_metrics, metrics
+from linkedin_finder.journal import JobJournal
+from linkedin_finder.rate_limiter import print_rate_limit_summary
+from linkedin_finder.refresh_store import RefreshStore, fingerprint_entries
+from linkedin_finder.results_store import (
+    ResultsSink,
+    build_result_record,
+    open_results_sink,
+)
+from linkedin_finder.llm.analyzer import format_experience_for_llm
+from linkedin_finder.llm.batch_analyzer import analyze_candidates_batched
+from linkedin_finder.llm.prescreen import prescreen_candidates
+from linkedin_finder.llm.verdict import Verdict
+from linkedin_finder.llm.prompt_compaction import (
+    compact_experience_for_llm,
+    get_prompt_token_budget,
+)
+from linkedin_finder.llm.concurrent_analyzer import (
+    analyze_candidates_concurrently,
+    stream_candidate_analyses,
+)
+
+load_dotenv()
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s"
+)
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in ("1", "true", "yes", "on")
+
+
+def _prompt_mode(compact_prompts: bool, batched: bool) -> str:
+    """Label for how candidates are prompted; verdicts differ between modes"""
+    mode = f"compact:{get_prompt_token_budget()}" if compact_prompts else "full"
+    return f"{mode}+batched" if batched else mode
+
+
+def _carry_forward(
+    profile: Dict,
+    stored: Dict,
+    counts: Dict[str, int],
+    journal: JobJournal,
+    sink: ResultsSink,
+):
+    """Record a profile's previous verdict again without asking the LLM"""
+    sink.write(
+        build_result_record(
+            profile,
+            stored["experience_text"],
+            stored["analysis"],
+            stored["is_shortlisted"],
+            search_query=journal.search_query,
+            location=journal.location,
+            model=stored["model"],
+        )
+    )
+    verdict = "shortlisted" if stored["is_shortlisted"] else "rejected"
+    counts[verdict] += 1
+    counts["unchanged"] += 1
+    metrics.increment("profiles_unchanged")
+    print(
+        f"⏩ {profile['name']} unchanged since "
+        f"{time.strftime('%Y-%m-%d', time.localtime(stored['updated_at']))}, "
+        f"keeping verdict ({verdict})"
+    )
+
+
+def _prepare_profiles(
+    profiles: Iterable[Dict],
+    counts: Dict[str, int],
+    journal: JobJournal,
+    compact_prompts: bool = False,
+    refresh_store: Optional[RefreshStore] = None,
+    sink: Optional[ResultsSink] = None,
+) -> Iterator[Tuple[Dict, str]]:
+    """Format each profile for the LLM, yielding only those with experience data.
+
+    Profiles whose verdict is already in the journal are counted and skipped.
+    With compact_prompts, experience text is compacted to the prompt token
+    budget. With a refresh_store, profiles whose stored verdict is still
+    current (same experience fingerprint, model and prompt mode) have it
+    written to sink and are not yielded.
+    """
+    for profile in profiles:
+        name = profile["name"]
+        previous = journal.analyzed.get(profile["profile_url"])
+        if previous is not None:
+            verdict = "shortlisted" if previous["is_shortlisted"] else "rejected"
+            print(f"♻️ {name} already analyzed in this job ({verdict}), skipping")
+            counts[verdict] += 1
+            continue
+
+        if refresh_store is not None and profile["experience_entries"]:
+            stored = refresh_store.get(profile["profile_url"])
+            if stored is not None and refresh_store.is_current(
+                stored, profile["experience_entries"]
+            ):
+                _carry_forward(profile, stored, counts, journal, sink)
+                continue
+            counts["rescored"] += 1
+            metrics.increment("profiles_rescored")
+            if stored is None:
+                change = "is new since the last run"
+            elif stored["fingerprint"] != fingerprint_entries(
+                profile["experience_entries"]
+            ):
+                change = "has changed since the last run"
+            else:
+                change = "was scored with another model or prompt mode"
+            print(f"🔁 {name} {change}, re-scoring")
+
+        print(f"\n👤 Preparing {name}...")
+
+        with metrics.timer("llm_formatting"):
+            if compact_prompts:
+                experience_text, compaction = compact_experience_for_llm(
+                    profile["experience_entries"], journal.search_query
+                )
+            else:
+                experience_text = format_experience_for_llm(
+                    profile["experience_entries"]
+                )
+        if compact_prompts:
+            metrics.increment("prompt_tokens_saved", compaction["tokens_saved"])
+            print(
+                f"✂️ Compacted prompt for {name}: {compaction['full_tokens']} → "
+                f"{compaction['compact_tokens']} tokens "
+                f"({compaction['tokens_saved']} saved, "
+                f"{compaction['positions_dropped']} positions dropped)"
+            )
+
+        print("📋 Extracted Experience Profile:")
+        print(
+            experience_text[:500] + "..."
+            if len(experience_text) > 500
+            else experience_text
+        )
+        print("\n" + "=" * 50)
+
+        if profile["experience_entries"]:
+            print(f"🧠 Queueing {name} for LLM analysis...")
+            yield profile, experience_text
+        else:
+            print(f"⚠️ No experience data found for {name}")
+            counts["rejected"] += 1
+
+
+def _record_analysis(
+    profile: Dict,
+    experience_text: str,
+    verdict: Optional[Verdict],
+    error: Optional[Exception],
+    counts: Dict[str, int],
+    journal: JobJournal,
+    sink: ResultsSink,
+):
+    """Save an analyzed candidate and update the shortlist counters"""
+    name = profile["name"]
+    if error is not None:
+        print(f"⚠️ Error analyzing {name}: {error}")
+        metrics.increment("candidates_failed")
+        return
+
+    print(f"\n📊 LLM Analysis for {name}: {verdict.raw}")
+
+    is_shortlisted = verdict.is_shortlisted
+    sink.write(
+        build_result_record(
+            profile,
+            experience_text,
+            verdict.raw,
+            is_shortlisted,
+            search_query=journal.search_query,
+            location=journal.location,
+        )
+    )
+    metrics.increment(
+        "candidates_shortlisted" if is_shortlisted else "candidates_rejected"
+    )
+    if is_shortlisted:
+        counts["shortlisted"] += 1
+        print(f"✅ SHORTLISTED: {name}")
+    else:
+        counts["rejected"] += 1
+        print(f"❌ REJECTED: {name}")
+
+
+def _apply_prescreen(
+    to_analyze: List[Tuple[Dict, str]],
+    counts: Dict[str, int],
+    journal: JobJournal,
+    sink: ResultsSink,
+) -> List[Tuple[Dict, str]]:
+    """Score candidates locally, record the skipped ones and return the rest"""
+    scores = prescreen_candidates(
+        [experience_text for _, experience_text in to_analyze],
+        [profile["experience_entries"] for profile, _ in to_analyze],
+        journal.search_query,
+    )
+
+    kept = []
+    for (profile, experience_text), score in zip(to_analyze, scores):
+        if score["selected"]:
+            kept.append((profile, experience_text))
+            continue
+
+        analysis = (
+            "RECOMMENDATION: REJECT\n"
+            f"REASON: Skipped by local pre-screen (score {score['score']:.3f}, "
+            f"similarity {score['similarity']:.3f}, "
+            f"tenure {score['tenure_months']} months)"
+        )
+        sink.write(
+            build_result_record(
+                profile,
+                experience_text,
+                analysis,
+                False,
+                search_query=journal.search_query,
+                location=journal.location,
+                model="prescreen",
+            )
+        )
+        counts["rejected"] += 1
+        metrics.increment("candidates_prescreened_out")
+        print(f"⏭️ Pre-screen skipped {profile['name']} (score {score['score']:.3f})")
+
+    print(
+        f"🔎 Pre-screen kept {len(kept)} of {len(to_analyze)} candidates for the LLM"
+    )
+    return kept
+
+
+def scrape_and_shortlist_linkedin(
+    search_query: str,
+    location: str,
+    max_profiles: int = 1,
+    max_concurrency: Optional[int] = None,
+    stream: bool = False,
+    batched: bool = False,
+    resume: bool = True,
+    results_backend: Optional[str] = None,
+    compact_prompts: Optional[bool] = None,
+    prescreen: Optional[bool] = None,
+    refresh: Optional[bool] = None,
+    session: Optional[ScraperSession] = None,
+    export: bool = True,
+) -> Dict[str, int]:
+    """Main function to scrape LinkedIn and analyze candidates.
+
+    With stream=True each profile is sent to the LLM as soon as it has been
+    scraped, and results are saved as they arrive, so scraping and analysis
+    overlap instead of running one after the other.
+
+    With batched=True several candidates are evaluated per LLM request.
+
+    Progress is journaled, so an interrupted run of the same search resumes
+    where it stopped without re-scraping or re-analyzing finished
+    candidates; pass resume=False to start over.
+
+    Results go to the sink chosen by results_backend or RESULTS_BACKEND:
+    text (the shortlisted/rejected files), jsonl or sqlite.
+
+    compact_prompts (or PROMPT_COMPACTION=1) trims each candidate's
+    experience text to PROMPT_TOKEN_BUDGET tokens before analysis.
+
+    prescreen (or PRESCREEN=1) ranks the whole batch locally first and only
+    sends candidates passing PRESCREEN_MIN_SCORE (by default, those sharing
+    anything with the search query) and PRESCREEN_TOP_K to the LLM; the
+    rest are recorded as rejected with their score.
+
+    refresh (or REFRESH=1) is for standing searches: every verdict is
+    stored with a fingerprint of the candidate's experience, and on later
+    runs a candidate whose fingerprint hasn't changed keeps its previous
+    verdict instead of being re-scored, as long as the model and prompt
+    mode are the same. The counts then also include
+    "unchanged" and "rescored".
+
+    Browsers come from the process-wide scraper session unless a started
+    ScraperSession is passed, so later searches in the same process reuse
+    them and the profiles they scraped. Returns the shortlisted and
+    rejected counts.
+
+    Metrics are reset at the start and exported at the end of the run;
+    with export=False they are left to the caller, which can then cover
+    several runs with one export.
+    """
+    if prescreen is None:
+        prescreen = _env_flag("PRESCREEN")
+    if compact_prompts is None:
+        compact_prompts = _env_flag("PROMPT_COMPACTION")
+    if refresh is None:
+        refresh = _env_flag("REFRESH")
+    if stream and batched:
+        raise ValueError("❌ stream and batched modes cannot be combined.")
+    if stream and prescreen:
+        raise ValueError(
+            "❌ Pre-screening ranks the whole batch and cannot be used in stream mode."
+        )
+
+    counts = {"shortlisted": 0, "rejected": 0}
+    refresh_store = None
+    if refresh:
+        counts.update(unchanged=0, rescored=0)
+        refresh_store = RefreshStore(
+            search_query, location, prompt_mode=_prompt_mode(compact_prompts, batched)
+        )
+    if export:
+        metrics.reset()
+    session = session or get_scraper_session()
+    journal = JobJournal(search_query, location, resume=resume)
+    sink = open_results_sink(results_backend)
+
+    # Only journal a verdict once its result has actually been written
+    def on_flush(records: List[Dict]):
+        for record in records:
+            journal.record_analyzed(
+                record["profile_url"], record["analysis"], record["is_shortlisted"]
+            )
+        if refresh_store is not None:
+            # Pre-screen verdicts depend on the rest of the batch, so they
+            # are not carried forward
+            refresh_store.record(
+                [record for record in records if record["model"] != "prescreen"]
+            )
+
+    sink.on_flush = on_flush
+
+    try:
+        if stream:
+            prepared = _prepare_profiles(
+                iter_linkedin_profiles(
+                    search_query,
+                    location,
+                    max_profiles,
+                    journal=journal,
+                    session=session,
+                ),
+                counts,
+                journal,
+                compact_prompts,
+                refresh_store,
+                sink,
+            )
+            for profile, experience_text, verdict, error in stream_candidate_analyses(
+                prepared, search_query, max_concurrency=max_concurrency
+            ):
+                _record_analysis(
+                    profile, experience_text, verdict, error, counts, journal, sink
+                )
+        else:
+            profiles_data = scrape_linkedin_profiles(
+                search_query, location, max_profiles, journal=journal, session=session
+            )
+            to_analyze = list(
+                _prepare_profiles(
+                    profiles_data,
+                    counts,
+                    journal,
+                    compact_prompts,
+                    refresh_store,
+                    sink,
+                )
+            )
+            if prescreen and to_analyze:
+                to_analyze = _apply_prescreen(to_analyze, counts, journal, sink)
+
+            analyze = (
+                analyze_candidates_batched
+                if batched
+                else analyze_candidates_concurrently
+            )
+            results = analyze(
+                [experience_text for _, experience_text in to_analyze],
+                search_query,
+                max_concurrency=max_concurrency,
+            )
+            for (profile, experience_text), (verdict, error) in zip(
+                to_analyze, results
+            ):
+                _record_analysis(
+                    profile, experience_text, verdict, error, counts, journal, sink
+                )
+
+        sink.flush()
+        journal.record_complete()
+    finally:
+        sink.close()
+        journal.close()
+        if refresh_store is not None:
+            refresh_store.close()
+
+    print(f"\n📊 FINAL RESULTS:")
+    print(f"✅ Shortlisted: {counts['shortlisted']}")
+    print(f"❌ Rejected: {counts['rejected']}")
+    if refresh:
+        print(
+            f"🔁 Refresh: {counts['unchanged']} unchanged (verdict carried forward), "
+            f"{counts['rescored']} re-scored"
+        )
+    print(f"📁 Results saved to {sink.describe()}")
+    print_rate_limit_summary()
+    if export:
+        export_metrics()
+    return counts
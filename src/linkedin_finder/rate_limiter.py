@@ -0,0 +1,209 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from linkedin_finder.instrumentation import metrics
+
+# Status codes that mean "slow down": LinkedIn answers throttled requests
+# with 999 as well as the standard 429
+THROTTLE_STATUS_CODES = (429, 999)
+
+
+def backoff_delay(attempt: int, base: float, cap: float = 60.0) -> float:
+    """Full-jitter exponential backoff for the given retry attempt (1-based)"""
+    return random.uniform(0, min(cap, base * (2 ** max(0, attempt - 1))))
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """Whether an exception is a rate-limit response (e.g. litellm's RateLimitError)"""
+    status = getattr(error, "status_code", None)
+    return status in THROTTLE_STATUS_CODES or type(error).__name__ == "RateLimitError"
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to how the remote side is coping.
+
+    Every request takes a token; tokens refill at the current rate up to
+    burst. The rate follows AIMD: each fast success adds `increase`
+    requests/second (up to max_rate), while a throttle response or a reply
+    slower than slow_seconds multiplies it by `decrease` (down to min_rate).
+    Decreases are spaced at least one request interval apart, so a burst of
+    errors from requests already in flight only counts once.
+
+    Safe to share between threads, and between threads and asyncio code.
+    clock (time.monotonic by default) can be replaced to drive the bucket
+    from a fake clock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: float = 1.0,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease: float = 0.5,
+        slow_seconds: Optional[float] = None,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.increase = increase if increase is not None else rate / 10
+        self.decrease = decrease
+        self.slow_seconds = slow_seconds
+        self.enabled = enabled
+        self.clock = clock
+
+        self.throttled = 0
+        self.slow = 0
+        self.waited_seconds = 0.0
+        self._tokens = self.burst
+        self._updated = clock()
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(
+        cls, name: str, prefix: str, rate: float, burst: float, slow_seconds: float
+    ) -> "AdaptiveRateLimiter":
+        """Configure from <prefix>_RATE_PER_SEC, _BURST, _MIN_RATE, _MAX_RATE and
+        _SLOW_SECONDS; RATE_LIMIT=off disables every limiter"""
+        rate = float(os.getenv(f"{prefix}_RATE_PER_SEC", str(rate)))
+        return cls(
+            name,
+            rate,
+            burst=float(os.getenv(f"{prefix}_BURST", str(burst))),
+            min_rate=_env_float(f"{prefix}_MIN_RATE"),
+            max_rate=_env_float(f"{prefix}_MAX_RATE"),
+            slow_seconds=float(
+                os.getenv(f"{prefix}_SLOW_SECONDS", str(slow_seconds))
+            ),
+            enabled=os.getenv("RATE_LIMIT", "on").lower()
+            not in ("0", "off", "false"),
+        )
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it"""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        if not self.enabled:
+            return
+        delay = self._reserve()
+        if delay > 0:
+            self.waited_seconds += delay
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request may be sent"""
+        if not self.enabled:
+            return
+        delay = self._reserve()
+        if delay > 0:
+            self.waited_seconds += delay
+            await asyncio.sleep(delay)
+
+    def record_success(self, seconds: float):
+        """Additively raise the rate after a fast reply; back off after a slow one"""
+        if self.slow_seconds is not None and seconds > self.slow_seconds:
+            self.slow += 1
+            self._decrease("slow")
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_timeout(self):
+        """Treat a request that timed out like a slow reply"""
+        self.slow += 1
+        self._decrease("timed out")
+
+    def record_throttle(self):
+        """Multiplicatively cut the rate after a throttle response"""
+        self.throttled += 1
+        metrics.increment(f"{self.name}_throttled")
+        self._decrease("throttled")
+
+    def _decrease(self, reason: str):
+        with self._lock:
+            now = self.clock()
+            if now - self._last_decrease < 1 / self.rate:
+                return
+            self._last_decrease = now
+            previous = self.rate
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+        print(f"🐢 {self.name} {reason}: rate {previous:.2f} → {self.rate:.2f} req/s")
+
+    def stats(self) -> Dict:
+        return {
+            "rate": self.rate,
+            "throttled": self.throttled,
+            "slow": self.slow,
+            "waited_seconds": self.waited_seconds,
+        }
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_navigation_limiter() -> AdaptiveRateLimiter:
+    """Process-wide limiter for LinkedIn page navigations, from NAV_*.
+
+    Every browser page in the process shares this one bucket: the search
+    harvester and all SCRAPER_WORKERS profile workers together make at most
+    NAV_RATE_PER_SEC navigations per second (1 by default, adapting up to
+    NAV_MAX_RATE). Extra workers therefore only help while pages spend
+    longer rendering than waiting for a token; to scale navigations with
+    the worker count, raise NAV_RATE_PER_SEC and NAV_MAX_RATE accordingly.
+    Separate worker processes (distributed mode) each have their own bucket.
+    """
+    with _limiters_lock:
+        if "navigation" not in _limiters:
+            _limiters["navigation"] = AdaptiveRateLimiter.from_env(
+                "navigation", "NAV", rate=1.0, burst=1, slow_seconds=10.0
+            )
+        return _limiters["navigation"]
+
+
+def print_rate_limit_summary():
+    """Print how each limiter that was used ended up"""
+    for limiter in list(_limiters.values()):
+        stats = limiter.stats()
+        print(
+            f"🚦 {limiter.name} rate limiter: {stats['rate']:.2f} req/s, "
+            f"{stats['throttled']} throttled, {stats['slow']} slow, "
+            f"waited {stats['waited_seconds']:.1f}s"
+        )
+
+
+def get_llm_limiter() -> AdaptiveRateLimiter:
+    """Process-wide limiter for LLM requests, from LLM_*"""
+    with _limiters_lock:
+        if "llm" not in _limiters:
+            _limiters["llm"] = AdaptiveRateLimiter.from_env(
+                "llm", "LLM", rate=5.0, burst=5, slow_seconds=30.0
+            )
+        return _limiters["llm"]
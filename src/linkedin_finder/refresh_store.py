@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from linkedin_finder.journal import make_job_id
+
+FINGERPRINT_FIELDS = (
+    "title",
+    "company",
+    "employment_type",
+    "duration",
+    "location",
+    "description",
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(value: str) -> str:
+    return _WHITESPACE_RE.sub(" ", value or "").strip().lower()
+
+
+def fingerprint_entries(experience_entries: List[Dict]) -> str:
+    """Hash the facts of a profile's experience entries.
+
+    Case and whitespace are ignored, and so is the tenure LinkedIn prints
+    after the date range ("Jan 2020 - Present · 4 yrs 2 mos"), which changes
+    every month for a current role without anything else changing.
+    """
+    normalized = []
+    for entry in experience_entries:
+        fields = {field: _normalize(entry.get(field, "")) for field in FINGERPRINT_FIELDS}
+        fields["duration"] = fields["duration"].split("·")[0].strip()
+        normalized.append(fields)
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RefreshStore:
+    """Last verdict for each profile of a standing search, with its fingerprint.
+
+    A refresh run compares a profile's experience fingerprint with the one
+    stored here and carries the stored verdict forward when they match, so
+    only new or changed profiles are sent to the LLM. Rows are keyed by
+    search and profile URL, since a verdict only holds for the search it
+    was made for, and a verdict is only reused under the model and prompt
+    mode that produced it.
+    """
+
+    def __init__(
+        self,
+        search_query: str,
+        location: str,
+        path: Optional[str] = None,
+        model: Optional[str] = None,
+        prompt_mode: str = "",
+    ):
+        self.path = path or os.getenv(
+            "REFRESH_STORE_PATH", os.path.join(".cache", "refresh.sqlite3")
+        )
+        self.job_id = make_job_id(search_query, location)
+        self.model = model if model is not None else os.getenv("LLM_MODEL_NAME", "")
+        self.prompt_mode = prompt_mode
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS profile_verdicts (
+                    job_id TEXT NOT NULL,
+                    profile_url TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    experience_text TEXT NOT NULL,
+                    analysis TEXT NOT NULL,
+                    is_shortlisted INTEGER NOT NULL,
+                    model TEXT NOT NULL,
+                    prompt_mode TEXT NOT NULL DEFAULT '',
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, profile_url)
+                )
+                """
+            )
+            columns = {
+                row[1]
+                for row in self._conn.execute("PRAGMA table_info(profile_verdicts)")
+            }
+            if "prompt_mode" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE profile_verdicts "
+                    "ADD COLUMN prompt_mode TEXT NOT NULL DEFAULT ''"
+                )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, profile_url: str) -> Optional[Dict]:
+        """Return the stored verdict for a profile in this search, or None"""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT fingerprint, experience_text, analysis, is_shortlisted, "
+                    "model, prompt_mode, updated_at FROM profile_verdicts "
+                    "WHERE job_id = ? AND profile_url = ?",
+                    (self.job_id, profile_url),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return {
+            "fingerprint": row[0],
+            "experience_text": row[1],
+            "analysis": row[2],
+            "is_shortlisted": bool(row[3]),
+            "model": row[4],
+            "prompt_mode": row[5],
+            "updated_at": row[6],
+        }
+
+    def is_current(self, stored: Dict, experience_entries: List[Dict]) -> bool:
+        """Whether a stored verdict still holds for these experience entries"""
+        return (
+            stored["fingerprint"] == fingerprint_entries(experience_entries)
+            and stored["model"] == self.model
+            and stored["prompt_mode"] == self.prompt_mode
+        )
+
+    def record(self, records: List[Dict]):
+        """Store the verdicts from a batch of result records.
+
+        A verdict that is the same as the stored one (e.g. carried forward)
+        keeps its original updated_at, so it still dates the last scoring.
+        """
+        rows = [
+            (
+                self.job_id,
+                record["profile_url"],
+                fingerprint_entries(record["experience_entries"]),
+                record["experience_text"],
+                record["analysis"],
+                int(record["is_shortlisted"]),
+                record["model"],
+                self.prompt_mode,
+                time.time(),
+            )
+            for record in records
+        ]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT INTO profile_verdicts (job_id, profile_url, fingerprint, "
+                "experience_text, analysis, is_shortlisted, model, prompt_mode, "
+                "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (job_id, profile_url) DO UPDATE SET "
+                "updated_at = CASE WHEN fingerprint = excluded.fingerprint "
+                "AND analysis = excluded.analysis AND model = excluded.model "
+                "AND prompt_mode = excluded.prompt_mode THEN updated_at "
+                "ELSE excluded.updated_at END, "
+                "fingerprint = excluded.fingerprint, "
+                "experience_text = excluded.experience_text, "
+                "analysis = excluded.analysis, "
+                "is_shortlisted = excluded.is_shortlisted, "
+                "model = excluded.model, prompt_mode = excluded.prompt_mode",
+                rows,
+            )
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,236 @@
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import time
+from typing import Callable, Dict, List, Optional
+
+from linkedin_finder.llm.verdict import parse_verdict
+
+RESULTS_BACKENDS = ("text", "jsonl", "sqlite")
+
+
+def build_result_record(
+    profile: Dict,
+    experience_text: str,
+    analysis: str,
+    is_shortlisted: bool,
+    search_query: str = "",
+    location: str = "",
+    model: Optional[str] = None,
+) -> Dict:
+    """Structured record for one analyzed candidate"""
+    return {
+        "search_query": search_query,
+        "location": location,
+        "name": profile["name"],
+        "profile_url": profile["profile_url"],
+        "experience_url": profile["experience_url"],
+        "experience_entries": profile.get("experience_entries", []),
+        "experience_text": experience_text,
+        "verdict": "SHORTLIST" if is_shortlisted else "REJECT",
+        "is_shortlisted": is_shortlisted,
+        "reason": parse_verdict(analysis or "").reason,
+        "analysis": analysis,
+        "model": model if model is not None else os.getenv("LLM_MODEL_NAME", ""),
+        "timings": profile.get("fetch_stats", {}),
+        "created_at": time.time(),
+    }
+
+
+class ResultsSink(ABC):
+    """Buffered destination for candidate result records.
+
+    Records are collected in memory and written batch_size at a time, so a
+    run costs one open/commit per batch rather than per candidate. Call
+    close() (or use as a context manager) to flush the tail. on_flush, if
+    set, is called with each batch once it has been written.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None):
+        self.batch_size = batch_size or int(os.getenv("RESULTS_BATCH_SIZE", "25"))
+        self._buffer: List[Dict] = []
+        self.written = 0
+        self.on_flush: Optional[Callable[[List[Dict]], None]] = None
+
+    def write(self, record: Dict):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._write_batch(batch)
+            self.written += len(batch)
+            if self.on_flush is not None:
+                self.on_flush(batch)
+
+    def close(self):
+        self.flush()
+
+    @abstractmethod
+    def describe(self) -> str:
+        """Where results end up, for the end-of-run summary"""
+
+    @abstractmethod
+    def _write_batch(self, records: List[Dict]):
+        """Write one batch of records to the destination"""
+
+    def __enter__(self) -> "ResultsSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class TextResultsSink(ResultsSink):
+    """The original human-readable shortlisted/rejected text files"""
+
+    def __init__(
+        self,
+        shortlisted_path: str = "shortlisted_candidates.txt",
+        rejected_path: str = "rejected_candidates.txt",
+        batch_size: Optional[int] = None,
+    ):
+        super().__init__(batch_size)
+        self.shortlisted_path = shortlisted_path
+        self.rejected_path = rejected_path
+
+    def describe(self) -> str:
+        return f"{self.shortlisted_path} and {self.rejected_path}"
+
+    def _write_batch(self, records: List[Dict]):
+        for is_shortlisted, path in (
+            (True, self.shortlisted_path),
+            (False, self.rejected_path),
+        ):
+            batch = [r for r in records if r["is_shortlisted"] == is_shortlisted]
+            if not batch:
+                continue
+            with open(path, "a", encoding="utf-8") as f:
+                for record in batch:
+                    f.write(f"Name: {record['name']}\n")
+                    f.write(f"LinkedIn Profile: {record['profile_url']}\n")
+                    f.write(f"Experience Page: {record['experience_url']}\n")
+                    if is_shortlisted:
+                        f.write(f"Experience Summary:\n{record['experience_text']}\n")
+                    f.write(f"Analysis: {record['analysis']}\n")
+                    f.write("-" * 80 + "\n\n")
+
+
+class JsonlResultsSink(ResultsSink):
+    """One JSON object per candidate, appended to a single file"""
+
+    def __init__(self, path: str = "results.jsonl", batch_size: Optional[int] = None):
+        super().__init__(batch_size)
+        self.path = path
+
+    def describe(self) -> str:
+        return self.path
+
+    def _write_batch(self, records: List[Dict]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(
+                "".join(
+                    json.dumps(record, ensure_ascii=False) + "\n" for record in records
+                )
+            )
+
+
+class SqliteResultsSink(ResultsSink):
+    """Results table indexed by profile URL and search query"""
+
+    COLUMNS = (
+        "search_query",
+        "location",
+        "name",
+        "profile_url",
+        "experience_url",
+        "experience_entries",
+        "experience_text",
+        "verdict",
+        "is_shortlisted",
+        "reason",
+        "analysis",
+        "model",
+        "timings",
+        "created_at",
+    )
+
+    def __init__(self, path: str = "results.sqlite3", batch_size: Optional[int] = None):
+        super().__init__(batch_size)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                search_query TEXT NOT NULL,
+                location TEXT NOT NULL,
+                name TEXT,
+                profile_url TEXT NOT NULL,
+                experience_url TEXT,
+                experience_entries TEXT,
+                experience_text TEXT,
+                verdict TEXT NOT NULL,
+                is_shortlisted INTEGER NOT NULL,
+                reason TEXT,
+                analysis TEXT,
+                model TEXT,
+                timings TEXT,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_profile_url ON results (profile_url)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_query ON results (search_query, location)"
+        )
+        self._conn.commit()
+
+    def describe(self) -> str:
+        return f"{self.path} (table results)"
+
+    def _write_batch(self, records: List[Dict]):
+        rows = []
+        for record in records:
+            row = dict(record)
+            row["experience_entries"] = json.dumps(row["experience_entries"])
+            row["timings"] = json.dumps(row["timings"])
+            row["is_shortlisted"] = int(row["is_shortlisted"])
+            rows.append(tuple(row[column] for column in self.COLUMNS))
+
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO results ({', '.join(self.COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in self.COLUMNS)})",
+                rows,
+            )
+
+    def close(self):
+        super().close()
+        self._conn.close()
+
+
+def open_results_sink(
+    backend: Optional[str] = None, path: Optional[str] = None
+) -> ResultsSink:
+    """Create the sink selected by backend or RESULTS_BACKEND (default text).
+
+    path (or RESULTS_PATH) overrides the output file for the jsonl and
+    sqlite backends.
+    """
+    backend = backend or os.getenv("RESULTS_BACKEND", "text")
+    path = path or os.getenv("RESULTS_PATH")
+    if backend == "text":
+        return TextResultsSink()
+    if backend == "jsonl":
+        return JsonlResultsSink(path or "results.jsonl")
+    if backend == "sqlite":
+        return SqliteResultsSink(path or "results.sqlite3")
+    raise ValueError(
+        f"❌ Unknown results backend '{backend}'. Use one of {RESULTS_BACKENDS}."
+    )
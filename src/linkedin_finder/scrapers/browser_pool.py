@@ -0,0 +1,291 @@
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Page, sync_playwright
+
+from linkedin_finder.scrapers.resource_policy import ResourcePolicy
+
+# Pages LinkedIn redirects to when the saved session is no longer valid
+LOGIN_PATHS = ("/login", "/uas/login", "/checkpoint", "/authwall", "/signup")
+
+HEAP_USAGE_SCRIPT = "() => (performance.memory ? performance.memory.usedJSHeapSize : 0)"
+
+
+class SessionExpiredError(RuntimeError):
+    """The saved login session was rejected; log in again to refresh it"""
+
+
+def is_login_url(url: str) -> bool:
+    """Whether a URL is one of LinkedIn's login or auth-wall pages"""
+    path = urlparse(url).path
+    return any(path.startswith(login_path) for login_path in LOGIN_PATHS)
+
+
+class BrowserPool:
+    """Pool of worker threads that each own a logged-in browser page.
+
+    Playwright's sync API is not thread-safe, so every worker starts its own
+    Playwright instance and browser context from the saved storage state.
+    Work is submitted as a callable that receives the worker's page.
+
+    Contexts stay warm for the life of the pool; a worker's page is replaced
+    with a fresh one from the same context after recycle_after main-frame
+    navigations (BROWSER_RECYCLE_AFTER) or once its JS heap passes
+    recycle_heap_mb (BROWSER_RECYCLE_HEAP_MB), so long runs don't
+    accumulate memory.
+
+    A task that ends on a login or auth-wall page means the session has
+    expired. If the storage state file has been rewritten since the context
+    was loaded (e.g. by save_linkedin_session in another process), the
+    worker reloads it and retries the task once; otherwise the task fails
+    with SessionExpiredError, as does all further work on the pool.
+
+    A worker that hits an unexpected error outside the task itself (e.g. its
+    browser crashed while reloading or recycling a page) fails the task it
+    was running and exits. Once every worker has exited, queued and newly
+    submitted work fails immediately instead of waiting forever.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        storage_state: str = "auth.json",
+        headless: bool = False,
+        resource_policy: Optional[ResourcePolicy] = None,
+        recycle_after: Optional[int] = None,
+        recycle_heap_mb: Optional[float] = None,
+    ):
+        self.size = max(1, size)
+        self.storage_state = storage_state
+        self.headless = headless
+        self.resource_policy = resource_policy
+        self.recycle_after = (
+            recycle_after
+            if recycle_after is not None
+            else int(os.getenv("BROWSER_RECYCLE_AFTER", "50"))
+        )
+        self.recycle_heap_mb = (
+            recycle_heap_mb
+            if recycle_heap_mb is not None
+            else float(os.getenv("BROWSER_RECYCLE_HEAP_MB", "512"))
+        )
+        self.session_expired = False
+        self.pages_recycled = 0
+        self.sessions_reloaded = 0
+        self._tasks: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._startup_errors: List[Exception] = []
+        self._alive = 0
+        self._dead_error: Optional[Exception] = None
+        self._state_lock = threading.Lock()
+
+    def start(self) -> "BrowserPool":
+        """Launch every worker and wait until their pages are ready"""
+        print(f"🚀 Launching {self.size} browser worker(s)...")
+        ready_events = []
+        for index in range(self.size):
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_worker,
+                args=(index, ready),
+                name=f"browser-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+            ready_events.append(ready)
+
+        for ready in ready_events:
+            ready.wait()
+
+        if self._startup_errors:
+            self.close()
+            raise RuntimeError(
+                f"❌ Failed to start browser worker: {self._startup_errors[0]}"
+            )
+        return self
+
+    def submit(self, fn: Callable[[Page], Any]) -> Future:
+        """Queue fn(page) for the next free worker"""
+        future: Future = Future()
+        if self.session_expired:
+            future.set_exception(self._expired_error())
+            return future
+        with self._state_lock:
+            if self._dead_error is not None:
+                future.set_exception(self._dead_error)
+            else:
+                self._tasks.put((fn, future))
+        return future
+
+    def close(self):
+        """Cancel queued work, stop all workers and close their browsers"""
+        while True:
+            try:
+                task = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task[1].cancel()
+
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _worker_died(self, index: int, error: Exception):
+        """Forget a crashed worker; with none left, fail all outstanding work"""
+        print(f"❌ Browser worker {index} stopped: {error}")
+        with self._state_lock:
+            self._alive -= 1
+            if self._alive > 0:
+                return
+            self._dead_error = RuntimeError(
+                f"❌ Every browser worker has stopped, last error: {error}"
+            )
+            while True:
+                try:
+                    task = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if task is not None and task[1].set_running_or_notify_cancel():
+                    task[1].set_exception(self._dead_error)
+
+    def __enter__(self) -> "BrowserPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _expired_error(self) -> SessionExpiredError:
+        return SessionExpiredError(
+            f"❌ LinkedIn session in {self.storage_state} has expired. "
+            "Run save_linkedin_session() to log in again."
+        )
+
+    def _storage_mtime(self) -> float:
+        try:
+            return os.path.getmtime(self.storage_state)
+        except OSError:
+            return 0.0
+
+    def _open_context(self, browser) -> BrowserContext:
+        context = browser.new_context(storage_state=self.storage_state)
+        if self.resource_policy is not None:
+            self.resource_policy.install(context)
+        return context
+
+    def _open_page(
+        self, context: BrowserContext, navigations: Dict[str, int]
+    ) -> Page:
+        page = context.new_page()
+        navigations["count"] = 0
+
+        def on_navigated(frame):
+            if frame.parent_frame is None:
+                navigations["count"] += 1
+
+        page.on("framenavigated", on_navigated)
+        return page
+
+    def _needs_recycling(self, page: Page, navigations: Dict[str, int]) -> bool:
+        if self.recycle_after and navigations["count"] >= self.recycle_after:
+            return True
+        if self.recycle_heap_mb:
+            try:
+                heap_bytes = page.evaluate(HEAP_USAGE_SCRIPT)
+            except Exception:
+                return False
+            return heap_bytes > self.recycle_heap_mb * 1024 * 1024
+        return False
+
+    @staticmethod
+    def _call(fn: Callable[[Page], Any], page: Page) -> tuple:
+        try:
+            return fn(page), None
+        except Exception as e:
+            return None, e
+
+    def _run_worker(self, index: int, ready: threading.Event):
+        navigations = {"count": 0}
+        playwright = browser = None
+        try:
+            playwright = sync_playwright().start()
+            browser = playwright.chromium.launch(headless=self.headless)
+            context = self._open_context(browser)
+            loaded_at = self._storage_mtime()
+            page = self._open_page(context, navigations)
+        except Exception as e:
+            self._startup_errors.append(e)
+            # Whatever did start must not outlive the failed worker
+            self._close_browser(index, playwright, browser)
+            ready.set()
+            return
+
+        with self._state_lock:
+            self._alive += 1
+        ready.set()
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    break
+                fn, future = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if self.session_expired:
+                    future.set_exception(self._expired_error())
+                    continue
+
+                try:
+                    result, error = self._call(fn, page)
+                    if is_login_url(page.url) and self._storage_mtime() > loaded_at:
+                        # A newer login was saved since this context started
+                        print(f"🔑 Worker {index} reloading {self.storage_state}")
+                        context.close()
+                        context = self._open_context(browser)
+                        loaded_at = self._storage_mtime()
+                        page = self._open_page(context, navigations)
+                        self.sessions_reloaded += 1
+                        result, error = self._call(fn, page)
+                    if is_login_url(page.url):
+                        self.session_expired = True
+                        error = self._expired_error()
+
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(result)
+
+                    if not page.is_closed() and self._needs_recycling(
+                        page, navigations
+                    ):
+                        page.close()
+                        page = self._open_page(context, navigations)
+                        self.pages_recycled += 1
+                except Exception as e:
+                    # The browser is in an unknown state; never leave the
+                    # caller waiting on this task
+                    if not future.done():
+                        future.set_exception(e)
+                    self._worker_died(index, e)
+                    return
+            with self._state_lock:
+                self._alive -= 1
+        finally:
+            self._close_browser(index, playwright, browser)
+
+    @staticmethod
+    def _close_browser(index: int, playwright, browser):
+        try:
+            if browser is not None:
+                browser.close()
+            if playwright is not None:
+                playwright.stop()
+        except Exception as e:
+            print(f"⚠️ Browser worker {index} did not close cleanly: {e}")
@@ -0,0 +1,360 @@
+from bs4 import BeautifulSoup, FeatureNotFound, Tag
+from typing import List, Dict, Optional
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# BeautifulSoup tree builders that produce the same tree API, so extraction
+# output does not depend on which one parsed the page
+PARSER_BACKENDS = ("html.parser", "lxml", "html5lib")
+
+
+def get_parser_backend() -> str:
+    """HTML parser backend from HTML_PARSER_BACKEND (default html.parser)"""
+    return os.getenv("HTML_PARSER_BACKEND", "html.parser")
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """Parse page HTML with the configured parser backend"""
+    backend = backend or get_parser_backend()
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"❌ Unknown HTML parser backend '{backend}'. Use one of {PARSER_BACKENDS}."
+        )
+    try:
+        return BeautifulSoup(html, backend)
+    except FeatureNotFound:
+        raise ValueError(
+            f"❌ HTML parser backend '{backend}' is not installed. Install it with `pip install {backend}`."
+        )
+
+
+def extract_experience_data(soup: BeautifulSoup) -> List[Dict]:
+    """Extract complete experience data from the dedicated experience page"""
+    experience_entries = []
+
+    # Look for experience entries in the dedicated experience page
+    job_entries = soup.find_all(
+        "li",
+        class_="pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column",
+    )
+
+    # Also try to find by ID pattern as backup
+    if not job_entries:
+        job_entries = soup.find_all(
+            "li",
+            id=lambda x: x and "EXPERIENCE-VIEW-DETAILS-profile" in x if x else False,
+        )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"📊 Found {len(job_entries)} experience entries on dedicated experience page"
+        )
+
+    for i, job_entry in enumerate(job_entries):
+        try:
+            job_data = _extract_job_entry(job_entry, i)
+            if job_data:
+                experience_entries.append(job_data)
+        except Exception as e:
+            logger.warning(f"⚠️ Error extracting experience entry {i+1}: {e}")
+            continue
+
+    return experience_entries
+
+
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile a keyword list into one alternation matched against lowercased text"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+MONTHS = [
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+]
+
+TITLE_EXCLUDE_RE = _keyword_pattern(["·", "full-time", "part-time"] + MONTHS[:6])
+COMPANY_DATE_RE = _keyword_pattern(MONTHS + ["present", "mos", "yr"])
+COMPANY_EMPLOYMENT_RE = _keyword_pattern(
+    ["full-time", "part-time", "contract", "internship"]
+)
+COMPANY_SUFFIX_RE = _keyword_pattern(
+    [
+        "inc",
+        "llc",
+        "ltd",
+        "corp",
+        "company",
+        "technologies",
+        "solutions",
+        "systems",
+        "software",
+    ]
+)
+DURATION_RE = _keyword_pattern(MONTHS + ["present", "mos", "yr", "month", "year"])
+LOCATION_RE = _keyword_pattern(
+    [
+        "colombia",
+        "bogota",
+        "dublin",
+        "ireland",
+        "india",
+        "mumbai",
+        "pune",
+        "remote",
+        "hybrid",
+        "on-site",
+        "united states",
+        "usa",
+        "uk",
+        "canada",
+        "new york",
+        "california",
+        "texas",
+        "florida",
+        "london",
+        "paris",
+        "berlin",
+    ]
+)
+DESCRIPTION_EXCLUDE_RE = _keyword_pattern(["full-time", "part-time", "contract"])
+DESC_CONTAINER_RE = _keyword_pattern(
+    ["pvs-list__outer-container", "pvs-entity__sub-components", "display-flex"]
+)
+
+COMPANY_SPAN_CLASS = "t-14 t-normal"
+DETAIL_SPAN_CLASS = "t-14 t-normal t-black--light"
+
+# Ancestor tests for the title selectors, in priority order:
+#   div[data-field='experience-company-name'] span[aria-hidden='true']
+#   .display-flex.align-items-center span[aria-hidden='true']
+#   .mr1.hoverable-link-text span[aria-hidden='true']
+#   .break-words span[aria-hidden='true']
+TITLE_SELECTOR_COUNT = 4
+
+
+def _title_selector_flags(tag: Tag) -> int:
+    """Bitmask of title selectors for which tag is a qualifying ancestor"""
+    classes = tag.get("class") or []
+    flags = 0
+    if tag.name == "div" and tag.get("data-field") == "experience-company-name":
+        flags |= 1
+    if "display-flex" in classes and "align-items-center" in classes:
+        flags |= 2
+    if "mr1" in classes and "hoverable-link-text" in classes:
+        flags |= 4
+    if "break-words" in classes:
+        flags |= 8
+    return flags
+
+
+def _scan_job_entry(job_entry) -> Dict:
+    """Walk the entry subtree once and classify every element that extraction reads.
+
+    Produces, in document order: the text of every aria-hidden span, the
+    first such span under each title selector, the company and detail span
+    texts, the description span texts and the bullet texts.
+    """
+    scan = {
+        "aria_texts": [],
+        "title_texts": [None] * TITLE_SELECTOR_COUNT,
+        "company_texts": [],
+        "detail_texts": [],
+        "description_texts": [],
+        "bullet_texts": [],
+    }
+
+    # Selector ancestors may sit above the entry itself, as in CSS matching
+    inherited_flags = 0
+    for ancestor in [job_entry, *job_entry.parents]:
+        if isinstance(ancestor, Tag):
+            inherited_flags |= _title_selector_flags(ancestor)
+
+    stack = [
+        (child, inherited_flags, False, False)
+        for child in reversed(job_entry.contents)
+        if isinstance(child, Tag)
+    ]
+    while stack:
+        tag, flags, in_desc_container, in_ul = stack.pop()
+        classes = tag.get("class") or []
+
+        if tag.name == "span":
+            is_aria = tag.get("aria-hidden") == "true"
+            class_string = " ".join(classes)
+            is_company = class_string == COMPANY_SPAN_CLASS
+            is_detail = class_string == DETAIL_SPAN_CLASS
+            if is_aria or is_company or is_detail:
+                text = tag.get_text(strip=True)
+                if is_aria:
+                    scan["aria_texts"].append(text)
+                    for bit in range(TITLE_SELECTOR_COUNT):
+                        if flags & (1 << bit) and scan["title_texts"][bit] is None:
+                            scan["title_texts"][bit] = text
+                    if in_desc_container:
+                        scan["description_texts"].append(text)
+                if is_company:
+                    scan["company_texts"].append(text)
+                if is_detail:
+                    scan["detail_texts"].append(text)
+        elif tag.name == "li" and in_ul:
+            scan["bullet_texts"].append(tag.get_text(strip=True))
+
+        child_flags = flags | _title_selector_flags(tag)
+        child_in_desc = in_desc_container or (
+            tag.name == "div" and bool(DESC_CONTAINER_RE.search(" ".join(classes)))
+        )
+        child_in_ul = in_ul or tag.name == "ul"
+        for child in reversed(tag.contents):
+            if isinstance(child, Tag):
+                stack.append((child, child_flags, child_in_desc, child_in_ul))
+
+    return scan
+
+
+def _extract_job_entry(job_entry, index: int) -> Dict:
+    """Extract data from a single job entry"""
+    job_data = {}
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"\n🔍 Processing experience entry {index+1}")
+
+    scan = _scan_job_entry(job_entry)
+
+    job_data["title"] = _extract_job_title(scan, debug)
+
+    company_info = _extract_company_info(scan, debug)
+    job_data.update(company_info)
+
+    job_data["duration"] = _extract_duration(scan, debug)
+
+    job_data["location"] = _extract_location(scan, debug)
+
+    job_data["description"] = _extract_description(scan, debug)
+
+    if job_data.get("title") or job_data.get("company"):
+        if debug:
+            logger.debug(
+                f"✅ Successfully extracted experience {index+1}: {job_data.get('title', 'Unknown Title')} at {job_data.get('company', 'Unknown Company')}"
+            )
+        return job_data
+    else:
+        if debug:
+            logger.debug(f"⚠️ Skipped entry {index+1} - missing essential info")
+        return None
+
+
+def _extract_job_title(scan: Dict, debug: bool = False) -> str:
+    """Extract job title from a scanned job entry"""
+    for title_text in scan["title_texts"]:
+        if title_text and len(title_text) > 2:
+            if debug:
+                logger.debug(f"✅ Found title: {title_text}")
+            return title_text
+
+    # Fallback search
+    for text in scan["aria_texts"][:3]:
+        if text and 5 < len(text) < 100 and not TITLE_EXCLUDE_RE.search(text.lower()):
+            if debug:
+                logger.debug(f"✅ Found title (fallback): {text}")
+            return text
+
+    return ""
+
+
+def _extract_company_info(scan: Dict, debug: bool = False) -> Dict:
+    """Extract company name and employment type"""
+    company_info = {}
+
+    # Try to find company info in spans with specific patterns
+    for span_text in scan["company_texts"]:
+        if "·" in span_text:
+            company_parts = span_text.split("·")
+            if len(company_parts) >= 2:
+                company_name = company_parts[0].strip()
+                employment_type = company_parts[1].strip()
+                if company_name and len(company_name) > 1:
+                    company_info["company"] = company_name
+                    company_info["employment_type"] = employment_type
+                    if debug:
+                        logger.debug(
+                            f"✅ Found company: {company_name} ({employment_type})"
+                        )
+                    return company_info
+
+    # Fallback search for company name
+    for text in scan["aria_texts"]:
+        if not text or not 3 < len(text) < 80:
+            continue
+        lowered = text.lower()
+        if COMPANY_DATE_RE.search(lowered) or COMPANY_EMPLOYMENT_RE.search(lowered):
+            continue
+        if COMPANY_SUFFIX_RE.search(lowered) or len(text.split()) <= 4:
+            company_info["company"] = text
+            if debug:
+                logger.debug(f"✅ Found company (fallback): {text}")
+            return company_info
+
+    return company_info
+
+
+def _extract_duration(scan: Dict, debug: bool = False) -> str:
+    """Extract duration from a scanned job entry"""
+    for text in scan["detail_texts"]:
+        if DURATION_RE.search(text.lower()):
+            if debug:
+                logger.debug(f"✅ Found duration: {text}")
+            return text
+    return ""
+
+
+def _extract_location(scan: Dict, debug: bool = False) -> str:
+    """Extract location from a scanned job entry"""
+    for text in scan["detail_texts"]:
+        if LOCATION_RE.search(text.lower()):
+            if debug:
+                logger.debug(f"✅ Found location: {text}")
+            return text
+    return ""
+
+
+def _extract_description(scan: Dict, debug: bool = False) -> str:
+    """Extract job description from a scanned job entry"""
+    description_parts = []
+    seen = set()
+
+    for desc_text in scan["description_texts"]:
+        if len(desc_text) > 50 and not DESCRIPTION_EXCLUDE_RE.search(
+            desc_text.lower()
+        ):
+            if desc_text not in seen:
+                seen.add(desc_text)
+                description_parts.append(desc_text)
+                if debug:
+                    logger.debug(f"✅ Found description part: {desc_text[:100]}...")
+
+    # Bullet points
+    for text in scan["bullet_texts"]:
+        if text and len(text) > 10:
+            bullet_text = f"• {text}"
+            if bullet_text not in seen:
+                seen.add(bullet_text)
+                description_parts.append(bullet_text)
+
+    return (
+        "\n\n".join(description_parts)
+        if description_parts
+        else "No detailed description provided"
+    )
@@ -0,0 +1,110 @@
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+
+def normalize_profile_url(href: str, base_url: Optional[str] = None) -> str:
+    """Canonical form of a profile link, used as its identity in the frontier.
+
+    Relative links are resolved against base_url; the query string,
+    fragment and trailing slash are dropped and the host is lower-cased, so
+    the same person reached through different search pages maps to one key.
+    """
+    if base_url:
+        href = urljoin(base_url.rstrip("/") + "/", href)
+    parts = urlsplit(href.strip())
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), "", "")
+    )
+
+
+class ProfileFrontier:
+    """Deduplicated queue of profile URLs waiting to be visited.
+
+    The search harvester adds links as it pages through results and profile
+    workers take them from the other end, so pagination never waits on
+    profile visits. Every URL ever added (or passed in as already visited,
+    e.g. from a resumed job) is remembered in a hash set, so a profile that
+    appears on several result pages is only queued once.
+
+    The set lives only as long as the frontier. Dedup across runs covers
+    resuming an interrupted job, whose journal seeds the visited URLs; once
+    a job completes, the next run of the search visits every profile again,
+    which is how refresh mode notices changed experience (the page cache
+    still saves the download).
+
+    The harvester paces itself with wait_for_demand(): it only fetches
+    another results page while fewer URLs are queued than the consumer
+    still needs, as set through set_demand().
+    """
+
+    def __init__(self, visited: Iterable[str] = ()):
+        self._seen = set(visited)
+        self._queue: deque = deque()
+        self._demand = 0
+        self._exhausted = False
+        self._stopped = False
+        self._condition = threading.Condition()
+        self.duplicates = 0
+
+    def add(self, urls: Iterable[str]) -> int:
+        """Queue every URL not seen before and return how many were new"""
+        added = 0
+        with self._condition:
+            for url in urls:
+                if url in self._seen:
+                    self.duplicates += 1
+                    continue
+                self._seen.add(url)
+                self._queue.append(url)
+                added += 1
+            if added:
+                self._condition.notify_all()
+        return added
+
+    def get(self, block: bool = True) -> Optional[str]:
+        """Take the next URL, or None once nothing more will arrive.
+
+        With block=False, None is also returned when the queue is merely
+        empty for now.
+        """
+        with self._condition:
+            while block and not self._queue and not (self._exhausted or self._stopped):
+                self._condition.wait()
+            if self._queue and not self._stopped:
+                return self._queue.popleft()
+            return None
+
+    def set_demand(self, demand: int):
+        """Tell the harvester how many more URLs the consumer still needs"""
+        with self._condition:
+            self._demand = demand
+            self._condition.notify_all()
+
+    def wait_for_demand(self) -> bool:
+        """Block until more URLs are wanted; False once the consumer has stopped"""
+        with self._condition:
+            while not self._stopped and len(self._queue) >= self._demand:
+                self._condition.wait()
+            return not self._stopped
+
+    def finish(self):
+        """Mark the harvest as done; get() returns None once the queue drains"""
+        with self._condition:
+            self._exhausted = True
+            self._condition.notify_all()
+
+    def stop(self):
+        """Stop the harvester and hand out no further URLs"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "seen": len(self._seen),
+                "queued": len(self._queue),
+                "duplicates": self.duplicates,
+            }
@@ -0,0 +1,723 @@
+from playwright.sync_api import (
+    Page,
+    TimeoutError as PlaywrightTimeoutError,
+    sync_playwright,
+)
+from bs4 import BeautifulSoup
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from linkedin_finder.instrumentation import metrics
+from linkedin_finder.journal import JobJournal
+from linkedin_finder.rate_limiter import (
+    THROTTLE_STATUS_CODES,
+    backoff_delay,
+    get_navigation_limiter,
+)
+from linkedin_finder.scrapers.browser_pool import (
+    BrowserPool,
+    SessionExpiredError,
+    is_login_url,
+)
+from linkedin_finder.scrapers.experience_extractor import (
+    extract_experience_data,
+    parse_html,
+)
+from linkedin_finder.scrapers.frontier import ProfileFrontier, normalize_profile_url
+from linkedin_finder.scrapers.page_cache import ExperiencePageCache
+from linkedin_finder.scrapers.profile_payloads import (
+    ProfilePayloadListener,
+    get_profile_source,
+    profile_public_identifier,
+)
+from linkedin_finder.scrapers.resource_policy import ResourcePolicy, TrafficMeter
+from linkedin_finder.scrapers.page_waits import (
+    EXPERIENCE_ENTRIES_SELECTOR,
+    SEARCH_RESULTS_SELECTOR,
+    print_wait_summary,
+    reset_wait_records,
+    wait_for_ready,
+)
+
+
+def get_base_url() -> str:
+    """LinkedIn origin, overridable with LINKEDIN_BASE_URL (e.g. a local stand-in site)"""
+    return os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+
+
+def get_auth_file() -> str:
+    """Path of the saved login session, from LINKEDIN_AUTH_FILE (default auth.json)"""
+    return os.getenv("LINKEDIN_AUTH_FILE", "auth.json")
+
+
+def get_headless() -> bool:
+    """Whether scraping browsers run headless, from HEADLESS (default false)"""
+    return os.getenv("HEADLESS", "").lower() in ("1", "true", "yes", "on")
+
+
+def save_linkedin_session(timeout_seconds: Optional[float] = None) -> bool:
+    """Save LinkedIn login session for future use.
+
+    Returns as soon as the browser leaves the login pages, or gives up
+    without saving after timeout_seconds (LOGIN_TIMEOUT_SECONDS, default 300).
+    """
+    if timeout_seconds is None:
+        timeout_seconds = float(os.getenv("LOGIN_TIMEOUT_SECONDS", "300"))
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=False)
+        context = browser.new_context()
+        page = context.new_page()
+
+        page.goto(f"{get_base_url()}/login")
+        print("Please log in to LinkedIn manually in the browser window...")
+
+        start = time.perf_counter()
+        try:
+            page.wait_for_url(
+                lambda url: not is_login_url(url), timeout=timeout_seconds * 1000
+            )
+            page.wait_for_load_state()
+        except PlaywrightTimeoutError:
+            print(
+                f"❌ No login detected within {timeout_seconds:.0f}s, "
+                "session not saved"
+            )
+            browser.close()
+            return False
+
+        auth_file = get_auth_file()
+        context.storage_state(path=auth_file)
+        print(
+            f"✅ Login detected after {time.perf_counter() - start:.1f}s, "
+            f"session saved to {auth_file}"
+        )
+        browser.close()
+        return True
+
+
+def get_experience_url_from_profile(profile_url: str) -> str:
+    """Convert profile URL to experience-specific URL"""
+    if "/details/experience/" in profile_url:
+        return profile_url
+
+    # Remove query parameters and trailing slashes
+    if "?" in profile_url:
+        clean_url = profile_url.split("?")[0]
+    else:
+        clean_url = profile_url
+
+    clean_url = clean_url.rstrip("/")
+
+    if "/in/" in clean_url:
+        return f"{clean_url}/details/experience/"
+
+    return profile_url
+
+
+def navigate(page: Page, url: str, stage: str, wait_until: str = "load"):
+    """Open url under the navigation rate limiter.
+
+    Throttle responses (HTTP 429/999) slow the limiter down and are retried
+    after a jittered backoff, up to NAV_MAX_RETRIES times.
+    """
+    limiter = get_navigation_limiter()
+    max_retries = int(os.getenv("NAV_MAX_RETRIES", "3"))
+    retry_backoff = float(os.getenv("NAV_RETRY_BACKOFF_SECONDS", "5"))
+    attempt = 0
+    while True:
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            with metrics.timer(stage):
+                response = page.goto(url, wait_until=wait_until)
+        except PlaywrightTimeoutError:
+            limiter.record_timeout()
+            raise
+        if response is None or response.status not in THROTTLE_STATUS_CODES:
+            limiter.record_success(time.perf_counter() - start)
+            return response
+
+        limiter.record_throttle()
+        if attempt >= max_retries:
+            raise RuntimeError(
+                f"❌ Still throttled (HTTP {response.status}) after "
+                f"{max_retries} retries: {url}"
+            )
+        attempt += 1
+        delay = backoff_delay(attempt, retry_backoff)
+        print(
+            f"🐢 Throttled (HTTP {response.status}), retry {attempt}/{max_retries} "
+            f"in {delay:.1f}s"
+        )
+        time.sleep(delay)
+
+
+def build_search_url(search_query: str, location: str, page_num: int = 1) -> str:
+    """Build the people-search URL for a query, location and results page"""
+    search_url = f"{get_base_url()}/search/results/people/?keywords={search_query.replace(' ', '%20')}%20{location.replace(' ', '%20')}"
+    if page_num > 1:
+        search_url += f"&page={page_num}"
+    return search_url
+
+
+def collect_profile_links(
+    page: Page, search_url: str
+) -> Optional[Tuple[List[Tuple[str, str]], bool]]:
+    """Open a search results page and return its profile links and whether a next page exists.
+
+    Returns None when the search results container cannot be found.
+    """
+    navigate(page, search_url, "search_navigation")
+    print(f"🌍 On People Search: {page.url}")
+
+    wait_for_ready(page, SEARCH_RESULTS_SELECTOR, "search results")
+
+    # Find the search results container using the correct class
+    search_results = page.query_selector("ul.eXOGCNtWZCUfVkYFgXYYeCjJSoAhEDHk")
+    if not search_results:
+        print("⚠️ Could not find search results container")
+        return None
+
+    # Extract all list items (individual profile results)
+    profile_items = search_results.query_selector_all(
+        "li.nrxCTNBwEvLjnjUMRDlltdOsOQfMBkCNfDFxZfpE"
+    )
+    print(f"🔗 Found {len(profile_items)} profile items")
+
+    # Extract profile links from each list item
+    profile_links = []
+    page_seen = set()
+    base_url = get_base_url()
+    for item in profile_items:
+        # Look for the anchor tag with the profile link inside each list item
+        link_element = item.query_selector('a[href*="/in/"][data-test-app-aware-link]')
+        if link_element:
+            href = link_element.get_attribute("href")
+            if href:
+                # Normalize the URL so the same profile always has the same key
+                clean_url = normalize_profile_url(href, base_url)
+                if clean_url not in page_seen:  # Avoid duplicates
+                    page_seen.add(clean_url)
+                    # Store both clean and original
+                    profile_links.append((clean_url, href))
+
+    print(f"📋 Extracted {len(profile_links)} unique profile links")
+
+    # Check if there's a next page button
+    has_next = (
+        page.query_selector('button[aria-label="Next"]:not([disabled])') is not None
+    )
+    return profile_links, has_next
+
+
+def harvest_search_results(
+    page: Page,
+    search_query: str,
+    location: str,
+    frontier: ProfileFrontier,
+    start_page: int = 1,
+    journal: Optional[JobJournal] = None,
+) -> int:
+    """Page through search results, feeding new profile links into the frontier.
+
+    Runs ahead of the profile workers for as long as the frontier wants more
+    links, and marks the frontier finished when the results run out.
+    Returns the last results page visited.
+    """
+    page_num = start_page
+    try:
+        while frontier.wait_for_demand():
+            # Navigate to people search with pagination
+            print(f"🌐 Navigating to LinkedIn People Search (Page {page_num})...")
+            if journal is not None:
+                journal.record_search_page(page_num)
+            search_result = collect_profile_links(
+                page, build_search_url(search_query, location, page_num)
+            )
+            if search_result is None:
+                break
+            profile_links, has_next = search_result
+            urls = [clean_url for clean_url, _ in profile_links]
+            if journal is not None:
+                journal.record_seen(urls)
+            added = frontier.add(urls)
+            metrics.increment("frontier_duplicates", len(urls) - added)
+            print(
+                f"🧭 Frontier: {added} new profile(s) from page {page_num}, "
+                f"{len(urls) - added} already seen"
+            )
+
+            if not profile_links:
+                break
+            if not has_next:
+                print("⚠️ No more pages available or Next button is disabled")
+                break
+            page_num += 1
+            print(f"➡️ Moving to page {page_num}")
+    finally:
+        frontier.finish()
+    return page_num
+
+
+# Collects only what extraction reads: the first match of each name selector
+# and the outermost experience list items, in a minimal document. Each entry
+# keeps the ancestors the title selectors can match against (as bare divs
+# carrying their class and data-field), so extraction sees the same
+# ancestor chain as on the full page
+SCOPED_CAPTURE_SCRIPT = """
+(entrySelector) => {
+    const entries = Array.from(document.querySelectorAll(entrySelector)).filter(
+        (el) => !(el.parentElement && el.parentElement.closest(entrySelector))
+    );
+    const hasClasses = (el, names) => names.every((name) => el.classList.contains(name));
+    const isTitleWrapper = (el) =>
+        (el.tagName === "DIV" &&
+            el.getAttribute("data-field") === "experience-company-name") ||
+        hasClasses(el, ["display-flex", "align-items-center"]) ||
+        hasClasses(el, ["mr1", "hoverable-link-text"]) ||
+        hasClasses(el, ["break-words"]);
+    const escapeAttr = (value) => value.replace(/&/g, "&amp;").replace(/"/g, "&quot;");
+    const withAncestors = (entry) => {
+        let html = entry.outerHTML;
+        for (let el = entry.parentElement; el; el = el.parentElement) {
+            if (!isTitleWrapper(el)) {
+                continue;
+            }
+            let attrs = "";
+            const classes = el.getAttribute("class");
+            if (classes) {
+                attrs += ` class="${escapeAttr(classes)}"`;
+            }
+            const field = el.getAttribute("data-field");
+            if (field) {
+                attrs += ` data-field="${escapeAttr(field)}"`;
+            }
+            html = `<div${attrs}>${html}</div>`;
+        }
+        return html;
+    };
+    const nameParts = [];
+    for (const selector of ["h1", ".text-heading-xlarge", ".break-words"]) {
+        const el = document.querySelector(selector);
+        if (el && !el.querySelector(entrySelector)) {
+            nameParts.push(el.outerHTML);
+        }
+    }
+    return {
+        count: entries.length,
+        html: "<html><body>" + nameParts.join("") + "<ul>" +
+            entries.map(withAncestors).join("") + "</ul></body></html>",
+    };
+}
+"""
+
+SCOPED_ENTRY_SELECTOR = (
+    "li.pvs-list__paged-list-item, li[id*='EXPERIENCE-VIEW-DETAILS-profile']"
+)
+
+
+def capture_experience_html(page: Page) -> str:
+    """Serialize only the experience list subtree and name heading of the page.
+
+    Entries keep the ancestor wrappers the title selectors look at, so
+    extraction gives the same result as on the full page.
+
+    Falls back to the full page content when no experience entries are
+    present, so extraction sees exactly what it would have seen before.
+    """
+    captured = page.evaluate(SCOPED_CAPTURE_SCRIPT, SCOPED_ENTRY_SELECTOR)
+    if not captured or not captured.get("count"):
+        return page.content()
+    return captured["html"]
+
+
+def scrape_profile(
+    page: Page, clean_url: str, cache: Optional[ExperiencePageCache] = None
+) -> Dict:
+    """Visit a profile's experience page and extract its data.
+
+    With PROFILE_SOURCE=network the entries are read from the JSON the page
+    fetches from LinkedIn's API, without waiting for it to render; when the
+    payloads don't cover the whole profile in time, the rendered page is
+    extracted as usual.
+    """
+    # Navigate to the experience-specific page
+    experience_url = get_experience_url_from_profile(clean_url)
+    print(f"🎯 Going to experience page: {experience_url}")
+
+    listener = None
+    if get_profile_source() == "network":
+        listener = ProfilePayloadListener(
+            page, profile_public_identifier(clean_url)
+        ).start()
+    meter = TrafficMeter(page).start()
+    navigation_start = time.perf_counter()
+    extracted = None
+    try:
+        if listener is not None:
+            navigate(page, experience_url, "profile_navigation", wait_until="commit")
+            extracted = listener.collect()
+            listener.stop()
+            listener = None
+            if extracted is None or not extracted["complete"]:
+                print(
+                    "⚠️ No complete profile payload seen, "
+                    "extracting from the page instead"
+                )
+                extracted = None
+                metrics.increment("payload_fallbacks")
+            else:
+                metrics.increment("payload_extractions")
+        else:
+            navigate(page, experience_url, "profile_navigation")
+        if extracted is None:
+            wait_for_ready(page, EXPERIENCE_ENTRIES_SELECTOR, "experience entries")
+    finally:
+        if listener is not None:
+            listener.stop()
+        page_ready_seconds = time.perf_counter() - navigation_start
+        traffic = meter.stop()
+
+    metrics.observe("page_ready", page_ready_seconds)
+    metrics.increment("bytes_transferred", traffic["bytes"])
+    print(
+        f"📶 Page ready in {page_ready_seconds:.2f}s, "
+        f"{traffic['bytes'] / 1024:.0f} KiB over {traffic['requests']} requests "
+        f"({traffic['failed_requests']} blocked or failed)"
+    )
+
+    if extracted is not None:
+        # Nothing rendered was read, so there is no HTML to keep
+        html = ""
+        name = extracted["name"]
+        experience_entries = extracted["experience_entries"]
+    else:
+        with metrics.timer("html_capture"):
+            html = capture_experience_html(page)
+        metrics.increment("html_bytes_captured", len(html))
+        with metrics.timer("html_parse"):
+            soup = parse_html(html)
+
+        with metrics.timer("extraction"):
+            name = extract_name(soup)
+            experience_entries = extract_experience_data(soup)
+    print(f"👤 Found profile for: {name}")
+    print(
+        f"📊 Found {len(experience_entries)} experience entries on dedicated experience page"
+    )
+
+    if cache is not None:
+        cache.put(experience_url, name, html, experience_entries)
+
+    return {
+        "name": name,
+        "profile_url": clean_url,
+        "experience_url": experience_url,
+        "experience_entries": experience_entries,
+        "fetch_stats": {
+            "source": "dom" if extracted is None else "network",
+            "page_ready_seconds": page_ready_seconds,
+            "bytes_transferred": traffic["bytes"],
+            "requests": traffic["requests"],
+            "failed_requests": traffic["failed_requests"],
+        },
+    }
+
+
+def load_cached_profile(
+    cache: ExperiencePageCache, clean_url: str
+) -> Optional[Dict]:
+    """Build a profile from the page cache without touching the browser"""
+    experience_url = get_experience_url_from_profile(clean_url)
+    entry = cache.get(experience_url)
+    if entry is None:
+        return None
+
+    print(f"🗄️ Cache hit for experience page: {experience_url}")
+    metrics.increment("page_cache_hits")
+    return {
+        "name": entry["name"],
+        "profile_url": clean_url,
+        "experience_url": experience_url,
+        "experience_entries": entry["experience_entries"],
+    }
+
+
+class ScraperSession:
+    """Browsers and caches shared by every search run in one process.
+
+    Holds the search-results browser, the pool of profile workers, the
+    experience page cache and an in-memory map of profiles already scraped
+    in this session, so a batch of searches launches Chromium once and a
+    profile found by several searches is only visited once.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        cache: Optional[ExperiencePageCache] = None,
+    ):
+        if num_workers is None:
+            num_workers = int(os.getenv("SCRAPER_WORKERS", "1"))
+        self.num_workers = max(1, num_workers)
+        self.cache = cache if cache is not None else ExperiencePageCache()
+        self.resource_policy = ResourcePolicy.from_env()
+        self.profiles: Dict[str, Dict] = {}
+
+        pool_options = dict(
+            storage_state=get_auth_file(),
+            headless=get_headless(),
+            resource_policy=self.resource_policy,
+        )
+        self.search_pool = BrowserPool(size=1, **pool_options)
+        self.pool = BrowserPool(size=self.num_workers, **pool_options)
+
+    def start(self) -> "ScraperSession":
+        self.search_pool.start()
+        try:
+            self.pool.start()
+        except Exception:
+            self.search_pool.close()
+            raise
+        return self
+
+    def get_profile(self, clean_url: str) -> Optional[Dict]:
+        """Return a profile scraped earlier in this session or found in the page cache"""
+        profile = self.profiles.get(clean_url)
+        if profile is not None:
+            print(f"♻️ Reusing profile scraped earlier in this session: {clean_url}")
+            metrics.increment("session_profile_hits")
+            return profile
+        return load_cached_profile(self.cache, clean_url)
+
+    @property
+    def expired(self) -> bool:
+        return self.pool.session_expired or self.search_pool.session_expired
+
+    def close(self):
+        self.pool.close()
+        self.search_pool.close()
+
+        recycled = self.pool.pages_recycled + self.search_pool.pages_recycled
+        reloaded = self.pool.sessions_reloaded + self.search_pool.sessions_reloaded
+        if recycled or reloaded:
+            print(
+                f"♻️ Browser pool: {recycled} page(s) recycled, "
+                f"{reloaded} session reload(s)"
+            )
+
+        cache_stats = self.cache.stats()
+        print(
+            f"🗄️ Page cache ({cache_stats['mode']}): {cache_stats['hits']} hits, "
+            f"{cache_stats['misses']} misses, {cache_stats['expired']} expired"
+        )
+        if self.resource_policy is not None:
+            print(
+                f"🚫 Resource policy: blocked {self.resource_policy.blocked} of "
+                f"{self.resource_policy.blocked + self.resource_policy.allowed} "
+                f"requests"
+            )
+
+    def __enter__(self) -> "ScraperSession":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_shared_session: Optional[ScraperSession] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_scraper_session() -> ScraperSession:
+    """Return the process-wide scraper session, starting it on first use.
+
+    The browsers stay open until the process exits, so later searches in
+    the same process skip browser startup. A session whose login has
+    expired is replaced.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is not None and _shared_session.expired:
+            _shared_session.close()
+            atexit.unregister(_shared_session.close)
+            _shared_session = None
+        if _shared_session is None:
+            _shared_session = ScraperSession().start()
+            atexit.register(_shared_session.close)
+        return _shared_session
+
+
+def scrape_linkedin_profiles(
+    search_query: str,
+    location: str,
+    max_profiles: int = 1,
+    num_workers: Optional[int] = None,
+    cache: Optional[ExperiencePageCache] = None,
+    journal: Optional[JobJournal] = None,
+    session: Optional[ScraperSession] = None,
+) -> List[Dict]:
+    """Scrape LinkedIn profiles based on search criteria"""
+    return list(
+        iter_linkedin_profiles(
+            search_query, location, max_profiles, num_workers, cache, journal, session
+        )
+    )
+
+
+def iter_linkedin_profiles(
+    search_query: str,
+    location: str,
+    max_profiles: int = 1,
+    num_workers: Optional[int] = None,
+    cache: Optional[ExperiencePageCache] = None,
+    journal: Optional[JobJournal] = None,
+    session: Optional[ScraperSession] = None,
+) -> Iterator[Dict]:
+    """Scrape LinkedIn profiles, yielding each one as soon as it is extracted.
+
+    Profiles are visited concurrently by a pool of num_workers browser pages
+    (SCRAPER_WORKERS by default), all sharing the saved login session. The
+    browser stays open until the generator is exhausted or closed. All
+    pages draw from one navigation rate limiter, so throughput is capped by
+    NAV_RATE_PER_SEC however many workers there are (see
+    get_navigation_limiter).
+
+    Experience pages found in the page cache are served from disk and never
+    reach the browser; the cache is configured from PAGE_CACHE_* when not
+    given.
+
+    Search results are harvested by a separate browser that runs ahead of
+    the profile workers, feeding a frontier that skips any profile already
+    seen on an earlier results page (or, with a journal, earlier in the
+    interrupted run being resumed).
+
+    With a journal, profiles scraped by an interrupted run are replayed
+    first and crawling resumes from the journaled search page.
+
+    Pass a started session to reuse its browsers, caches and already
+    scraped profiles; num_workers and cache are then taken from it and the
+    session is left open.
+    """
+    # The wait summary printed at the end covers this run only
+    reset_wait_records()
+    profiles_found = 0
+    if journal is not None:
+        for profile in list(journal.scraped.values())[:max_profiles]:
+            profiles_found += 1
+            print(f"♻️ Replaying journaled profile #{profiles_found}: {profile['name']}")
+            yield profile
+        if profiles_found >= max_profiles:
+            return
+
+    # Already-scraped profiles are never queued again; links seen by an
+    # interrupted run but not yet visited go to the front of the queue
+    frontier = ProfileFrontier()
+    if journal is not None:
+        frontier = ProfileFrontier(normalize_profile_url(url) for url in journal.scraped)
+        frontier.add(normalize_profile_url(url) for url in journal.seen)
+    frontier.set_demand(max_profiles - profiles_found)
+
+    session_scope = (
+        ScraperSession(num_workers, cache) if session is None else nullcontext(session)
+    )
+    with session_scope as session:
+        cache = session.cache
+        pool = session.pool
+        start_page = journal.current_page if journal is not None else 1
+        harvest = session.search_pool.submit(
+            lambda page: harvest_search_results(
+                page, search_query, location, frontier, start_page, journal
+            )
+        )
+
+        # Keep up to num_workers profiles in flight, but never more than are
+        # still needed, so max_profiles can't be overshot; failures are
+        # topped up from the frontier
+        in_flight = deque()
+        try:
+            while profiles_found < max_profiles:
+                while (
+                    len(in_flight) < session.num_workers
+                    and profiles_found + len(in_flight) < max_profiles
+                ):
+                    clean_url = frontier.get(block=not in_flight)
+                    if clean_url is None:
+                        break
+                    cached_profile = session.get_profile(clean_url)
+                    if cached_profile is not None:
+                        future = Future()
+                        future.set_result(cached_profile)
+                    else:
+                        print(f"\n➡️ Queueing profile: {clean_url}")
+                        future = pool.submit(
+                            lambda page, url=clean_url: scrape_profile(page, url, cache)
+                        )
+                    in_flight.append((clean_url, future))
+                    frontier.set_demand(
+                        max_profiles - profiles_found - len(in_flight)
+                    )
+
+                if not in_flight:
+                    # The harvester has run out of search results
+                    break
+
+                # Collect in dispatch order to keep the output stable
+                clean_url, future = in_flight.popleft()
+                try:
+                    profile = future.result()
+                except SessionExpiredError:
+                    raise
+                except Exception as e:
+                    print(f"❌ Error processing profile {clean_url}: {str(e)}")
+                    metrics.increment("profiles_failed")
+                    frontier.set_demand(
+                        max_profiles - profiles_found - len(in_flight)
+                    )
+                    continue
+                session.profiles[clean_url] = profile
+                if journal is not None:
+                    journal.record_scraped(profile)
+                profiles_found += 1
+                metrics.increment("profiles_scraped")
+                print(f"✅ Scraped profile #{profiles_found}: {clean_url}")
+                yield profile
+        finally:
+            frontier.stop()
+            # Don't leave abandoned visits queued on a shared pool
+            for _, future in in_flight:
+                future.cancel()
+
+        try:
+            harvest.result()
+        except SessionExpiredError:
+            raise
+        except Exception as e:
+            print(f"❌ Error harvesting search results: {str(e)}")
+
+        frontier_stats = frontier.stats()
+        print(
+            f"🧭 Frontier: {frontier_stats['seen']} unique profiles seen, "
+            f"{frontier_stats['duplicates']} duplicates skipped, "
+            f"{frontier_stats['queued']} left unvisited"
+        )
+        print_wait_summary()
+
+
+def extract_name(soup: BeautifulSoup) -> str:
+    """Extract name from LinkedIn profile page"""
+    name_selectors = ["h1", ".text-heading-xlarge", ".break-words"]
+    for selector in name_selectors:
+        name_elem = soup.select_one(selector)
+        if name_elem:
+            potential_name = name_elem.get_text(strip=True)
+            if len(potential_name) < 100 and potential_name:  # Reasonable name length
+                return potential_name
+    return "Unknown"
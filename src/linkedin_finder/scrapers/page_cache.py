@@ -0,0 +1,185 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+
+class ExperiencePageCache:
+    """Persistent, compressed cache of fetched experience pages.
+
+    Entries are keyed by the SHA-256 of the experience URL and stored as
+    gzipped JSON holding the page HTML, the extracted name and the parsed
+    experience entries. Entries older than the TTL are ignored, and the
+    least recently used files are evicted once the cache exceeds its size
+    limit.
+
+    Modes: "use" reads and writes, "refresh" skips reads but stores fresh
+    pages, "bypass" neither reads nor writes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        mode: Optional[str] = None,
+    ):
+        self.cache_dir = cache_dir or os.getenv(
+            "PAGE_CACHE_DIR", os.path.join(".cache", "experience_pages")
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else float(os.getenv("PAGE_CACHE_TTL_SECONDS", str(24 * 3600)))
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(float(os.getenv("PAGE_CACHE_MAX_MB", "200")) * 1024 * 1024)
+        )
+        self.mode = mode or os.getenv("PAGE_CACHE_MODE", "use")
+        if self.mode not in CACHE_MODES:
+            raise ValueError(
+                f"❌ Unknown page cache mode '{self.mode}'. Use one of {CACHE_MODES}."
+            )
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def _path(self, experience_url: str) -> str:
+        key = hashlib.sha256(experience_url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+    def get(self, experience_url: str) -> Optional[Dict]:
+        """Return the cached entry for experience_url, or None on a miss"""
+        if self.mode != "use":
+            return None
+
+        path = self._path(experience_url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        if now - entry.get("fetched_at", 0) > self.ttl_seconds:
+            with self._lock:
+                self.expired += 1
+                self.misses += 1
+            return None
+
+        # Touch the file so eviction treats it as recently used
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(
+        self,
+        experience_url: str,
+        name: str,
+        html: str,
+        experience_entries: List[Dict],
+    ):
+        """Store a fetched page and its parsed entries"""
+        if self.mode == "bypass":
+            return
+
+        path = self._path(experience_url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "experience_url": experience_url,
+            "fetched_at": time.time(),
+            "name": name,
+            "html": html,
+            "experience_entries": experience_entries,
+        }
+
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f)
+        # Eviction orders files by mtime, on the same clock as get()'s touch
+        os.utime(tmp_path, (entry["fetched_at"], entry["fetched_at"]))
+
+        with self._lock:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += os.path.getsize(path) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _list_files(self) -> List[str]:
+        paths = []
+        for root, _, files in os.walk(self.cache_dir):
+            for filename in files:
+                if filename.endswith(".json.gz"):
+                    paths.append(os.path.join(root, filename))
+        return paths
+
+    def _scan_size(self) -> int:
+        return sum(os.path.getsize(path) for path in self._list_files())
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        files = []
+        for path in self._list_files():
+            stat = os.stat(path)
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._total_bytes = total
+
+    def clear(self):
+        """Delete every cached page"""
+        with self._lock:
+            for path in self._list_files():
+                os.remove(path)
+            self._total_bytes = 0
+
+    def usage(self) -> Dict:
+        """Number of cached pages and their size on disk"""
+        with self._lock:
+            paths = self._list_files()
+            return {
+                "entries": len(paths),
+                "bytes": sum(os.path.getsize(path) for path in paths),
+            }
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this cache instance"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "mode": self.mode,
+            }
@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+
+from linkedin_finder.instrumentation import metrics
+
+SEARCH_RESULTS_SELECTOR = (
+    "ul.eXOGCNtWZCUfVkYFgXYYeCjJSoAhEDHk li.nrxCTNBwEvLjnjUMRDlltdOsOQfMBkCNfDFxZfpE"
+)
+EXPERIENCE_ENTRIES_SELECTOR = (
+    "li.pvs-list__paged-list-item, "
+    "li[id*='EXPERIENCE-VIEW-DETAILS-profile'], "
+    ".artdeco-empty-state"
+)
+
+_wait_records: List[Dict] = []
+_records_lock = threading.Lock()
+
+
+def get_ready_timeout_ms() -> int:
+    """Ceiling for readiness waits, from PAGE_READY_TIMEOUT_MS (default 6000)"""
+    return int(os.getenv("PAGE_READY_TIMEOUT_MS", "6000"))
+
+
+def wait_for_ready(
+    page: Page, selector: str, label: str, timeout_ms: Optional[int] = None
+) -> bool:
+    """Wait until selector is present on the page, up to a ceiling timeout.
+
+    Returns as soon as the content appears instead of sleeping a fixed
+    amount. Every wait is recorded with its label and actual duration.
+    Returns False when the ceiling was hit.
+    """
+    if timeout_ms is None:
+        timeout_ms = get_ready_timeout_ms()
+
+    start = time.perf_counter()
+    ready = True
+    try:
+        page.wait_for_selector(selector, state="attached", timeout=timeout_ms)
+    except PlaywrightTimeoutError:
+        ready = False
+    elapsed = time.perf_counter() - start
+    metrics.observe(f"wait_{label.replace(' ', '_')}", elapsed)
+    if not ready:
+        metrics.increment("page_wait_timeouts")
+
+    with _records_lock:
+        _wait_records.append(
+            {"label": label, "seconds": elapsed, "ready": ready, "url": page.url}
+        )
+
+    if ready:
+        print(f"⏱️ {label} ready after {elapsed:.2f}s")
+    else:
+        print(f"⏱️ {label} not ready after {timeout_ms}ms ceiling, continuing")
+    return ready
+
+
+def get_wait_records() -> List[Dict]:
+    """Return a copy of every recorded wait"""
+    with _records_lock:
+        return list(_wait_records)
+
+
+def reset_wait_records():
+    """Forget all recorded waits"""
+    with _records_lock:
+        _wait_records.clear()
+
+
+def summarize_waits() -> Dict[str, Dict]:
+    """Aggregate recorded waits per label"""
+    summary: Dict[str, Dict] = {}
+    for record in get_wait_records():
+        stats = summary.setdefault(
+            record["label"],
+            {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "timeouts": 0},
+        )
+        stats["count"] += 1
+        stats["total_seconds"] += record["seconds"]
+        stats["max_seconds"] = max(stats["max_seconds"], record["seconds"])
+        if not record["ready"]:
+            stats["timeouts"] += 1
+
+    for stats in summary.values():
+        stats["avg_seconds"] = stats["total_seconds"] / stats["count"]
+    return summary
+
+
+def print_wait_summary():
+    """Print per-label wait statistics"""
+    for label, stats in summarize_waits().items():
+        print(
+            f"⏱️ {label}: {stats['count']} waits, avg {stats['avg_seconds']:.2f}s, "
+            f"max {stats['max_seconds']:.2f}s, {stats['timeouts']} hit the ceiling"
+        )
@@ -0,0 +1,322 @@
+import datetime
+import os
+import time
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlparse
+
+from playwright.sync_api import Page, Response, TimeoutError as PlaywrightTimeoutError
+
+# Profile pages load their data from LinkedIn's internal API as normalized
+# JSON: the entities are listed under "included", each tagged with "$type"
+PAYLOAD_PATH = "/voyager/api/"
+POSITION_TYPES = (
+    "com.linkedin.voyager.dash.identity.profile.Position",
+    "com.linkedin.voyager.identity.profile.Position",
+)
+PROFILE_TYPES = (
+    "com.linkedin.voyager.dash.identity.profile.Profile",
+    "com.linkedin.voyager.identity.profile.Profile",
+)
+
+MONTH_NAMES = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+
+def get_profile_source() -> str:
+    """Where profile data comes from, from PROFILE_SOURCE (default dom).
+
+    "network" reads the JSON the page fetches and falls back to the DOM
+    when it doesn't cover the whole profile in time; "dom" always extracts
+    from the rendered page.
+    """
+    source = os.getenv("PROFILE_SOURCE", "dom").lower()
+    if source not in ("dom", "network"):
+        raise ValueError(
+            f"❌ Unknown PROFILE_SOURCE '{source}'. Use 'dom' or 'network'."
+        )
+    return source
+
+
+def get_payload_timeout_ms() -> int:
+    """How long to wait for complete profile payloads, from PAYLOAD_TIMEOUT_MS (default 3000)"""
+    return int(os.getenv("PAYLOAD_TIMEOUT_MS", "3000"))
+
+
+def is_profile_payload(response: Response) -> bool:
+    """Whether a response is a JSON payload from LinkedIn's profile API"""
+    if PAYLOAD_PATH not in response.url or not response.ok:
+        return False
+    content_type = response.headers.get("content-type", "")
+    return "json" in content_type
+
+
+def _format_date(date: Optional[Dict]) -> str:
+    if not date or not date.get("year"):
+        return ""
+    month = date.get("month")
+    if month and 1 <= month <= 12:
+        return f"{MONTH_NAMES[month - 1]} {date['year']}"
+    return str(date["year"])
+
+
+def _format_tenure(months: int) -> str:
+    """Tenure the way LinkedIn prints it, e.g. "2 yrs 3 mos" """
+    years, months = divmod(max(1, months), 12)
+    parts = []
+    if years:
+        parts.append(f"{years} yr{'s' if years > 1 else ''}")
+    if months:
+        parts.append(f"{months} mo{'s' if months > 1 else ''}")
+    return " ".join(parts)
+
+
+def format_date_range(date_range: Optional[Dict]) -> str:
+    """Render a payload date range like the experience page does,
+    e.g. "Jan 2020 - Present · 4 yrs 2 mos" """
+    if not date_range:
+        return ""
+    start = date_range.get("start") or date_range.get("startDate")
+    end = date_range.get("end") or date_range.get("endDate")
+    start_text = _format_date(start)
+    if not start_text:
+        return ""
+
+    end_text = _format_date(end) or "Present"
+    if end and end.get("year"):
+        end_year, end_month = end["year"], end.get("month") or 12
+    else:
+        today = datetime.date.today()
+        end_year, end_month = today.year, today.month
+    # LinkedIn counts both the first and the last month
+    months = (end_year - start["year"]) * 12 + end_month - (start.get("month") or 1) + 1
+    return f"{start_text} - {end_text} · {_format_tenure(months)}"
+
+
+def _employment_type(position: Dict, entities: Dict[str, Dict]) -> str:
+    employment_type = position.get("employmentType")
+    if isinstance(employment_type, dict):
+        return employment_type.get("name", "")
+    if isinstance(employment_type, str):
+        return employment_type
+    referenced = entities.get(position.get("*employmentType", ""))
+    return referenced.get("name", "") if referenced else ""
+
+
+def _position_entry(position: Dict, entities: Dict[str, Dict]) -> Optional[Dict]:
+    """Map a Position entity to the entry dict extract_experience_data produces"""
+    entry = {"title": (position.get("title") or "").strip()}
+    company = (position.get("companyName") or "").strip()
+    if company:
+        entry["company"] = company
+        employment_type = _employment_type(position, entities)
+        if employment_type:
+            entry["employment_type"] = employment_type
+    entry["duration"] = format_date_range(
+        position.get("dateRange") or position.get("timePeriod")
+    )
+    entry["location"] = (position.get("locationName") or "").strip()
+    entry["description"] = (
+        position.get("description") or ""
+    ).strip() or "No detailed description provided"
+    if entry["title"] or entry.get("company"):
+        return entry
+    return None
+
+
+def profile_public_identifier(profile_url: str) -> Optional[str]:
+    """The public identifier (vanity slug) in a /in/<slug>/ profile URL"""
+    path = urlparse(profile_url).path
+    if "/in/" not in path:
+        return None
+    slug = path.split("/in/", 1)[1].split("/", 1)[0]
+    return unquote(slug).lower() or None
+
+
+def _paging_total(data) -> Optional[int]:
+    """The "total" of the first paging block in a payload's data, if any"""
+    if isinstance(data, dict):
+        paging = data.get("paging")
+        if isinstance(paging, dict) and isinstance(paging.get("total"), int):
+            return paging["total"]
+        values = data.values()
+    elif isinstance(data, list):
+        values = data
+    else:
+        return None
+    for value in values:
+        total = _paging_total(value)
+        if total is not None:
+            return total
+    return None
+
+
+def _profile_id(urn: str) -> str:
+    return urn.rsplit(":", 1)[-1]
+
+
+def _owner_id(position: Dict) -> Optional[str]:
+    """Id of the profile a Position entity belongs to, when its URNs say so"""
+    if position.get("profileUrn"):
+        return _profile_id(position["profileUrn"])
+    urn = position.get("entityUrn", "")
+    if "(" in urn and "," in urn:
+        # e.g. urn:li:fsd_profilePosition:(ACoAA...,2040519345)
+        return urn.split("(", 1)[1].split(",", 1)[0]
+    return None
+
+
+def parse_profile_payloads(
+    payloads: List[Dict], public_identifier: Optional[str] = None
+) -> Optional[Dict]:
+    """Pull the name and experience entries out of profile API payloads.
+
+    A page fetches many payloads: some unrelated, some about other people
+    (e.g. "people also viewed"), and positions may arrive over several
+    pages. Only positions of the profile whose publicIdentifier matches
+    public_identifier (or, without one, the first profile seen) are kept.
+
+    Returns {"name", "experience_entries", "complete"}, where complete means
+    the profile itself was seen and every position its paging total
+    announced has arrived, or None when there are no positions at all.
+    """
+    entities: Dict[str, Dict] = {}
+    profiles: List[Dict] = []
+    position_groups: List[tuple] = []
+    for payload in payloads:
+        positions = []
+        for entity in payload.get("included") or []:
+            if not isinstance(entity, dict):
+                continue
+            urn = entity.get("entityUrn")
+            if urn:
+                if urn in entities:
+                    continue
+                entities[urn] = entity
+            entity_type = entity.get("$type", "")
+            if entity_type in POSITION_TYPES:
+                positions.append(entity)
+            elif entity_type in PROFILE_TYPES:
+                profiles.append(entity)
+        if positions:
+            position_groups.append((positions, _paging_total(payload.get("data"))))
+
+    profile = next(
+        (
+            entity
+            for entity in profiles
+            if public_identifier is None
+            or (entity.get("publicIdentifier") or "").lower() == public_identifier
+        ),
+        None,
+    )
+
+    # Drop positions that belong to anyone else seen in the payloads
+    foreign_ids = {
+        _profile_id(entity["entityUrn"])
+        for entity in profiles
+        if entity is not profile and entity.get("entityUrn")
+    }
+    target_id = (
+        _profile_id(profile["entityUrn"])
+        if profile is not None and profile.get("entityUrn")
+        else None
+    )
+
+    positions: List[Dict] = []
+    expected_total = None
+    for group, total in position_groups:
+        group = [
+            position
+            for position in group
+            if _owner_id(position) is None
+            or _owner_id(position) == target_id
+            or (target_id is None and _owner_id(position) not in foreign_ids)
+        ]
+        if group and total is not None:
+            expected_total = max(expected_total or 0, total)
+        positions.extend(group)
+
+    entries = [
+        entry
+        for entry in (_position_entry(position, entities) for position in positions)
+        if entry is not None
+    ]
+    if not entries:
+        return None
+
+    name = None
+    if profile is not None:
+        name = " ".join(
+            part for part in (profile.get("firstName"), profile.get("lastName")) if part
+        )
+    return {
+        "name": name or "Unknown",
+        "experience_entries": entries,
+        "complete": bool(name)
+        and (expected_total is None or len(positions) >= expected_total),
+    }
+
+
+class ProfilePayloadListener:
+    """Collects profile API responses a page receives between start() and stop().
+
+    Like TrafficMeter, the event handler only keeps the responses; their
+    bodies are read afterwards, outside Playwright's event dispatch.
+    """
+
+    def __init__(self, page: Page, public_identifier: Optional[str] = None):
+        self.page = page
+        self.public_identifier = public_identifier
+        self.payloads: List[Dict] = []
+        self._responses: List[Response] = []
+        self._read = 0
+
+    def _on_response(self, response: Response):
+        if is_profile_payload(response):
+            self._responses.append(response)
+
+    def _read_new(self):
+        while self._read < len(self._responses):
+            response = self._responses[self._read]
+            self._read += 1
+            try:
+                payload = response.json()
+            except Exception:
+                continue
+            if isinstance(payload, dict):
+                self.payloads.append(payload)
+
+    def start(self) -> "ProfilePayloadListener":
+        self.page.on("response", self._on_response)
+        return self
+
+    def collect(self, timeout_ms: Optional[int] = None) -> Optional[Dict]:
+        """Wait until the payloads describe the whole profile.
+
+        Keeps listening as payloads arrive and returns the parsed profile as
+        soon as it is complete. At the deadline, returns whatever could be
+        parsed so far (possibly incomplete, or None).
+        """
+        if timeout_ms is None:
+            timeout_ms = get_payload_timeout_ms()
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            self._read_new()
+            parsed = parse_profile_payloads(self.payloads, self.public_identifier)
+            if parsed is not None and parsed["complete"]:
+                return parsed
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                return parsed
+            try:
+                self.page.wait_for_event(
+                    "response", predicate=is_profile_payload, timeout=remaining_ms
+                )
+            except PlaywrightTimeoutError:
+                pass
+
+    def stop(self):
+        """Detach from the page"""
+        self.page.remove_listener("response", self._on_response)
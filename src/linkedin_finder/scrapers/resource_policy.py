@@ -0,0 +1,133 @@
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from playwright.sync_api import BrowserContext, Page, Request, Route
+
+from linkedin_finder.instrumentation import metrics
+
+# We only read text, so anything purely visual can be dropped
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    r"doubleclick\.net",
+    r"googletagmanager\.com",
+    r"google-analytics\.com",
+    r"googlesyndication\.com",
+    r"px\.ads\.linkedin\.com",
+    r"ads\.linkedin\.com",
+    r"snap\.licdn\.com",
+    r"/li/track",
+    r"/tscp-serving/",
+    r"bat\.bing\.com",
+    r"connect\.facebook\.net",
+)
+
+
+def _split_env(name: str) -> Optional[List[str]]:
+    value = os.getenv(name)
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class ResourcePolicy:
+    """Aborts browser requests for resource types and URLs we never read.
+
+    Installed on a browser context through Playwright route interception.
+    """
+
+    def __init__(
+        self,
+        blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        blocked_url_patterns: Iterable[str] = DEFAULT_BLOCKED_URL_PATTERNS,
+    ):
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        patterns = list(blocked_url_patterns)
+        self._url_re = re.compile("|".join(patterns)) if patterns else None
+        self.blocked = 0
+        self.allowed = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResourcePolicy"]:
+        """Build the policy from RESOURCE_POLICY, BLOCKED_RESOURCE_TYPES and BLOCKED_URL_PATTERNS.
+
+        RESOURCE_POLICY=off disables interception entirely.
+        """
+        if os.getenv("RESOURCE_POLICY", "default").lower() == "off":
+            return None
+        resource_types = _split_env("BLOCKED_RESOURCE_TYPES")
+        url_patterns = _split_env("BLOCKED_URL_PATTERNS")
+        return cls(
+            DEFAULT_BLOCKED_RESOURCE_TYPES if resource_types is None else resource_types,
+            DEFAULT_BLOCKED_URL_PATTERNS if url_patterns is None else url_patterns,
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        return bool(self._url_re and self._url_re.search(url))
+
+    def install(self, context: BrowserContext):
+        context.route("**/*", self._handle_route)
+
+    def _handle_route(self, route: Route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            with self._lock:
+                self.blocked += 1
+            metrics.increment("requests_blocked")
+            route.abort()
+        else:
+            with self._lock:
+                self.allowed += 1
+            route.continue_()
+
+
+class TrafficMeter:
+    """Counts the bytes a page transfers between start() and stop().
+
+    Finished requests are only collected inside the event handler; their
+    sizes are fetched afterwards, outside Playwright's event dispatch.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self._finished: List[Request] = []
+        self.failed = 0
+
+    def _on_finished(self, request: Request):
+        self._finished.append(request)
+
+    def _on_failed(self, request: Request):
+        self.failed += 1
+
+    def start(self) -> "TrafficMeter":
+        self.page.on("requestfinished", self._on_finished)
+        self.page.on("requestfailed", self._on_failed)
+        return self
+
+    def stop(self) -> Dict:
+        """Detach from the page and return request count, bytes and failures"""
+        self.page.remove_listener("requestfinished", self._on_finished)
+        self.page.remove_listener("requestfailed", self._on_failed)
+
+        total_bytes = 0
+        for request in self._finished:
+            try:
+                sizes = request.sizes()
+            except Exception:
+                continue
+            total_bytes += (
+                sizes.get("requestHeadersSize", 0)
+                + sizes.get("requestBodySize", 0)
+                + sizes.get("responseHeadersSize", 0)
+                + sizes.get("responseBodySize", 0)
+            )
+        return {
+            "requests": len(self._finished),
+            "bytes": total_bytes,
+            "failed_requests": self.failed,
+        }
@@ -0,0 +1,255 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+TASK_STATUSES = ("pending", "leased", "done", "failed")
+
+
+def get_work_queue_path() -> str:
+    """SQLite file backing the work queue, from WORK_QUEUE_PATH"""
+    return os.getenv("WORK_QUEUE_PATH", os.path.join(".cache", "work_queue.sqlite3"))
+
+
+class WorkQueue:
+    """Durable task queue shared by a coordinator and worker processes.
+
+    Tasks live in a SQLite table (WAL mode, so several processes can use it
+    at once). A worker claims a task by taking a lease on it; while working
+    it renews the lease with heartbeat(). A task whose lease runs out, e.g.
+    because its worker crashed, can be claimed again. Failed tasks are
+    retried after a backoff until max_attempts is reached, then marked
+    failed. Tasks are unique per (kind, key), so enqueueing the same work
+    twice, or rerunning a coordinator, never duplicates it.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+    ):
+        self.path = path or get_work_queue_path()
+        self.lease_seconds = (
+            lease_seconds
+            if lease_seconds is not None
+            else float(os.getenv("WORK_LEASE_SECONDS", "120"))
+        )
+        self.max_attempts = (
+            max_attempts
+            if max_attempts is not None
+            else int(os.getenv("WORK_MAX_ATTEMPTS", "3"))
+        )
+        self.retry_backoff = (
+            retry_backoff
+            if retry_backoff is not None
+            else float(os.getenv("WORK_RETRY_BACKOFF_SECONDS", "5"))
+        )
+
+        # Workers heartbeat from a second thread over the same connection
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Transactions are managed explicitly so claims can take a write lock
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                lease_owner TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                UNIQUE (kind, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (status, kind, available_at)"
+        )
+
+    def enqueue(self, kind: str, key: str, payload: Dict) -> bool:
+        """Add a task; returns False if one with the same kind and key exists"""
+        with self._lock:
+            now = time.time()
+            cursor = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO tasks
+                    (kind, key, payload, max_attempts, available_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    kind,
+                    key,
+                    json.dumps(payload, ensure_ascii=False),
+                    self.max_attempts,
+                    now,
+                    now,
+                ),
+            )
+            return cursor.rowcount > 0
+
+    def claim(self, worker_id: str, kinds: Sequence[str]) -> Optional[Dict]:
+        """Lease the oldest available task of one of the given kinds.
+
+        Tasks whose lease has expired count as available; those that have
+        used up their attempts are marked failed instead.
+        """
+        with self._lock:
+            now = time.time()
+            placeholders = ",".join("?" for _ in kinds)
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    f"""
+                    UPDATE tasks SET status = 'failed', updated_at = ?,
+                        error = COALESCE(error, 'lease expired')
+                    WHERE status = 'leased' AND lease_expires < ?
+                        AND attempts >= max_attempts AND kind IN ({placeholders})
+                    """,
+                    (now, now, *kinds),
+                )
+                row = self._conn.execute(
+                    f"""
+                    SELECT id, kind, key, payload, attempts FROM tasks
+                    WHERE kind IN ({placeholders}) AND (
+                        (status = 'pending' AND available_at <= ?)
+                        OR (status = 'leased' AND lease_expires < ?)
+                    )
+                    ORDER BY id LIMIT 1
+                    """,
+                    (*kinds, now, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    """
+                    UPDATE tasks SET status = 'leased', attempts = attempts + 1,
+                        lease_owner = ?, lease_expires = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (worker_id, now + self.lease_seconds, now, row[0]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            return {
+                "id": row[0],
+                "kind": row[1],
+                "key": row[2],
+                "payload": json.loads(row[3]),
+                "attempt": row[4] + 1,
+            }
+
+    def heartbeat(self, task_id: int, worker_id: str) -> bool:
+        """Extend a lease; False if the worker no longer holds it"""
+        with self._lock:
+            now = time.time()
+            cursor = self._conn.execute(
+                """
+                UPDATE tasks SET lease_expires = ?, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (now + self.lease_seconds, now, task_id, worker_id),
+            )
+            return cursor.rowcount > 0
+
+    def complete(self, task_id: int, worker_id: str, result: Dict) -> bool:
+        """Store a task's result; False if the lease was lost to another worker"""
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE tasks SET status = 'done', result = ?, error = NULL,
+                    lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (
+                    json.dumps(result, ensure_ascii=False),
+                    time.time(),
+                    task_id,
+                    worker_id,
+                ),
+            )
+            return cursor.rowcount > 0
+
+    def fail(self, task_id: int, worker_id: str, error: str) -> bool:
+        """Record a failed attempt, scheduling a retry with exponential backoff"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attempts, max_attempts FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            attempts, max_attempts = row
+            now = time.time()
+            status = "pending" if attempts < max_attempts else "failed"
+            delay = self.retry_backoff * (2 ** (attempts - 1))
+            cursor = self._conn.execute(
+                """
+                UPDATE tasks SET status = ?, error = ?, available_at = ?,
+                    lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (status, error, now + delay, now, task_id, worker_id),
+            )
+            return cursor.rowcount > 0
+
+    def tasks(self, kind: str, key_prefix: str = "") -> List[Dict]:
+        """Every task of a kind whose key starts with key_prefix, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT id, key, payload, status, attempts, result, error FROM tasks
+                WHERE kind = ? AND substr(key, 1, ?) = ?
+                ORDER BY id
+                """,
+                (kind, len(key_prefix), key_prefix),
+            ).fetchall()
+            return [
+                {
+                    "id": row[0],
+                    "key": row[1],
+                    "payload": json.loads(row[2]),
+                    "status": row[3],
+                    "attempts": row[4],
+                    "result": json.loads(row[5]) if row[5] is not None else None,
+                    "error": row[6],
+                }
+                for row in rows
+            ]
+
+    def counts(self, key_prefix: str = "") -> Dict[str, Dict[str, int]]:
+        """Task counts by kind and status"""
+        with self._lock:
+            counts: Dict[str, Dict[str, int]] = {}
+            for kind, status, count in self._conn.execute(
+                """
+                SELECT kind, status, COUNT(*) FROM tasks
+                WHERE substr(key, 1, ?) = ? GROUP BY kind, status
+                """,
+                (len(key_prefix), key_prefix),
+            ):
+                counts.setdefault(kind, dict.fromkeys(TASK_STATUSES, 0))[status] = count
+            return counts
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
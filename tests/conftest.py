@@ -0,0 +1,8 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "src"), os.path.join(ROOT, "benchmarks")]
+
+# Don't let litellm try to download its model price list during tests
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
@@ -0,0 +1,79 @@
+import pytest
+
+from linkedin_finder.instrumentation import metrics
+from linkedin_finder.llm.analyzer import (
+    analyze_candidate_experience,
+    complete_with_retry,
+)
+from linkedin_finder.llm.verdict import parse_verdict
+from linkedin_finder.llm.verdict_cache import VerdictCache
+from linkedin_finder.results_store import build_result_record
+from mock_llm import MOCK_MODEL, register_mock_llm
+
+MESSAGES = [{"role": "user", "content": "Review this cyber security engineer."}]
+
+
+@pytest.fixture
+def enabled_metrics(monkeypatch):
+    register_mock_llm(0)
+    monkeypatch.setattr(metrics, "_enabled", True)
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+@pytest.mark.parametrize("stop_after_reason", [False, True])
+def test_streamed_completions_record_token_usage(enabled_metrics, stop_after_reason):
+    complete_with_retry(
+        MOCK_MODEL, MESSAGES, stream=True, stop_after_reason=stop_after_reason
+    )
+    counters = enabled_metrics.summary()["counters"]
+    assert counters["llm_prompt_tokens"] > 0
+    assert counters["llm_completion_tokens"] > 0
+    # Only a stream cut short misses the provider's usage chunk
+    assert ("llm_usage_estimated" in counters) == stop_after_reason
+
+
+def test_result_record_reason_stops_at_the_next_field():
+    analysis = (
+        "**REASON:** Five years of incident response.\n"
+        "**RECOMMENDATION:** SHORTLIST"
+    )
+    profile = {"name": "A", "profile_url": "u", "experience_url": "e"}
+    record = build_result_record(profile, "", analysis, True, model="m")
+    assert record["reason"] == "Five years of incident response."
+
+
+def test_reason_starting_with_a_label_is_kept():
+    verdict = parse_verdict(
+        "RECOMMENDATION: SHORTLIST\nREASON: AWS: 5 years of cloud security."
+    )
+    assert verdict.reason == "AWS: 5 years of cloud security."
+
+
+def test_multi_line_reason_is_not_cut_at_a_labelled_line():
+    verdict = parse_verdict(
+        "RECOMMENDATION: SHORTLIST\n"
+        "REASON: Strong security background.\n"
+        "CISSP: certified since 2019."
+    )
+    assert verdict.reason == (
+        "Strong security background.\nCISSP: certified since 2019."
+    )
+
+
+
+def test_cached_single_candidate_verdict_is_reused(monkeypatch, tmp_path):
+    mock = register_mock_llm(0)
+    monkeypatch.setenv("LLM_MODEL_NAME", MOCK_MODEL)
+    cache = VerdictCache(path=str(tmp_path / "verdicts.sqlite3"), mode="use")
+    first = analyze_candidate_experience(
+        "Penetration tester at Acme", "Security Engineer", cache=cache, stream=False
+    )
+    second = analyze_candidate_experience(
+        "Penetration tester at Acme", "Security Engineer", cache=cache, stream=False
+    )
+    assert first.is_shortlisted
+    assert second == first
+    assert mock.calls == 1
+    cache.close()
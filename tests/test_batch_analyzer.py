@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from linkedin_finder.llm import batch_analyzer
+from linkedin_finder.llm.batch_analyzer import (
+    _build_batch_messages,
+    analyze_candidates_batched,
+    pack_batches,
+    parse_batch_response,
+)
+from linkedin_finder.llm.verdict import Verdict
+from linkedin_finder.llm.verdict_cache import VerdictCache
+from mock_llm import MOCK_MODEL, register_mock_llm
+
+TEXTS = [
+    "Penetration tester at Acme",
+    "Barista at Cafe",
+    "Cyber security analyst at Bank",
+]
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    cache = VerdictCache(path=str(tmp_path / "verdicts.sqlite3"), mode="use")
+    monkeypatch.setattr(batch_analyzer, "get_verdict_cache", lambda: cache)
+    monkeypatch.setenv("LLM_MODEL_NAME", MOCK_MODEL)
+    yield cache
+    cache.close()
+
+
+def _reply(*verdicts):
+    return json.dumps(
+        [
+            {"candidate_id": candidate_id, "recommendation": rec, "reason": "r"}
+            for candidate_id, rec in verdicts
+        ]
+    )
+
+
+def test_parse_batch_response_renders_single_candidate_analyses():
+    content = "```json\n" + _reply((0, "shortlist"), (1, "REJECT")) + "\n```"
+    assert parse_batch_response(content, [0, 1]) == {
+        0: "RECOMMENDATION: SHORTLIST\nREASON: r",
+        1: "RECOMMENDATION: REJECT\nREASON: r",
+    }
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "not json",
+        '{"candidate_id": 0}',
+        _reply((0, "SHORTLIST")),
+        _reply((0, "SHORTLIST"), (1, "MAYBE")),
+        _reply((0, "SHORTLIST"), (1, "REJECT"), (2, "REJECT")),
+        _reply((0, "SHORTLIST"), (1, "REJECT"), (1, "SHORTLIST")),
+    ],
+    ids=["empty", "prose", "object", "missing", "bad-rec", "extra", "duplicate"],
+)
+def test_parse_batch_response_rejects_malformed_replies(content):
+    assert parse_batch_response(content, [0, 1]) is None
+
+
+def test_pack_batches_respects_budget_and_candidate_cap(monkeypatch):
+    monkeypatch.setattr(batch_analyzer, "count_tokens", lambda text, model=None: len(text))
+    base = len(batch_analyzer.BATCH_INSTRUCTIONS.format(search_query="q"))
+    block = len(batch_analyzer._format_candidate_block(0, "x" * 10))
+
+    assert pack_batches(["x" * 10] * 5, "q", base + 10 * block, 2, MOCK_MODEL) == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+    assert pack_batches(["x" * 10] * 3, "q", base + 2 * block, 8, MOCK_MODEL) == [
+        [0, 1],
+        [2],
+    ]
+    # Too big for any batch, but still gets a batch of its own
+    assert pack_batches(["x" * 10, "y" * 500], "q", base + block, 8, MOCK_MODEL) == [
+        [0],
+        [1],
+    ]
+
+
+def test_malformed_batch_reply_falls_back_to_single_calls(monkeypatch, cache):
+    async def malformed(*args, **kwargs):
+        return "Sorry, here are my thoughts on each candidate..."
+
+    single_calls = []
+
+    async def single(experience_text, search_query, **kwargs):
+        single_calls.append(experience_text)
+        return Verdict("REJECT", "single", "RECOMMENDATION: REJECT\nREASON: single")
+
+    monkeypatch.setattr(batch_analyzer, "acomplete_with_retry", malformed)
+    monkeypatch.setattr(batch_analyzer, "analyze_candidate_experience_async", single)
+
+    results = analyze_candidates_batched(TEXTS, "Security Engineer")
+    assert sorted(single_calls) == sorted(TEXTS)
+    assert [verdict.reason for verdict, error in results] == ["single"] * 3
+    assert cache.stats()["hits"] == 0
+    # The unusable reply is not cached
+    key = VerdictCache.make_key(
+        MOCK_MODEL, _build_batch_messages(TEXTS, "Security Engineer")
+    )
+    assert cache.get(key) is None
+
+
+def test_batch_verdicts_are_cached_under_the_batch_prompt(cache):
+    mock = register_mock_llm(0)
+    first = analyze_candidates_batched(TEXTS, "Security Engineer")
+    assert [verdict.is_shortlisted for verdict, error in first] == [True, False, True]
+    assert mock.calls == 1
+
+    key = VerdictCache.make_key(
+        MOCK_MODEL, _build_batch_messages(TEXTS, "Security Engineer")
+    )
+    assert parse_batch_response(cache.get(key), [0, 1, 2]) is not None
+
+    second = analyze_candidates_batched(TEXTS, "Security Engineer")
+    assert [verdict for verdict, error in second] == [verdict for verdict, error in first]
+    assert mock.calls == 1
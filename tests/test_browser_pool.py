@@ -0,0 +1,48 @@
+import pytest
+
+from linkedin_finder.scrapers import browser_pool
+from linkedin_finder.scrapers.browser_pool import BrowserPool
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def new_context(self, storage_state):
+        raise RuntimeError(f"cannot read {storage_state}")
+
+    def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+        self.browser = _FakeBrowser()
+        self.stopped = False
+
+    def start(self):
+        return self
+
+    def launch(self, headless):
+        return self.browser
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_failed_worker_startup_closes_the_browser(monkeypatch, tmp_path):
+    launched = []
+
+    def fake_sync_playwright():
+        launched.append(_FakePlaywright())
+        return launched[-1]
+
+    monkeypatch.setattr(browser_pool, "sync_playwright", fake_sync_playwright)
+    pool = BrowserPool(size=2, storage_state=str(tmp_path / "missing.json"))
+    with pytest.raises(RuntimeError, match="cannot read"):
+        pool.start()
+
+    assert len(launched) == 2
+    assert all(playwright.browser.closed for playwright in launched)
+    assert all(playwright.stopped for playwright in launched)
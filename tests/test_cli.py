@@ -0,0 +1,11 @@
+from linkedin_finder.cli import main
+
+
+def test_cache_stats_does_not_create_missing_caches(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LLM_CACHE_PATH", raising=False)
+    monkeypatch.delenv("PAGE_CACHE_DIR", raising=False)
+
+    assert main(["cache", "stats"]) == 0
+    assert "verdicts: 0 entries" in capsys.readouterr().out
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from linkedin_finder.llm import concurrent_analyzer
+from linkedin_finder.llm.concurrent_analyzer import (
+    analyze_candidates_concurrently,
+    stream_candidate_analyses,
+)
+from linkedin_finder.llm.verdict import Verdict
+
+TEXTS = [f"candidate {i}" for i in range(8)]
+
+
+@pytest.fixture
+def fake_analysis(monkeypatch):
+    """Later candidates answer first, and "candidate 3" fails"""
+    in_flight = {"now": 0, "peak": 0}
+
+    async def analyze(experience_text, search_query, **kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            index = int(experience_text.split()[-1])
+            await asyncio.sleep(0.01 * (len(TEXTS) - index))
+            if index == 3:
+                raise TimeoutError(experience_text)
+            return Verdict("SHORTLIST", experience_text, experience_text)
+        finally:
+            in_flight["now"] -= 1
+
+    monkeypatch.setattr(concurrent_analyzer, "analyze_candidate_experience_async", analyze)
+    return in_flight
+
+
+def test_concurrent_results_keep_input_order(fake_analysis):
+    results = analyze_candidates_concurrently(TEXTS, "Security Engineer", max_concurrency=4)
+    assert [verdict.reason if verdict else None for verdict, _ in results] == [
+        text if text != "candidate 3" else None for text in TEXTS
+    ]
+    assert isinstance(results[3][1], TimeoutError)
+    assert fake_analysis["peak"] == 4
+
+
+def test_streamed_results_keep_input_order(fake_analysis):
+    items = ((index, text) for index, text in enumerate(TEXTS))
+    results = list(stream_candidate_analyses(items, "Security Engineer", max_concurrency=4))
+    assert [item for item, _, _, _ in results] == list(range(len(TEXTS)))
+    assert [text for _, text, _, _ in results] == TEXTS
+    assert results[3][2] is None and isinstance(results[3][3], TimeoutError)
+    assert all(verdict.reason == text for _, text, verdict, _ in results if verdict)
+    assert fake_analysis["peak"] <= 4
@@ -0,0 +1,163 @@
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from linkedin_finder.work_queue import WorkQueue
+from mock_llm import MOCK_MODEL, register_mock_llm
+from stand_in_server import (
+    StandInConfig,
+    StandInServer,
+    browser_unavailable_reason,
+)
+
+SEARCH_QUERY = "Cyber Security Engineer"
+LOCATION = "Dublin, Ireland"
+
+
+@pytest.fixture
+def llm_env(monkeypatch):
+    monkeypatch.setenv("LLM_MODEL_NAME", MOCK_MODEL)
+    monkeypatch.setenv("LLM_CACHE_MODE", "bypass")
+    monkeypatch.setenv("RATE_LIMIT", "off")
+    monkeypatch.delenv("LLM_STREAMING", raising=False)
+
+
+def _profile(index: int) -> dict:
+    title = "Security Engineer" if index % 2 == 0 else "Pastry Chef"
+    return {
+        "name": f"Candidate {index}",
+        "profile_url": f"http://stand-in/in/candidate-{index}",
+        "experience_url": f"http://stand-in/in/candidate-{index}/details/experience/",
+        "experience_entries": [
+            {
+                "title": title,
+                "company": "Acme Technologies",
+                "duration": "Jan 2020 - Present · 4 yrs",
+                "location": "Dublin, Ireland",
+                "description": f"Worked as a {title.lower()}.",
+            }
+        ],
+    }
+
+
+def test_analyze_workers_settle_every_task_without_losing_leases(tmp_path, llm_env):
+    from linkedin_finder.distributed import run_worker
+
+    # Each reply takes longer than a lease, so only heartbeats keep the
+    # tasks from being claimed a second time
+    register_mock_llm(latency_ms=600)
+    queue_path = str(tmp_path / "work_queue.sqlite3")
+    queue = WorkQueue(queue_path, lease_seconds=0.3, max_attempts=1, retry_backoff=0)
+    profiles = [_profile(i) for i in range(8)]
+    for profile in profiles:
+        queue.enqueue(
+            "analyze",
+            f"job:{profile['profile_url']}",
+            {"profile": profile, "search_query": SEARCH_QUERY, "location": LOCATION},
+        )
+
+    errors = []
+
+    def work(index: int):
+        worker_queue = WorkQueue(queue_path, lease_seconds=0.3, max_attempts=1)
+        try:
+            run_worker(
+                worker_queue,
+                kinds=("analyze",),
+                worker_id=f"worker-{index}",
+                idle_exit_seconds=1.0,
+                poll_interval=0.05,
+            )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            worker_queue.close()
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not errors
+    tasks = queue.tasks("analyze")
+    queue.close()
+    assert len(tasks) == len(profiles)
+    for task in tasks:
+        assert task["status"] == "done", task["error"]
+        assert task["attempts"] == 1, f"lease lost on {task['key']}"
+        assert task["result"]["analysis"]
+    shortlisted = sorted(
+        task["payload"]["profile"]["name"]
+        for task in tasks
+        if task["result"]["is_shortlisted"]
+    )
+    assert shortlisted == [f"Candidate {i}" for i in range(0, 8, 2)]
+
+
+def test_coordinator_and_workers_against_stand_in(tmp_path, llm_env, monkeypatch):
+    reason = browser_unavailable_reason()
+    if reason:
+        pytest.skip(f"Chromium is not available: {reason}")
+
+    from linkedin_finder.distributed import run_coordinator
+    from linkedin_finder.journal import make_job_id
+    from run_benchmarks import _run_distributed_worker
+
+    profiles = 6
+    auth_file = tmp_path / "auth.json"
+    auth_file.write_text(json.dumps({"cookies": [], "origins": []}))
+    results_path = tmp_path / "results.jsonl"
+    queue_path = str(tmp_path / "work_queue.sqlite3")
+
+    with StandInServer(StandInConfig(total_profiles=profiles)) as server:
+        # Spawned workers inherit this environment
+        for name, value in {
+            "LINKEDIN_BASE_URL": server.base_url,
+            "LINKEDIN_AUTH_FILE": str(auth_file),
+            "HEADLESS": "1",
+            "PAGE_CACHE_MODE": "bypass",
+            "WORK_QUEUE_PATH": queue_path,
+            "WORK_POLL_SECONDS": "0.2",
+            "WORK_LEASE_SECONDS": "5",
+            "RESULTS_BACKEND": "jsonl",
+            "RESULTS_PATH": str(results_path),
+        }.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.chdir(tmp_path)
+
+        spawn = multiprocessing.get_context("spawn")
+        workers = [
+            spawn.Process(
+                target=_run_distributed_worker, args=(str(tmp_path), 50.0, 5.0)
+            )
+            for _ in range(3)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            counts = run_coordinator(SEARCH_QUERY, LOCATION, profiles)
+            for worker in workers:
+                worker.join(timeout=60)
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert counts["shortlisted"] + counts["rejected"] == profiles
+    with open(results_path, "r", encoding="utf-8") as f:
+        assert sum(1 for _ in f) == profiles
+
+    queue = WorkQueue(queue_path)
+    prefix = f"{make_job_id(SEARCH_QUERY, LOCATION)}:"
+    for kind in ("scrape", "analyze"):
+        tasks = queue.tasks(kind, prefix)
+        assert len(tasks) == profiles
+        for task in tasks:
+            assert task["status"] == "done", task["error"]
+            assert task["attempts"] == 1, f"lease lost on {kind} {task['key']}"
+    queue.close()
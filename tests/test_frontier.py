@@ -0,0 +1,57 @@
+import threading
+
+from linkedin_finder.scrapers.frontier import ProfileFrontier, normalize_profile_url
+
+BASE = "https://www.linkedin.com"
+
+
+def test_links_to_the_same_profile_normalize_to_one_key():
+    assert (
+        normalize_profile_url("/in/someone/?miniProfileUrn=abc#top", BASE)
+        == normalize_profile_url("HTTPS://WWW.LinkedIn.com/in/someone")
+        == "https://www.linkedin.com/in/someone"
+    )
+
+
+def test_profiles_are_queued_once_across_pages_and_resumed_runs():
+    # A resumed job passes in the profiles it already visited
+    frontier = ProfileFrontier([f"{BASE}/in/done"])
+    assert frontier.add([f"{BASE}/in/a", f"{BASE}/in/b", f"{BASE}/in/done"]) == 2
+    # The same people again on a later results page
+    assert frontier.add([f"{BASE}/in/b", f"{BASE}/in/c"]) == 1
+    frontier.finish()
+
+    drained = []
+    while (url := frontier.get()) is not None:
+        drained.append(url)
+    assert drained == [f"{BASE}/in/a", f"{BASE}/in/b", f"{BASE}/in/c"]
+    assert frontier.stats() == {"seen": 4, "queued": 0, "duplicates": 2}
+
+
+def test_a_new_frontier_does_not_remember_earlier_runs():
+    first = ProfileFrontier()
+    first.add([f"{BASE}/in/a"])
+    assert ProfileFrontier().add([f"{BASE}/in/a"]) == 1
+
+
+def test_harvester_waits_until_more_profiles_are_wanted():
+    frontier = ProfileFrontier()
+    frontier.set_demand(1)
+    frontier.add([f"{BASE}/in/a"])
+
+    resumed = threading.Event()
+
+    def harvester():
+        if frontier.wait_for_demand():
+            resumed.set()
+
+    thread = threading.Thread(target=harvester)
+    thread.start()
+    assert not resumed.wait(0.05)
+    frontier.set_demand(2)
+    assert resumed.wait(1)
+    thread.join()
+
+    frontier.stop()
+    assert not frontier.wait_for_demand()
+    assert frontier.get() is None
@@ -0,0 +1,60 @@
+import json
+
+from linkedin_finder import batch
+from linkedin_finder.instrumentation import Metrics, metrics
+
+
+def test_enabled_flag_is_read_on_first_use(monkeypatch):
+    monkeypatch.delenv("METRICS_ENABLED", raising=False)
+    lazy = Metrics()
+    # e.g. load_dotenv() running after the module was imported
+    monkeypatch.setenv("METRICS_ENABLED", "1")
+    assert lazy.enabled
+    assert not Metrics(enabled=False).enabled
+
+
+class _FakeSession:
+    profiles = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def test_batch_exports_metrics_once_for_all_jobs(monkeypatch, tmp_path):
+    json_path = tmp_path / "metrics.json"
+    monkeypatch.setenv("METRICS_JSON_PATH", str(json_path))
+    monkeypatch.setenv("METRICS_PROMETHEUS_PATH", str(tmp_path / "metrics.prom"))
+    monkeypatch.setattr(metrics, "_enabled", True)
+    monkeypatch.setattr(batch, "ScraperSession", _FakeSession)
+
+    def fake_run(search_query, location, max_profiles, session, export, **options):
+        # Stands in for the pipeline run; leaves metrics to the batch
+        assert export is False
+        metrics.increment("profiles_scraped", max_profiles)
+        return {"shortlisted": max_profiles, "rejected": 0}
+
+    monkeypatch.setattr(batch, "scrape_and_shortlist_linkedin", fake_run)
+    jobs = [
+        {"search_query": "Security Engineer", "location": "Dublin", "max_profiles": 2},
+        {"search_query": "Data Engineer", "location": "Paris", "max_profiles": 3},
+    ]
+    try:
+        batch.run_batch(jobs)
+        exported = json.loads(json_path.read_text())
+    finally:
+        metrics.reset()
+    assert exported["counters"]["profiles_scraped"] == 5
+
+
+def test_prometheus_counters_keep_full_precision(tmp_path):
+    exact = Metrics(enabled=True)
+    exact.increment("llm_prompt_tokens", 1234567)
+    exact.increment("llm_cost_usd", 0.1234567)
+    path = tmp_path / "metrics.prom"
+    exact.write_prometheus(str(path))
+    lines = path.read_text().splitlines()
+    assert "linkedin_finder_llm_prompt_tokens_total 1234567" in lines
+    assert "linkedin_finder_llm_cost_usd_total 0.1234567" in lines
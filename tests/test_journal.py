@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from linkedin_finder import main
+from linkedin_finder.journal import JobJournal
+from mock_llm import MOCK_MODEL, register_mock_llm
+
+PROFILES = [
+    {
+        "name": f"Candidate {i}",
+        "profile_url": f"https://www.linkedin.com/in/candidate-{i}/",
+        "experience_url": f"https://www.linkedin.com/in/candidate-{i}/details/experience/",
+        "experience_entries": [
+            {
+                "title": "Security Engineer" if i % 2 else "Barista",
+                "company": "Acme",
+                "duration": "2 yrs",
+                "description": "",
+            }
+        ],
+    }
+    for i in range(5)
+]
+
+
+class _Crash(Exception):
+    pass
+
+
+class _FakeScraper:
+    """Stands in for iter_linkedin_profiles, replaying the journal like it does"""
+
+    def __init__(self):
+        self.crash_after = None
+        self.visited = []
+
+    def __call__(self, search_query, location, max_profiles, journal, session):
+        yield from list(journal.scraped.values())
+        for profile in PROFILES:
+            if profile["profile_url"] in journal.scraped:
+                continue
+            if self.crash_after is not None and len(self.visited) == self.crash_after:
+                raise _Crash()
+            self.visited.append(profile["profile_url"])
+            journal.record_scraped(profile)
+            yield profile
+
+
+@pytest.fixture
+def pipeline(monkeypatch, tmp_path):
+    monkeypatch.setenv("JOURNAL_DIR", str(tmp_path / "journals"))
+    monkeypatch.setenv("RESULTS_PATH", str(tmp_path / "results.jsonl"))
+    # Journal every verdict as soon as it is written
+    monkeypatch.setenv("RESULTS_BATCH_SIZE", "1")
+    monkeypatch.setenv("LLM_MODEL_NAME", MOCK_MODEL)
+    monkeypatch.setenv("LLM_CACHE_MODE", "bypass")
+    scraper = _FakeScraper()
+    monkeypatch.setattr(main, "iter_linkedin_profiles", scraper)
+    return scraper
+
+
+def _run():
+    return main.scrape_and_shortlist_linkedin(
+        "Security Engineer",
+        "Dublin",
+        len(PROFILES),
+        max_concurrency=1,
+        stream=True,
+        results_backend="jsonl",
+        session=object(),
+        export=False,
+    )
+
+
+def test_interrupted_job_resumes_without_redoing_finished_profiles(pipeline, tmp_path):
+    mock = register_mock_llm(0)
+    pipeline.crash_after = 2
+    with pytest.raises(_Crash):
+        _run()
+    assert mock.calls == 2
+    journal = JobJournal("Security Engineer", "Dublin")
+    assert len(journal.scraped) == 2 and len(journal.analyzed) == 2
+    journal.close()
+
+    pipeline.crash_after = None
+    counts = _run()
+    assert counts == {"shortlisted": 2, "rejected": 3}
+    # Only the three profiles the first run never reached were scraped and scored
+    assert mock.calls == 5
+    assert pipeline.visited == [profile["profile_url"] for profile in PROFILES]
+    lines = (tmp_path / "results.jsonl").read_text().splitlines()
+    assert sorted(json.loads(line)["profile_url"] for line in lines) == sorted(
+        profile["profile_url"] for profile in PROFILES
+    )
+
+    # The finished job is not resumed again
+    journal = JobJournal("Security Engineer", "Dublin")
+    assert not journal.scraped and not journal.analyzed
+    journal.close()
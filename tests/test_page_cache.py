@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin_finder.scrapers import page_cache
+from linkedin_finder.scrapers.page_cache import ExperiencePageCache
+
+ENTRIES = [{"title": "Security Engineer", "company": "Acme"}]
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(page_cache, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+def _url(slug: str) -> str:
+    return f"https://www.linkedin.com/in/{slug}/details/experience/"
+
+
+def test_entries_expire_after_the_ttl(clock, tmp_path):
+    cache = ExperiencePageCache(str(tmp_path), ttl_seconds=100, mode="use")
+    cache.put(_url("a"), "A", "<html>a</html>", ENTRIES)
+
+    clock.now += 99
+    assert cache.get(_url("a"))["experience_entries"] == ENTRIES
+    clock.now += 2
+    assert cache.get(_url("a")) is None
+    assert cache.stats()["expired"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_least_recently_used_entry_is_evicted_first(clock, tmp_path):
+    cache = ExperiencePageCache(str(tmp_path), ttl_seconds=3600, mode="use")
+    cache.put(_url("a"), "A", "<html>a</html>", ENTRIES)
+    clock.now += 1
+    cache.put(_url("b"), "B", "<html>b</html>", ENTRIES)
+    clock.now += 1
+    # Reading "a" makes "b" the least recently used
+    assert cache.get(_url("a")) is not None
+
+    # Room for two entries but not three
+    cache.max_bytes = cache.usage()["bytes"] + 10
+    clock.now += 1
+    cache.put(_url("c"), "C", "<html>c</html>", ENTRIES)
+
+    assert cache.get(_url("b")) is None
+    assert cache.get(_url("a")) is not None
+    assert cache.get(_url("c")) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.usage()["entries"] == 2
@@ -0,0 +1,36 @@
+from linkedin_finder.llm.prescreen import prescreen_candidates
+
+
+def _candidate(title: str, description: str):
+    entries = [
+        {
+            "title": title,
+            "company": "Acme",
+            "duration": "Jan 2019 - Present · 6 yrs",
+            "description": description,
+        }
+    ]
+    text = f"Job Title: {title}\nDescription & Responsibilities:\n{description}"
+    return text, entries
+
+
+def test_default_cutoff_drops_candidates_unrelated_to_the_query(monkeypatch):
+    monkeypatch.delenv("PRESCREEN_MIN_SCORE", raising=False)
+    monkeypatch.delenv("PRESCREEN_TOP_K", raising=False)
+    candidates = [
+        _candidate("Security Engineer", "Threat modelling and cyber security reviews."),
+        _candidate("Head Chef", "Ran a busy kitchen and planned seasonal menus."),
+        _candidate("Penetration Tester", "Web application security assessments."),
+    ]
+    scores = prescreen_candidates(
+        [text for text, _ in candidates],
+        [entries for _, entries in candidates],
+        "Cyber Security Engineer",
+    )
+    assert [score["selected"] for score in scores] == [True, False, True]
+
+
+def test_explicit_zero_cutoff_keeps_everyone():
+    text, entries = _candidate("Head Chef", "Ran a busy kitchen.")
+    scores = prescreen_candidates([text], [entries], "Cyber Security Engineer", min_score=0)
+    assert scores[0]["selected"]
@@ -0,0 +1,155 @@
+import json
+import zlib
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from fixtures import experience_page, experience_payload_sequence
+from linkedin_finder.scrapers.experience_extractor import (
+    extract_experience_data,
+    parse_html,
+)
+from linkedin_finder.scrapers.profile_payloads import (
+    ProfilePayloadListener,
+    parse_profile_payloads,
+    profile_public_identifier,
+)
+from stand_in_server import (
+    StandInConfig,
+    StandInServer,
+    browser_unavailable_reason,
+)
+
+SLUG = "candidate-00007"
+NAME = "Candidate 00007"
+ENTRIES = 8
+SEED = zlib.crc32(SLUG.encode())
+
+
+def _sequence():
+    return [
+        payload
+        for _, payload in experience_payload_sequence(NAME, ENTRIES, SEED, SLUG)
+    ]
+
+
+def test_payload_sequence_matches_dom_extraction():
+    parsed = parse_profile_payloads(_sequence(), SLUG)
+    dom_entries = extract_experience_data(
+        parse_html(experience_page(NAME, ENTRIES, seed=SEED)["full"])
+    )
+
+    assert parsed["complete"]
+    assert parsed["name"] == NAME
+    assert [(e["title"], e["company"]) for e in parsed["experience_entries"]] == [
+        (e["title"], e["company"]) for e in dom_entries
+    ]
+
+
+@pytest.mark.parametrize("received", range(1, len(_sequence())))
+def test_partial_payload_sequence_is_incomplete(received):
+    parsed = parse_profile_payloads(_sequence()[:received], SLUG)
+    assert parsed is None or not parsed["complete"]
+    if parsed is not None:
+        # Someone else's positions are never mixed in
+        assert len(parsed["experience_entries"]) <= ENTRIES
+
+
+def test_other_profiles_are_ignored():
+    payloads = _sequence()
+    browsemap = next(p for p in payloads if "someone-else" in json.dumps(p))
+    parsed = parse_profile_payloads(payloads, SLUG)
+    other_titles = {
+        entity["title"] for entity in browsemap["included"] if "title" in entity
+    }
+    assert len(parsed["experience_entries"]) == ENTRIES
+    assert parsed["name"] != "Someone Else"
+    assert other_titles  # the fixture really does include foreign positions
+
+
+def test_public_identifier_from_url():
+    assert profile_public_identifier(f"https://x/in/{SLUG.upper()}/") == SLUG
+    assert profile_public_identifier("https://x/company/acme") is None
+
+
+class _Response:
+    def __init__(self, path, payload):
+        self.url = f"http://stand-in/voyager/api/{path}"
+        self.ok = True
+        self.headers = {"content-type": "application/vnd.linkedin.normalized+json+2.1"}
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class _FakePage:
+    """Delivers one response per wait, like a page loading its payloads"""
+
+    def __init__(self, responses):
+        self._pending = list(responses)
+        self._handlers = []
+
+    def on(self, event, handler):
+        self._handlers.append(handler)
+
+    def remove_listener(self, event, handler):
+        self._handlers.remove(handler)
+
+    def wait_for_event(self, event, predicate, timeout):
+        if not self._pending:
+            raise PlaywrightTimeoutError("timed out")
+        response = self._pending.pop(0)
+        for handler in list(self._handlers):
+            handler(response)
+        return response
+
+
+def test_listener_keeps_collecting_until_profile_is_complete():
+    responses = [
+        _Response(path, payload)
+        for path, payload in experience_payload_sequence(NAME, ENTRIES, SEED, SLUG)
+    ]
+    page = _FakePage(responses)
+    listener = ProfilePayloadListener(page, SLUG).start()
+    parsed = listener.collect(timeout_ms=1000)
+    listener.stop()
+
+    assert parsed["complete"]
+    assert parsed["name"] == NAME
+    assert len(parsed["experience_entries"]) == ENTRIES
+    assert not page._pending
+    assert not page._handlers
+
+
+def test_listener_reports_incomplete_when_profile_never_arrives():
+    sequence = experience_payload_sequence(NAME, ENTRIES, SEED, SLUG)[:-1]
+    page = _FakePage(_Response(path, payload) for path, payload in sequence)
+    listener = ProfilePayloadListener(page, SLUG).start()
+    parsed = listener.collect(timeout_ms=1000)
+    listener.stop()
+
+    assert parsed is not None and not parsed["complete"]
+
+
+def test_scrape_profile_reads_payloads_from_stand_in(tmp_path, monkeypatch):
+    reason = browser_unavailable_reason()
+    if reason:
+        pytest.skip(f"Chromium is not available: {reason}")
+
+    from playwright.sync_api import sync_playwright
+
+    from linkedin_finder.scrapers.linkedin_scraper import scrape_profile
+
+    monkeypatch.setenv("PROFILE_SOURCE", "network")
+    monkeypatch.setenv("RATE_LIMIT", "off")
+    with StandInServer(StandInConfig(total_profiles=10, payloads=True)) as server:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            page = browser.new_page()
+            profile = scrape_profile(page, f"{server.base_url}/in/{SLUG}")
+            browser.close()
+
+    assert profile["fetch_stats"]["source"] == "network"
+    assert profile["name"] == NAME
+    assert len(profile["experience_entries"]) == StandInConfig().entries_for(SLUG)
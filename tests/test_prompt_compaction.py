@@ -0,0 +1,41 @@
+from linkedin_finder.llm.analyzer import count_tokens
+from linkedin_finder.llm.prompt_compaction import (
+    NO_DESCRIPTION,
+    OMITTED_DESCRIPTION,
+    compact_experience_for_llm,
+)
+
+
+def _position(title: str, bullets: int) -> dict:
+    description = "\n\n".join(
+        f"• {title} bullet {n}: shipped and maintained production systems at scale"
+        for n in range(bullets)
+    )
+    return {
+        "title": title,
+        "company": "Acme",
+        "duration": "Jan 2020 - Present · 4 yrs",
+        "description": description or "No detailed description provided",
+    }
+
+
+def test_missing_description_is_not_reported_as_omitted():
+    text, stats = compact_experience_for_llm(
+        [_position("Security Engineer", 0)], "Security Engineer", token_budget=10_000
+    )
+    assert NO_DESCRIPTION in text
+    assert OMITTED_DESCRIPTION not in text
+    assert stats["tokens_saved"] == 0
+
+
+def test_trims_to_budget_and_marks_dropped_bullets():
+    entries = [_position("Security Engineer", 3), _position("Barista", 12)]
+    budget = 135
+    text, stats = compact_experience_for_llm(
+        entries, "Security Engineer", token_budget=budget
+    )
+    assert count_tokens(text) == stats["compact_tokens"] <= budget
+    # The less relevant position loses its bullets first
+    assert OMITTED_DESCRIPTION in text
+    assert "Security Engineer bullet 0" in text
+    assert stats["positions_dropped"] == 0
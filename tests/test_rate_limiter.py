@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin_finder import rate_limiter
+from linkedin_finder.rate_limiter import AdaptiveRateLimiter
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def test_bucket_refills_at_the_current_rate_up_to_burst(clock):
+    limiter = AdaptiveRateLimiter("test", rate=2.0, burst=2, clock=clock)
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == []
+    limiter.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    # A long idle spell refills no more than burst tokens
+    clock.now += 60
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)] * 2
+    assert limiter.waited_seconds == pytest.approx(1.0)
+
+
+def test_throttle_halves_the_rate_once_per_request_interval(clock):
+    limiter = AdaptiveRateLimiter("test", rate=4.0, min_rate=0.75, clock=clock)
+    limiter.record_throttle()
+    assert limiter.rate == 2.0
+
+    # Throttles from requests already in flight count once
+    limiter.record_throttle()
+    assert limiter.rate == 2.0
+
+    clock.now += 0.5
+    limiter.record_throttle()
+    assert limiter.rate == 1.0
+    clock.now += 1
+    limiter.record_throttle()
+    assert limiter.rate == 0.75
+    assert limiter.throttled == 4
+
+
+def test_fast_replies_raise_the_rate_additively_and_slow_ones_halve_it(clock):
+    limiter = AdaptiveRateLimiter(
+        "test", rate=1.0, increase=0.25, max_rate=2.0, slow_seconds=5.0, clock=clock
+    )
+    for _ in range(3):
+        limiter.record_success(0.1)
+    assert limiter.rate == 1.75
+    for _ in range(3):
+        limiter.record_success(0.1)
+    assert limiter.rate == 2.0
+
+    limiter.record_success(6.0)
+    assert limiter.rate == 1.0
+    assert limiter.slow == 1
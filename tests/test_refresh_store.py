@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from linkedin_finder.refresh_store import RefreshStore
+
+ENTRIES = [
+    {
+        "title": "Security Engineer",
+        "company": "Acme",
+        "duration": "Jan 2020 - Present · 4 yrs 2 mos",
+        "description": "Incident response.",
+    }
+]
+
+
+def _record(analysis: str = "RECOMMENDATION: SHORTLIST\nREASON: Fit.", model="m1"):
+    return {
+        "profile_url": "https://www.linkedin.com/in/someone/",
+        "experience_entries": ENTRIES,
+        "experience_text": "text",
+        "analysis": analysis,
+        "is_shortlisted": True,
+        "model": model,
+    }
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "refresh.sqlite3")
+
+
+def test_unchanged_verdict_keeps_its_original_timestamp(store_path):
+    store = RefreshStore("Security Engineer", "Dublin", store_path, model="m1")
+    store.record([_record()])
+    first = store.get(_record()["profile_url"])["updated_at"]
+    time.sleep(0.01)
+
+    # A carried-forward verdict is written again unchanged
+    store.record([_record()])
+    assert store.get(_record()["profile_url"])["updated_at"] == first
+
+    store.record([_record(analysis="RECOMMENDATION: REJECT\nREASON: No.")])
+    assert store.get(_record()["profile_url"])["updated_at"] > first
+    store.close()
+
+
+def test_verdict_is_only_current_for_the_same_model_and_prompt_mode(store_path):
+    store = RefreshStore(
+        "Security Engineer", "Dublin", store_path, model="m1", prompt_mode="full"
+    )
+    store.record([_record()])
+    stored = store.get(_record()["profile_url"])
+    store.close()
+
+    # Tenure ticking over doesn't count as a change
+    later = [dict(ENTRIES[0], duration="Jan 2020 - Present · 4 yrs 3 mos")]
+    assert store.is_current(stored, later)
+
+    for model, prompt_mode in (("m2", "full"), ("m1", "compact:1500")):
+        other = RefreshStore(
+            "Security Engineer",
+            "Dublin",
+            store_path,
+            model=model,
+            prompt_mode=prompt_mode,
+        )
+        assert not other.is_current(other.get(_record()["profile_url"]), ENTRIES)
+        other.close()
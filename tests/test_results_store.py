@@ -0,0 +1,30 @@
+import pytest
+
+from linkedin_finder.results_store import ResultsSink
+
+
+def test_sinks_must_implement_describe_and_write_batch():
+    class Incomplete(ResultsSink):
+        def describe(self) -> str:
+            return "nowhere"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_on_flush_sees_each_written_batch():
+    written, flushed = [], []
+
+    class ListSink(ResultsSink):
+        def describe(self) -> str:
+            return "a list"
+
+        def _write_batch(self, records):
+            written.extend(records)
+
+    with ListSink(batch_size=2) as sink:
+        sink.on_flush = flushed.append
+        for index in range(3):
+            sink.write({"index": index})
+    assert [record["index"] for record in written] == [0, 1, 2]
+    assert [len(batch) for batch in flushed] == [2, 1]
@@ -0,0 +1,62 @@
+import pytest
+
+from fixtures import experience_page
+from linkedin_finder.scrapers.experience_extractor import (
+    extract_experience_data,
+    parse_html,
+)
+from stand_in_server import browser_unavailable_reason
+
+# The date span comes before the title, so which one is the title depends on
+# the .display-flex.align-items-center wrapper above the entry
+WRAPPED_ENTRY_PAGE = """
+<html><body>
+<h1 class="text-heading-xlarge">Ann Lee</h1>
+<div class="display-flex align-items-center"><ul>
+<li class="pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column">
+  <span aria-hidden="true">Jan 2020 - Present · 4 yrs</span>
+  <div class="mr1 hoverable-link-text"><span aria-hidden="true">Staff Security Engineer</span></div>
+  <span class="t-14 t-normal"><span aria-hidden="true">Acme Technologies · Full-time</span></span>
+</li>
+</ul></div>
+<div data-field="experience-company-name" class="break-words"><ul>
+<li class="pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column">
+  <span aria-hidden="true">Penetration Tester</span>
+  <span class="t-14 t-normal"><span aria-hidden="true">Globex Solutions · Contract</span></span>
+</li>
+</ul></div>
+</body></html>
+"""
+
+
+@pytest.fixture(scope="module")
+def page():
+    reason = browser_unavailable_reason()
+    if reason:
+        pytest.skip(f"Chromium is not available: {reason}")
+
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        yield browser.new_page()
+        browser.close()
+
+
+@pytest.mark.parametrize(
+    "html",
+    [WRAPPED_ENTRY_PAGE, experience_page("Ann Lee", 8, seed=3)["full"]],
+    ids=["title-wrappers", "fixture"],
+)
+def test_scoped_capture_extracts_like_the_full_page(page, html):
+    from linkedin_finder.scrapers.linkedin_scraper import (
+        capture_experience_html,
+        extract_name,
+    )
+
+    page.set_content(html)
+    full = parse_html(page.content())
+    scoped = parse_html(capture_experience_html(page))
+
+    assert extract_name(scoped) == extract_name(full)
+    assert extract_experience_data(scoped) == extract_experience_data(full)